@@ -1,68 +1,281 @@
+import asyncio
 import json
+import random
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, List, Optional
 
-import requests
+import httpx
+from asgiref.sync import sync_to_async
 from saints.current import enhance
-from saints.models import CalendarEvent
+from saints.jobs import register_job, run_job
+from saints.models import SyncState
+from saints.sync import (
+    content_hash,
+    event_row,
+    failed_months,
+    mark_checked,
+    record_failure,
+    record_sync,
+    sync_month_events,
+)
 
+SOURCE = "dailyoffice2019"
+API_URL = "https://api.dailyoffice2019.com/api/v1/calendar/{year}-{month}?calendar={calendar}"
+CALENDARS = [
+    "TEC_BCP1979_LFF2024",
+    "ACNA_BCP2019",
+]
+YEARS = range(2020, 2036)
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+
+CONCURRENCY = 8
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REQUEST_TIMEOUT = 30.0
+
+
+@dataclass
+class MonthResult:
+    """Outcome of fetching one calendar month, handed to the upsert stage as soon as it completes."""
+
+    year: int
+    month: int
+    status: str  # 'changed', 'unchanged' or 'failed'
+    attempts: int = 0
+    days: List[Any] = field(default_factory=list)
+    digest: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: str = ""
 
-def fetch_commemorations(calendar):
-    commemorations = []
-    session = requests.Session()
-
-    for year in range(2020, 2036):
-        for month in range(1, 13):
-            url = f"https://api.dailyoffice2019.com/api/v1/calendar/{year}-{month}?calendar={calendar}"
-            print(url)
-            try:
-                response = session.get(url)
-                response.raise_for_status()
-                days = response.json()
-
-                for day in days:
-                    date = day.get("date")
-                    season = day.get("season", {}).get("name", "")
-                    for i, commem in enumerate(day.get("commemorations", [])):
-                        commemoration = {
-                            "date": date,
-                            "name": commem.get("name", ""),
-                            "rank": commem.get("rank", {}).get("formatted_name", ""),
-                            "color": commem.get("colors", [])[0] if commem.get("colors") else "",
-                            "season": season,
-                            "order": i,
-                        }
-                        commemorations.append(commemoration)
-            except Exception as e:
-                print(f"Failed for {url}: {e}")
 
+def parse_days(days):
+    commemorations = []
+    for day in days:
+        date = day.get("date")
+        season = day.get("season", {}).get("name", "")
+        for i, commem in enumerate(day.get("commemorations", [])):
+            commemoration = {
+                "date": date,
+                "name": commem.get("name", ""),
+                "rank": commem.get("rank", {}).get("formatted_name", ""),
+                "color": commem.get("colors", [])[0] if commem.get("colors") else "",
+                "season": season,
+                "order": i,
+            }
+            commemorations.append(commemoration)
     return commemorations
 
 
-def run():
-    calendars = [
-        "TEC_BCP1979_LFF2024",
-        "ACNA_BCP2019",
-    ]
-    for calendar in calendars:
-        result = fetch_commemorations(calendar)
-        for entry in result:
-            if entry["name"] in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]:
-                continue
-            print(entry)
-            year, month, day = entry["date"].split("-")
-            event = CalendarEvent.objects.get_or_create(
-                year=year, month=month, day=day, english_name=entry["name"], calendar=calendar
-            )[0]
-
-            event.english_rank = entry["rank"]
-            event.color = entry["color"]
-            event.season = entry["season"]
-            event.order = entry["order"]
-
-            enhancement = enhance(entry["name"])
-            event.is_person = enhancement["is_person"]
-            event.saint_name = enhancement["saint_name"]
-            event.saint_category = enhancement["saint_category"]
-            event.saint_categories = json.dumps(enhancement["saint_categories"])
-            event.saint_singular_or_plural = enhancement["saint_singular_or_plural"]
-
-            event.save()
+def build_event_rows(commemorations):
+    rows = []
+    for entry in commemorations:
+        if entry["name"] in WEEKDAY_NAMES:
+            continue
+        enhancement = enhance(entry["name"])
+        rows.append(
+            event_row(
+                date.fromisoformat(entry["date"]),
+                english_name=entry["name"],
+                english_rank=entry["rank"],
+                color=entry["color"],
+                season=entry["season"],
+                order=entry["order"],
+                is_person=enhancement["is_person"],
+                saint_name=enhancement["saint_name"],
+                saint_category=enhancement["saint_category"],
+                saint_categories=json.dumps(enhancement["saint_categories"]),
+                saint_singular_or_plural=enhancement["saint_singular_or_plural"],
+            )
+        )
+    return rows
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Exponential backoff with full jitter, honouring a numeric Retry-After header when sent."""
+    if retry_after:
+        try:
+            return min(BACKOFF_CAP, float(retry_after))
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+async def fetch_month(client: httpx.AsyncClient, calendar: str, year: int, month: int, state, incremental: bool):
+    url = API_URL.format(year=year, month=month, calendar=calendar)
+    headers = {}
+    if incremental and state and state.status == SyncState.STATUS_OK:
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+    error = ""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        retry_after = None
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError as e:
+            error = f"{type(e).__name__}: {e}"
+        else:
+            if response.status_code == 304 and headers:
+                return MonthResult(year, month, "unchanged", attempts=attempt, digest=state.content_hash)
+            if response.status_code not in RETRY_STATUSES:
+                if response.is_error:
+                    return MonthResult(year, month, "failed", attempts=attempt, error=f"HTTP {response.status_code}")
+                digest = content_hash(response.content)
+                if incremental and state and state.status == SyncState.STATUS_OK and state.content_hash == digest:
+                    return MonthResult(year, month, "unchanged", attempts=attempt, digest=digest)
+                try:
+                    days = response.json()
+                except ValueError as e:
+                    return MonthResult(year, month, "failed", attempts=attempt, error=f"Invalid JSON: {e}")
+                return MonthResult(
+                    year,
+                    month,
+                    "changed",
+                    attempts=attempt,
+                    days=days,
+                    digest=digest,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+            error = f"HTTP {response.status_code}"
+            retry_after = response.headers.get("Retry-After")
+
+        if attempt < MAX_ATTEMPTS:
+            delay = backoff_delay(attempt, retry_after)
+            print(f"Retrying {url} in {delay:.1f}s after {error} (attempt {attempt}/{MAX_ATTEMPTS})")
+            await asyncio.sleep(delay)
+    return MonthResult(year, month, "failed", attempts=MAX_ATTEMPTS, error=error)
+
+
+async def stream_months(calendar: str, months, states, incremental: bool = True, concurrency: int = CONCURRENCY):
+    """Fetch ``months`` with at most ``concurrency`` requests in flight, yielding each result as it completes.
+
+    The output queue is bounded so fetching pauses while the upsert stage catches up,
+    rather than buffering the whole range in memory.
+    """
+    pending: asyncio.Queue = asyncio.Queue()
+    for year_month in months:
+        pending.put_nowait(year_month)
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+
+        async def worker():
+            while True:
+                try:
+                    year, month = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    result = await fetch_month(client, calendar, year, month, states.get((year, month)), incremental)
+                except Exception as e:
+                    result = MonthResult(year, month, "failed", attempts=1, error=f"{type(e).__name__}: {e}")
+                await results.put(result)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+        try:
+            for _ in range(len(months)):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def apply_month(calendar: str, result: MonthResult):
+    """Write one fetched month to the database and record it in the sync ledger."""
+    if result.status == "unchanged":
+        mark_checked(SOURCE, calendar, result.year, result.month, attempts=result.attempts)
+        return None
+    if result.status == "failed":
+        record_failure(SOURCE, calendar, result.year, result.month, result.error, attempts=result.attempts)
+        return None
+    rows = build_event_rows(parse_days(result.days))
+    counts = sync_month_events(calendar, result.year, result.month, rows)
+    record_sync(
+        SOURCE,
+        calendar,
+        result.year,
+        result.month,
+        result.digest,
+        etag=result.etag,
+        last_modified=result.last_modified,
+        event_count=len(rows),
+        attempts=result.attempts,
+    )
+    return counts
+
+
+async def _sync(calendar: str, months, states, incremental: bool, concurrency: int):
+    summary = {"changed": 0, "unchanged": 0, "failed": 0}
+    async for result in stream_months(calendar, months, states, incremental=incremental, concurrency=concurrency):
+        label = f"{calendar} {result.year}-{result.month:02d}"
+        try:
+            counts = await sync_to_async(apply_month, thread_sensitive=True)(calendar, result)
+        except Exception as e:
+            result.status = "failed"
+            result.error = f"Import failed: {type(e).__name__}: {e}"
+            await sync_to_async(record_failure, thread_sensitive=True)(
+                SOURCE, calendar, result.year, result.month, result.error, result.attempts
+            )
+            counts = None
+        summary[result.status] += 1
+        if result.status == "failed":
+            print(f"Failed {label} after {result.attempts} attempts: {result.error}")
+        elif counts is not None:
+            print(f"Synced {label}: {counts[0]} created, {counts[1]} updated, {counts[2]} deleted")
+    return summary
+
+
+def sync_calendar(calendar, years=YEARS, incremental=True, concurrency=CONCURRENCY, months=None):
+    """Fetch a calendar from the dailyoffice2019 API concurrently and upsert each month as it arrives.
+
+    ``months`` limits the run to specific ``(year, month)`` pairs, which is how failed
+    months are retried on their own.
+    """
+    if months is None:
+        months = [(year, month) for year in years for month in range(1, 13)]
+    states = {(s.year, s.month): s for s in SyncState.objects.filter(source=SOURCE, calendar=calendar)}
+    summary = asyncio.run(_sync(calendar, list(months), states, incremental, concurrency))
+    print(f"{calendar}: {summary['changed']} changed, {summary['unchanged']} unchanged, {summary['failed']} failed")
+    return summary
+
+
+def retry_failed(calendar, concurrency=CONCURRENCY):
+    months = failed_months(SOURCE, calendar)
+    if not months:
+        print(f"{calendar}: no failed months to retry")
+        return {"changed": 0, "unchanged": 0, "failed": 0}
+    return sync_calendar(calendar, incremental=True, concurrency=concurrency, months=months)
+
+
+def plan_job(params):
+    for calendar in params.get("calendars", CALENDARS):
+        for year in params.get("years", list(YEARS)):
+            yield f"{calendar}:{year}", {"calendar": calendar, "year": year}
+
+
+def handle_unit(payload, params):
+    summary = sync_calendar(
+        payload["calendar"],
+        years=[payload["year"]],
+        incremental=params.get("incremental", True),
+        concurrency=params.get("concurrency", CONCURRENCY),
+    )
+    if summary["failed"]:
+        # The months are in the sync ledger too; failing the unit lets the job retry them
+        raise RuntimeError(f"{summary['failed']} months of {payload['calendar']} {payload['year']} failed")
+    return summary
+
+
+register_job("acna", plan_job, handle_unit, "dailyoffice2019 ACNA/TEC calendars, one unit per calendar year")
+
+
+def run(incremental=False, concurrency=CONCURRENCY):
+    return run_job("acna", {"incremental": incremental, "concurrency": concurrency})
@@ -0,0 +1,376 @@
+"""LLM providers for the podcast generator: one pooled client per configuration, retries and call records.
+
+``get_provider`` returns a shared ``Provider`` per (provider, model, base URL,
+key variable), built on first use.  The OpenAI and Anthropic clients are
+thread-safe and keep their HTTP connections alive, so every call made while
+generating both shows reuses the same connection pool instead of opening a new
+one per request.
+
+Each provider offers ``text`` (a plain or JSON-object completion) and
+``structured`` (a completion validated against a pydantic model).  OpenAI uses
+native structured outputs; Anthropic and Grok get a JSON shape built from the
+model by ``schema_hint`` and their reply is validated.  Calls wait for quota in
+``saints.ratelimit``, time out after ``AI_TIMEOUT_SECONDS`` and are retried
+with backoff up to ``AI_MAX_ATTEMPTS`` times.  Every call appends an
+``AICall`` record (latency, tokens, request and response sizes) to the ``log``
+list it is given.  ``stream`` yields a structured reply's JSON text as it is
+written, for callers that act on it before it is complete.  The ``offline``
+provider answers from ``saints.offline`` for benchmarks and local runs.
+"""
+
+import json
+import os
+import threading
+import time
+import typing
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from saints import ratelimit, settings
+
+ANTHROPIC_MAX_TOKENS = 8000
+
+
+@dataclass
+class AICall:
+    provider: str
+    model: str
+    label: str
+    latency: float = 0.0
+    queued: float = 0.0
+    attempts: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    # Seconds until the first text of a streamed reply
+    first_output: float = 0.0
+    ok: bool = False
+
+
+def schema_hint(annotation: Any) -> Any:
+    """A compact example of the JSON ``annotation`` describes, e.g. ``{"queries": ["string"]}``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {name: schema_hint(field.annotation) for name, field in annotation.model_fields.items()}
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if origin in (list, List):
+        return [schema_hint(args[0])] if args else []
+    if origin in (dict, Dict):
+        return {}
+    if origin is typing.Union and len(args) == 1:
+        return schema_hint(args[0])
+    return {int: "integer", float: "number", bool: "boolean"}.get(annotation, "string")
+
+
+def with_schema_hint(messages: List[Dict[str, Any]], response_model: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """``messages`` with the JSON shape of ``response_model`` appended to the system message (added if missing)."""
+    instruction = "IMPORTANT: Return your response as valid JSON that matches this exact structure: " + json.dumps(
+        schema_hint(response_model)
+    )
+    if messages and messages[0]["role"] == "system":
+        return [dict(messages[0], content=f"{messages[0]['content']}\n\n{instruction}")] + messages[1:]
+    return [{"role": "system", "content": instruction}] + messages
+
+
+class Provider:
+    name = ""
+
+    def __init__(self, model: str, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        self.model = model
+        self.api_key = api_key
+        self.base_url = base_url
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                self._client = self.create_client()
+            return self._client
+
+    def create_client(self):
+        raise NotImplementedError
+
+    def _text(self, messages: List[Dict[str, Any]], json_object: bool, max_tokens: Optional[int]) -> Tuple[str, Any]:
+        """One request; returns the reply text and the usage object."""
+        raise NotImplementedError
+
+    def _structured(self, messages: List[Dict[str, Any]], response_model: Type[BaseModel]) -> Tuple[BaseModel, Any]:
+        text, usage = self._text(with_schema_hint(messages, response_model), True, None)
+        return response_model.model_validate(json.loads(text)), usage
+
+    def _stream(
+        self, messages: List[Dict[str, Any]], response_model: Type[BaseModel], record: AICall
+    ) -> Iterator[str]:
+        """Text deltas of one streamed request; sets the record's token counts when it ends."""
+        raise NotImplementedError
+
+    @staticmethod
+    def tokens(usage: Any) -> Tuple[int, int]:
+        return 0, 0
+
+    def call(self, label: str, messages: List[Dict[str, Any]], request, log: Optional[List[AICall]] = None):
+        """Run ``request()`` with rate limiting and retries, recording the call in ``log``."""
+        record = AICall(self.name, self.model, label, request_bytes=len(json.dumps(messages).encode()))
+        started = time.monotonic()
+        try:
+            for attempt in range(1, settings.AI_MAX_ATTEMPTS + 1):
+                record.attempts = attempt
+                record.queued += ratelimit.acquire(self.name, self.model)
+                try:
+                    result, usage = request()
+                    break
+                except Exception as e:
+                    if attempt == settings.AI_MAX_ATTEMPTS:
+                        raise
+                    delay = 2.0 * 2 ** (attempt - 1)
+                    print(f"[GEN] {self.name} {label} failed (attempt {attempt}): {e}; retrying in {delay:.0f}s")
+                    backoff_started = time.monotonic()
+                    time.sleep(delay)
+                    record.queued += time.monotonic() - backoff_started
+            record.ok = True
+            record.input_tokens, record.output_tokens = self.tokens(usage)
+            reply = result if isinstance(result, str) else result.model_dump_json()
+            record.response_bytes = len(reply.encode())
+            return result
+        finally:
+            record.latency = time.monotonic() - started - record.queued
+            if log is not None:
+                log.append(record)
+
+    def text(
+        self,
+        messages: List[Dict[str, Any]],
+        label: str = "text",
+        json_object: bool = False,
+        max_tokens: int = 1000,
+        log: Optional[List[AICall]] = None,
+    ) -> str:
+        """The reply to ``messages``; ``max_tokens`` applies where the API requires a limit (Anthropic)."""
+        return self.call(label, messages, lambda: self._text(messages, json_object, max_tokens), log)
+
+    def structured(
+        self,
+        messages: List[Dict[str, Any]],
+        response_model: Type[BaseModel],
+        label: Optional[str] = None,
+        log: Optional[List[AICall]] = None,
+    ) -> BaseModel:
+        """The reply to ``messages`` parsed as ``response_model``."""
+        label = label or response_model.__name__
+        return self.call(label, messages, lambda: self._structured(messages, response_model), log)
+
+    def stream(
+        self,
+        messages: List[Dict[str, Any]],
+        response_model: Type[BaseModel],
+        label: Optional[str] = None,
+        log: Optional[List[AICall]] = None,
+    ) -> Iterator[str]:
+        """The reply to ``messages``, JSON for ``response_model``, as text deltas while it is being written.
+
+        Streams are not retried: by the time one fails, its output may already have been acted on.
+        """
+        record = AICall(
+            self.name,
+            self.model,
+            label or response_model.__name__,
+            attempts=1,
+            request_bytes=len(json.dumps(messages).encode()),
+        )
+        started = time.monotonic()
+        try:
+            record.queued = ratelimit.acquire(self.name, self.model)
+            for delta in self._stream(messages, response_model, record):
+                if not record.response_bytes:
+                    record.first_output = time.monotonic() - started - record.queued
+                record.response_bytes += len(delta.encode())
+                yield delta
+            record.ok = True
+        finally:
+            record.latency = time.monotonic() - started - record.queued
+            if log is not None:
+                log.append(record)
+
+
+class OpenAIProvider(Provider):
+    name = "openai"
+
+    def create_client(self):
+        from openai import OpenAI
+
+        return OpenAI(api_key=self.api_key, base_url=self.base_url, timeout=settings.AI_TIMEOUT_SECONDS, max_retries=0)
+
+    def _text(self, messages, json_object, max_tokens):
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            response_format={"type": "json_object" if json_object else "text"},
+        )
+        return response.choices[0].message.content.strip(), response.usage
+
+    def _structured(self, messages, response_model):
+        response = self.client.beta.chat.completions.parse(
+            model=self.model, messages=messages, response_format=response_model
+        )
+        return response.choices[0].message.parsed, response.usage
+
+    def _stream(self, messages, response_model, record):
+        with self.client.beta.chat.completions.stream(
+            model=self.model,
+            messages=messages,
+            response_format=response_model,
+            stream_options={"include_usage": True},
+        ) as stream:
+            for event in stream:
+                if event.type == "content.delta":
+                    yield event.delta
+            record.input_tokens, record.output_tokens = self.tokens(stream.get_final_completion().usage)
+
+    @staticmethod
+    def tokens(usage):
+        if not usage:
+            return 0, 0
+        return usage.prompt_tokens or 0, usage.completion_tokens or 0
+
+
+class GrokProvider(OpenAIProvider):
+    """xAI's OpenAI-compatible API, using JSON mode with a schema hint for structured replies."""
+
+    name = "grok"
+
+    def _structured(self, messages, response_model):
+        return Provider._structured(self, messages, response_model)
+
+    def _stream(self, messages, response_model, record):
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=with_schema_hint(messages, response_model),
+            response_format={"type": "json_object"},
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if chunk.usage:
+                record.input_tokens, record.output_tokens = self.tokens(chunk.usage)
+
+
+class AnthropicProvider(Provider):
+    name = "anthropic"
+
+    def create_client(self):
+        from anthropic import Anthropic
+
+        return Anthropic(api_key=self.api_key, timeout=settings.AI_TIMEOUT_SECONDS, max_retries=0)
+
+    @staticmethod
+    def request(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Messages API arguments for chat-style ``messages``: system messages go in the ``system`` parameter."""
+        request = {"messages": [m for m in messages if m["role"] != "system"]}
+        system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+        if system:
+            request["system"] = system
+        return request
+
+    def _text(self, messages, json_object, max_tokens):
+        response = self.client.messages.create(
+            model=self.model, max_tokens=max_tokens or ANTHROPIC_MAX_TOKENS, **self.request(messages)
+        )
+        return response.content[0].text.strip(), response.usage
+
+    def _stream(self, messages, response_model, record):
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=ANTHROPIC_MAX_TOKENS,
+            **self.request(with_schema_hint(messages, response_model)),
+        ) as stream:
+            yield from stream.text_stream
+            record.input_tokens, record.output_tokens = self.tokens(stream.get_final_message().usage)
+
+    @staticmethod
+    def tokens(usage):
+        if not usage:
+            return 0, 0
+        return usage.input_tokens or 0, usage.output_tokens or 0
+
+
+class OfflineProvider(Provider):
+    """Deterministic, schema-valid replies from ``saints.offline.FakeLLM``; no key or network needed."""
+
+    name = "offline"
+
+    def create_client(self):
+        from saints.offline import FakeLLM
+
+        return FakeLLM()
+
+    def _text(self, messages, json_object, max_tokens):
+        return self.client.complete(messages, json_object=json_object, max_tokens=max_tokens)
+
+    def _structured(self, messages, response_model):
+        text, usage = self.client.complete(messages, response_model)
+        return response_model.model_validate_json(text), usage
+
+    def _stream(self, messages, response_model, record):
+        text = []
+        for delta in self.client.stream(messages, response_model):
+            text.append(delta)
+            yield delta
+        record.input_tokens, record.output_tokens = self.client.usage(messages, "".join(text))
+
+    @staticmethod
+    def tokens(usage):
+        return usage
+
+
+PROVIDERS = {
+    "openai": OpenAIProvider,
+    "grok": GrokProvider,
+    "anthropic": AnthropicProvider,
+    "offline": OfflineProvider,
+}
+# Key variable used when the configuration names none (OpenAI's client reads OPENAI_API_KEY itself)
+DEFAULT_KEY_ENV = {"grok": "XAI_API_KEY", "anthropic": "ANTHROPIC_API_KEY"}
+DEFAULT_BASE_URL = {"grok": "https://api.x.ai/v1"}
+
+_providers: Dict[Tuple[str, str, Optional[str], Optional[str]], Provider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_provider(
+    provider: str, model: str, base_url: Optional[str] = None, api_key_env: Optional[str] = None
+) -> Provider:
+    """The shared provider for this configuration, created on first use."""
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unsupported AI provider: {provider}")
+    key = (provider, model, base_url, api_key_env)
+    with _providers_lock:
+        if key not in _providers:
+            key_env = api_key_env or DEFAULT_KEY_ENV.get(provider)
+            api_key = os.getenv(key_env) if key_env else None
+            if key_env and not api_key:
+                raise ValueError(f"{key_env} environment variable is required for {provider}")
+            _providers[key] = PROVIDERS[provider](
+                model, api_key=api_key, base_url=base_url or DEFAULT_BASE_URL.get(provider)
+            )
+        return _providers[key]
+
+
+def print_call_summary(calls: List[AICall]) -> None:
+    for call in calls:
+        print(
+            f"[GEN]   {call.label:<24} {call.latency:6.1f}s {call.input_tokens:>7} in {call.output_tokens:>6} out "
+            f"{call.request_bytes / 1024:7.1f} KiB sent {call.response_bytes / 1024:6.1f} KiB received"
+            + ("" if call.ok else " FAILED")
+            + (f" ({call.attempts} attempts)" if call.attempts > 1 else "")
+        )
+    print(
+        f"[GEN] {len(calls)} LLM calls: {sum(call.latency for call in calls):.1f}s, "
+        f"{sum(call.input_tokens for call in calls)} input + {sum(call.output_tokens for call in calls)} output tokens"
+    )
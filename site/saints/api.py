@@ -1,11 +1,13 @@
 """REST API endpoints for the saints project."""
 
-from datetime import timedelta
-
+from django.utils.dateparse import parse_date
 from rest_framework import serializers, viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from saints import liturgical_index, search
 from saints.models import (
     BibleVerseModel,
     Biography,
@@ -23,7 +25,6 @@ from saints.models import (
     TraditionModel,
     WritingModel,
 )
-from saints.views import first_sunday_of_advent
 
 # Common select_related and prefetch_related lookups for Biography objects
 BIOGRAPHY_SELECT = [
@@ -226,6 +227,40 @@ class CalendarEventSerializer(serializers.ModelSerializer):
         ]
 
 
+class BiographySearchResultSerializer(serializers.ModelSerializer):
+    rank = serializers.FloatField()
+    headline = serializers.CharField()
+
+    class Meta:
+        model = Biography
+        fields = ["uuid", "name", "religion", "calendar", "rank", "headline"]
+
+
+class CalendarEventSearchResultSerializer(serializers.ModelSerializer):
+    rank = serializers.FloatField()
+    headline = serializers.CharField()
+
+    class Meta:
+        model = CalendarEvent
+        fields = [
+            "id",
+            "date",
+            "english_name",
+            "latin_name",
+            "english_rank",
+            "calendar",
+            "biography",
+            "rank",
+            "headline",
+        ]
+
+
+class SearchPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
 class BiographyViewSet(viewsets.ReadOnlyModelViewSet):
     """Retrieve biographies with all related data."""
 
@@ -246,8 +281,7 @@ class LiturgicalYearView(APIView):
     }
 
     def get(self, request, year: int, calendar: str) -> Response:
-        start = first_sunday_of_advent(year)
-        end = first_sunday_of_advent(year + 1) - timedelta(days=1)
+        start, end = liturgical_index.liturgical_year_bounds(year)
         filters = self.calendar_filters.get(calendar, self.calendar_filters["current"])
         events = (
             CALENDAR_EVENT_QUERYSET
@@ -272,7 +306,11 @@ class DayView(APIView):
                 .order_by("order", "english_name")
             )
             events_by_calendar[key] = CalendarEventSerializer(day_events, many=True).data
-        return Response({"date": date, "calendars": events_by_calendar})
+        try:
+            liturgical_day = liturgical_index.lookup(parse_date(date)).as_dict()
+        except (TypeError, ValueError):
+            liturgical_day = None
+        return Response({"date": date, "liturgical_day": liturgical_day, "calendars": events_by_calendar})
 
 
 class CalendarListView(APIView):
@@ -282,3 +320,36 @@ class CalendarListView(APIView):
         calendars = list(LiturgicalYearView.calendar_filters.keys())
         return Response({"calendars": calendars})
 
+
+class SearchView(APIView):
+    """Full-text search of biographies (``type=biographies``, the default) or calendar events (``type=events``).
+
+    ``q`` accepts web-search syntax: quoted phrases, ``or`` and ``-excluded`` words.
+    Biographies can be narrowed with ``religion``, events with ``calendar`` and ``year``.
+    """
+
+    def get(self, request):
+        params = request.query_params
+        text = params.get("q", "").strip()
+        if not text:
+            raise ValidationError({"q": "A search query is required."})
+
+        kind = params.get("type", "biographies")
+        if kind == "biographies":
+            results = search.search_biographies(text, religion=params.get("religion"))
+            serializer_class = BiographySearchResultSerializer
+        elif kind == "events":
+            year = params.get("year")
+            if year and not year.isdigit():
+                raise ValidationError({"year": "Year must be a number."})
+            results = search.search_calendar_events(text, calendar=params.get("calendar"), year=year)
+            serializer_class = CalendarEventSearchResultSerializer
+        else:
+            raise ValidationError({"type": "Expected 'biographies' or 'events'."})
+
+        paginator = SearchPagination()
+        page = paginator.paginate_queryset(results, request, view=self)
+        response = paginator.get_paginated_response(serializer_class(page, many=True).data)
+        response.data["query"] = text
+        response.data["type"] = kind
+        return response
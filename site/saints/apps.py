@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class SaintsConfig(AppConfig):
+    name = "saints"
+
+    def ready(self):
+        from saints import search
+
+        search.connect_signals()
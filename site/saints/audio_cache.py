@@ -0,0 +1,116 @@
+"""A local content-addressed file cache with size-based LRU eviction.
+
+Entries are files named by a hex digest, spread over two-character
+subdirectories.  Reading an entry touches its modification time, and once
+the cache grows past ``max_bytes`` the least recently used entries are
+deleted.  Writes go to a temporary file that is renamed into place, so several
+processes can share a cache directory without ever seeing partial files.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Optional
+
+
+def digest(*parts: Any) -> str:
+    """A stable sha256 hex digest of JSON-serialisable ``parts``."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+class AudioCache:
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".mp3"):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + self.suffix)
+
+    def _touch(self, key: str) -> Optional[str]:
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def _count(self, hit: bool):
+        # Called from the batch pipeline's worker threads
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """The cached file for ``key`` (marked as just used), or None."""
+        path = self._touch(key)
+        self._count(path is not None)
+        return path
+
+    def fetch(self, key: str, destination: str) -> bool:
+        """Copy the entry for ``key`` to ``destination``; False on a miss."""
+        path = self._touch(key)
+        if path is not None:
+            try:
+                shutil.copyfile(path, destination)
+            except FileNotFoundError:
+                # Evicted by another process between the lookup and the copy
+                path = None
+        self._count(path is not None)
+        return path is not None
+
+    def put(self, key: str, source: str) -> str:
+        """Store a copy of ``source`` under ``key`` and evict old entries if the cache is over its size."""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+        return path
+
+    def entries(self):
+        """``(mtime, size, path)`` for every entry."""
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(self.suffix):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits in ``max_bytes``; returns the bytes freed."""
+        with self.lock:
+            entries = sorted(self.entries())
+            excess = sum(size for _, size, _ in entries) - self.max_bytes
+            freed = 0
+            for _, size, path in entries:
+                if freed >= excess:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                freed += size
+            return freed
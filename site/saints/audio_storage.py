@@ -0,0 +1,53 @@
+"""Saving episode audio to storage as a stream, measuring it on the way.
+
+``save_stream`` hands ``default_storage`` a reader that hashes and counts the
+bytes as the storage copies them in chunks, so the mastered MP3 is never held
+in memory and its size and SHA-256 need no second read.  When the storage
+writes local files (``can_pipe``), mastering pipes ffmpeg's output straight
+into it; other storages are given the finished file from the run's temporary
+workspace, still read in chunks.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import BinaryIO, Optional
+
+from django.core.files.storage import FileSystemStorage, default_storage
+
+
+@dataclass
+class StoredAudio:
+    # Storage path, e.g. "podcasts/saints_and_seasons_2025-11-01.mp3"
+    path: str
+    size: int
+    # SHA-256 of the file, hex
+    checksum: str
+    # Seconds
+    duration: Optional[float] = None
+
+
+class MeasuringReader:
+    """A read-only stream that counts and hashes whatever is read through it."""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.size += len(data)
+        self.sha256.update(data)
+        return data
+
+
+def can_pipe() -> bool:
+    """Whether the storage can write from a stream that cannot seek (local files can)."""
+    return isinstance(default_storage, FileSystemStorage)
+
+
+def save_stream(path: str, stream: BinaryIO) -> StoredAudio:
+    """Copy ``stream`` to ``path`` in storage; the storage may pick a different name if ``path`` is taken."""
+    reader = MeasuringReader(stream)
+    saved = default_storage.save(path, reader)
+    return StoredAudio(saved, reader.size, reader.sha256.hexdigest())
@@ -0,0 +1,222 @@
+"""Diff-based storage of generated biographies.
+
+Each generated section is reduced to plain values (``section_content``): the
+section's own row, its child rows (bullet points, traditions, foods, writings,
+images) and its citations.  ``save_biography`` loads the stored sections in the
+same shape and rewrites only those that differ.  Each model's rows are written
+with one ``bulk_create`` and all citations are resolved in a single lookup.
+Everything happens in one transaction, so readers see either the previous
+biography or the new one, never a half-replaced one.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
+
+from django.db import models, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from saints.models import (
+    BibleVerseModel,
+    Biography,
+    BiographySectionState,
+    BulletPoint,
+    BulletPointsModel,
+    FeastDescriptionModel,
+    FoodModel,
+    HagiographyCitationModel,
+    HagiographyModel,
+    ImageModel,
+    LegendModel,
+    QuoteModel,
+    ShortDescriptionsModel,
+    TraditionModel,
+    WritingModel,
+)
+
+CITATION_FIELDS = ("citation", "url", "date_accessed", "title")
+WRITING_FIELDS = ("writing", "date", "title", "url", "author")
+# Generated writing slots, stored as (type, order) so each one keeps its place
+WRITING_SLOTS = [
+    ("writing_by_saint", "by", 0),
+    ("writing_about_saint", "about", 1),
+    ("writing_about_feast", "about", 2),
+]
+
+
+@dataclass(frozen=True)
+class Section:
+    model: Type[models.Model]
+    fields: Tuple[str, ...] = ()
+    # Sections stored as several rows on the biography, read from this attribute of the result
+    items_from: Optional[str] = None
+    cited: bool = False
+
+
+SECTIONS: Dict[str, Section] = {
+    "short_descriptions": Section(ShortDescriptionsModel, ("one_sentence_description", "one_paragraph_description")),
+    "quotes": Section(QuoteModel, ("quote", "person", "date")),
+    "verse": Section(
+        BibleVerseModel,
+        ("citation", "text", "bible_version_abbreviation", "bible_version", "bible_version_year"),
+    ),
+    "ai_hagiography": Section(HagiographyModel, ("hagiography",), cited=True),
+    "ai_feast_description": Section(FeastDescriptionModel, ("feast_description",), cited=True),
+    "ai_legend": Section(LegendModel, ("legend", "title"), cited=True),
+    "ai_bullet_points": Section(BulletPointsModel, cited=True),
+    "ai_traditions": Section(
+        TraditionModel, ("tradition", "country_of_origin", "reason_associated_with_saint"), items_from="traditions"
+    ),
+    "ai_foods": Section(
+        FoodModel,
+        ("food_name", "description", "country_of_origin", "reason_associated_with_saint"),
+        items_from="foods",
+    ),
+    "ai_writings": Section(WritingModel, WRITING_FIELDS + ("type",), items_from="writings"),
+    "images": Section(ImageModel, ("url", "title", "author", "date"), items_from="images"),
+}
+
+
+@dataclass
+class Content:
+    """One section as plain values; equal contents mean there is nothing to write."""
+
+    row: Optional[Dict[str, Any]] = None
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    citations: FrozenSet[Tuple] = frozenset()
+
+
+def _values(obj, fields) -> Dict[str, Any]:
+    return {name: getattr(obj, name, None) for name in fields}
+
+
+def section_content(name: str, result) -> Content:
+    """Reduce a generated (pydantic) section to the values that would be stored for it."""
+    section = SECTIONS[name]
+    citations = frozenset()
+    if section.cited:
+        citations = frozenset(
+            tuple(_values(c, CITATION_FIELDS).values()) for c in getattr(result, "citations", None) or []
+        )
+
+    if name == "ai_writings":
+        items = []
+        for attr, kind, order in WRITING_SLOTS:
+            writing = getattr(result, attr, None)
+            if writing:
+                items.append(dict(_values(writing, WRITING_FIELDS), type=kind, order=order))
+        return Content(items=items)
+    if section.items_from:
+        items = getattr(result, section.items_from, None) or []
+        return Content(items=[dict(_values(item, section.fields), order=i) for i, item in enumerate(items)])
+    items = []
+    if section.model is BulletPointsModel:
+        items = [{"text": text, "order": i} for i, text in enumerate(getattr(result, "bullet_points", None) or [])]
+    return Content(row=_values(result, section.fields), items=items, citations=citations)
+
+
+def stored_content(biography: Biography, name: str) -> Content:
+    section = SECTIONS[name]
+    if section.items_from:
+        rows = section.model.objects.filter(biography=biography).order_by("order", "pk")
+        return Content(items=list(rows.values(*section.fields, "order")))
+    obj = section.model.objects.filter(biography=biography).first()
+    if obj is None:
+        return Content()
+    items = []
+    if section.model is BulletPointsModel:
+        items = list(obj.bullet_points.order_by("order", "pk").values("text", "order"))
+    citations = frozenset(obj.citations.values_list(*CITATION_FIELDS)) if section.cited else frozenset()
+    return Content(row=_values(obj, section.fields), items=items, citations=citations)
+
+
+def resolve_citations(keys: Iterable[Tuple]) -> Dict[Tuple, int]:
+    """Primary keys for citation value tuples, creating the missing citations in one ``bulk_create``."""
+    keys = set(keys)
+    if not keys:
+        return {}
+    ids: Dict[Tuple, int] = {}
+    existing = HagiographyCitationModel.objects.filter(citation__in={key[0] for key in keys}).order_by("pk")
+    for pk, *values in existing.values_list("pk", *CITATION_FIELDS):
+        ids.setdefault(tuple(values), pk)
+    missing = [key for key in keys if key not in ids]
+    created = HagiographyCitationModel.objects.bulk_create(
+        [HagiographyCitationModel(**dict(zip(CITATION_FIELDS, key))) for key in missing]
+    )
+    for key, citation in zip(missing, created):
+        ids[key] = citation.pk
+    return ids
+
+
+def replace_sections(biography: Biography, contents: Dict[str, Content]) -> None:
+    """Delete the stored rows of the given sections and bulk-create their new contents."""
+    for name in contents:
+        SECTIONS[name].model.objects.filter(biography=biography).delete()
+
+    citation_ids = resolve_citations(key for content in contents.values() for key in content.citations)
+    for name, content in contents.items():
+        section = SECTIONS[name]
+        if section.items_from:
+            section.model.objects.bulk_create([section.model(biography=biography, **item) for item in content.items])
+            continue
+        obj = section.model.objects.create(biography=biography, **content.row)
+        if section.model is BulletPointsModel:
+            BulletPoint.objects.bulk_create([BulletPoint(bullet_points_model=obj, **item) for item in content.items])
+        if content.citations:
+            through = section.model.citations.through
+            from_field = f"{section.model._meta.model_name}_id"
+            to_field = f"{HagiographyCitationModel._meta.model_name}_id"
+            through.objects.bulk_create(
+                [through(**{from_field: obj.pk, to_field: citation_ids[key]}) for key in content.citations]
+            )
+
+
+def save_biography(name: str, religion: str, calendar: str, results: Iterable[Tuple[str, Any]]):
+    """Store generated sections for a biography, writing only the sections whose content changed.
+
+    ``results`` pairs section names (keys of ``SECTIONS``) with generated results.
+    Sections missing from ``results``, e.g. because generation failed, keep their
+    stored content.  Returns the biography and the names of the sections written.
+    """
+    contents = {section: section_content(section, result) for section, result in results}
+    with transaction.atomic():
+        biography = Biography.objects.select_for_update().filter(name=name, religion=religion).first()
+        if biography is None:
+            biography = Biography.objects.create(name=name, religion=religion, calendar=calendar)
+            changed = list(contents)
+        else:
+            if biography.calendar != calendar:
+                biography.calendar = calendar
+                biography.save(update_fields=["calendar", "updated"])
+            changed = [
+                section for section, content in contents.items() if content != stored_content(biography, section)
+            ]
+        replace_sections(biography, {section: contents[section] for section in changed})
+    return biography, changed
+
+
+def section_presence() -> Dict[str, Exists]:
+    """An ``Exists`` per section for annotating ``Biography`` querysets with whether the section is stored."""
+    return {name: Exists(section.model.objects.filter(biography=OuterRef("pk"))) for name, section in SECTIONS.items()}
+
+
+def record_section_states(biography: Biography, states: Iterable[Dict[str, Any]]) -> None:
+    """Upsert the generation metadata of the given sections in one statement.
+
+    Each state is a dict of ``BiographySectionState`` fields including ``section``.
+    """
+    now = timezone.now()
+    BiographySectionState.objects.bulk_create(
+        [BiographySectionState(biography=biography, generated_at=now, **state) for state in states],
+        update_conflicts=True,
+        unique_fields=["biography", "section"],
+        update_fields=[
+            "status",
+            "model_name",
+            "prompt_hash",
+            "generated_at",
+            "input_tokens",
+            "output_tokens",
+            "updated",
+        ],
+    )
@@ -1,29 +1,24 @@
+import hashlib
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from google import genai
 from google.genai import types
 import json
 
-from google.generativeai import GenerationConfig
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
 from pydantic import BaseModel, Field
 
-from saints import settings
-from saints.models import (
-    CalendarEvent,
-    Biography,
-    ShortDescriptionsModel,
-    QuoteModel,
-    BibleVerseModel,
-    HagiographyCitationModel,
-    HagiographyModel,
-    LegendModel,
-    BulletPointsModel,
-    BulletPoint,
-    TraditionModel,
-    FoodModel,
-    WritingModel,
-    ImageModel,
-)
-from typing import List
+from saints import ratelimit, settings
+from saints.jobs import register_job, run_job
+from saints.linking import event_calendars, link_biography
+from saints.names import name_key, normalize_calendar_events
+from saints.biography_store import record_section_states, save_biography, section_presence
+from saints.models import CalendarEvent, Biography, BiographySectionState, ShortDescriptionsModel
+from typing import Dict, List, Optional
 from google.genai.types import GenerationConfig, Tool, GoogleSearch
 import re
 
@@ -38,7 +33,8 @@ def clean_json_string(response_text: str) -> str:
         return match.group(1).strip()
     return response_text.strip()
 
-def collect_bios():
+def bio_targets():
+    """Yield ``(names, religion, calendar)`` for each calendar whose commemorations need biographies."""
     traditional = (CalendarEvent.objects.filter(
         calendar__in=["Divino Afflatu - 1954", "Rubrics 1960 - 1960", ]).exclude(
         english_rank__in=['Tempora', 'Scripture', 'Major Feria', 'Feria',
@@ -70,39 +66,21 @@ def collect_bios():
         'english_name').values_list(
         "english_name",
         flat=True).distinct())
-    print(len(traditional))
-
-    for traditional_item in traditional:
-        try:
-            generate_bio(traditional_item, "traditional", "traditional")
-        except Exception as e:
-            print(e)
+    yield traditional, "traditional", "traditional"
 
     catholic = (CalendarEvent.objects.filter(
         calendar__in=["catholic", ]).exclude(
         english_rank__in=["Feria", "Sunday"]).values_list(
         "english_name",
         flat=True).distinct())
-    print(len(catholic))
-
-    for catholic_item in catholic:
-        try:
-            generate_bio(catholic_item, "catholic", "catholic")
-        except Exception as e:
-            print(e)
+    yield catholic, "catholic", "catholic"
 
     ordinariate = (CalendarEvent.objects.filter(
         calendar__in=["ordinariate", ]).exclude(
         english_rank__in=["Feria", "Sunday"]).values_list(
         "english_name",
         flat=True).distinct())
-    print(len(ordinariate))
-
-    for ordinariate_item in ordinariate:
-        try:
-            generate_bio(ordinariate_item, "ordinariate", "ordinariate")
-        except Exception as e:
-            print(e)
+    yield ordinariate, "ordinariate", "ordinariate"
 
     acnas = (CalendarEvent.objects.filter(
         calendar__in=["ACNA_BCP2019", ]).exclude(
@@ -110,13 +88,7 @@ def collect_bios():
                           "Sunday"]).values_list(
         "english_name",
         flat=True).order_by("english_name").distinct())
-    print(len(acnas))
-
-    for acna_item in acnas:
-        try:
-            generate_bio(acna_item, "acna", "ACNA_BCP2019")
-        except Exception as e:
-            print(e)
+    yield acnas, "acna", "ACNA_BCP2019"
 
     tecs = (CalendarEvent.objects.filter(
         calendar__in=["TEC_BCP1979_LFF2024", ]).exclude(
@@ -124,13 +96,123 @@ def collect_bios():
                           "Sunday"]).values_list(
         "english_name",
         flat=True).order_by("english_name").distinct())
-    print(len(tecs))
+    yield tecs, "tec", "TEC_BCP1979_LFF2024"
 
-    for tecs_item in tecs:
-        try:
-            generate_bio(tecs_item, "tec", "TEC_BCP1979_LFF2024")
-        except Exception as e:
-            print(e)
+
+def plan_bios_job(params):
+    if params.get("stale"):
+        yield from plan_stale_bios(params)
+        return
+    for names, religion, calendar in bio_targets():
+        if params.get("religions") and religion not in params["religions"]:
+            continue
+        for name in names:
+            yield f"{religion}:{name}", {"person": name, "religion": religion, "calendar": calendar}
+
+
+def handle_bio_unit(payload, params):
+    return generate_bio(
+        payload["person"],
+        payload["religion"],
+        payload["calendar"],
+        regenerate=params.get("regenerate", False),
+        mode=params.get("mode", "parallel"),
+        sections=payload.get("sections"),
+        biography_id=payload.get("biography_id"),
+        is_person=payload.get("is_person"),
+    )
+
+
+register_job("biographies", plan_bios_job, handle_bio_unit, "Saint and feast biographies, one unit per name")
+
+
+def collect_bios(
+    religions=None, concurrency=settings.BIO_CONCURRENCY, regenerate=False, mode="parallel", stale=False
+):
+    """Generate every missing biography, ``concurrency`` at a time; Gemini calls share the per-model rate limit.
+
+    With ``regenerate`` existing biographies are generated again and only their changed sections rewritten;
+    with ``stale`` only the sections reported by ``stale_sections`` are. ``mode`` is passed on to ``generate_bio``.
+    """
+    params = {"religions": religions or [], "regenerate": regenerate, "mode": mode, "stale": stale}
+    return run_job("biographies", params, concurrency=concurrency)
+
+
+@lru_cache(maxsize=None)
+def prompt_hashes(religion: str, is_person: bool) -> Dict[str, str]:
+    """Hash of each section's prompt template, system instruction and response schema.
+
+    The prompts are rendered with placeholders instead of a real name and date, so
+    the hash changes when a prompt is edited but not from one biography to the next.
+    """
+    system_instruction = build_system_instruction("{person}", religion, "{calendar}", "{date}")
+    return {
+        p_name: hashlib.sha256(
+            json.dumps([system_instruction, p_text, p_model.model_json_schema()], sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        for p_name, p_model, p_text in build_prompts("{person}", religion, is_person)
+    }
+
+
+def stale_sections(religions=None, include_untracked=False):
+    """Find the sections of stored biographies that need generating, across all biographies at once.
+
+    A section needs generating when it is missing, its last generation failed, or
+    it was generated with another model or prompt.  Sections stored before this
+    was tracked are ``untracked`` and only included on request.  Returns
+    ``(biography, {section: reason})`` pairs, using one query for the biographies,
+    annotated with the sections they have, and one for all their section states.
+    """
+    presence = section_presence()
+    biographies = Biography.objects.annotate(
+        is_person=Exists(CalendarEvent.objects.filter(biography=OuterRef("pk"), is_person=True)),
+        **{f"has_{name}": exists for name, exists in presence.items()},
+    ).order_by("religion", "name")
+    states = BiographySectionState.objects.all()
+    if religions:
+        biographies = biographies.filter(religion__in=religions)
+        states = states.filter(biography__religion__in=religions)
+    tracked = {
+        (biography_id, section): (status, model_name, prompt_hash)
+        for biography_id, section, status, model_name, prompt_hash in states.values_list(
+            "biography_id", "section", "status", "model_name", "prompt_hash"
+        )
+    }
+
+    stale = []
+    for biography in biographies:
+        reasons = {}
+        for section, expected_hash in prompt_hashes(biography.religion, biography.is_person).items():
+            state = tracked.get((biography.pk, section))
+            if state is None:
+                if not getattr(biography, f"has_{section}"):
+                    reasons[section] = "missing"
+                elif include_untracked:
+                    reasons[section] = "untracked"
+            elif state[0] == BiographySectionState.STATUS_FAILED:
+                reasons[section] = "failed"
+            elif state[1:] != (MODEL_NAME, expected_hash):
+                reasons[section] = "outdated"
+        if reasons:
+            stale.append((biography, reasons))
+    return stale
+
+
+def plan_stale_bios(params):
+    stale = stale_sections(params.get("religions"), params.get("include_untracked", False))
+    counts = Counter(reason for _, reasons in stale for reason in reasons.values())
+    summary = ", ".join(f"{count} {reason}" for reason, count in sorted(counts.items())) or "nothing to do"
+    print(f"Stale biography sections: {summary} across {len(stale)} biographies")
+    for biography, reasons in stale:
+        yield f"{biography.religion}:{biography.name}", {
+            "person": biography.name,
+            "religion": biography.religion,
+            "calendar": biography.calendar,
+            "sections": sorted(reasons),
+            "biography_id": str(biography.pk),
+            # The sections above were chosen for this; generate_bio must build the same prompts
+            "is_person": biography.is_person,
+        }
 
 
 class BibleVerse(BaseModel):
@@ -254,59 +336,44 @@ class Images(BaseModel):
         description="List of 3-5 images of the saint or feast day that are in the public domain or have a Creative Commons license. Each image should include the URL to the image, the title of the image, and the author of the image. If there are no images, return None.")
 
 
-def generate_bio(person: str, religion: str, calendar: str):
-
-    print(f"Starting { person } in { calendar } for { religion }")
-    event = None
-    year = 2025
-    while event is None:
-        if calendar == "traditional":
-            event = CalendarEvent.objects.filter(english_name=person, calendar__in=["Rubrics 1960 - 1960", "Divino Afflatu - 1954"], date__year=year).first()
-        else:
-            event = CalendarEvent.objects.filter(english_name=person, calendar=calendar, date__year=year).first()
-        year = year + 1
-        if year == 2037:
-            year = 2020
-
-    feast_prompt = f"For all prompts, we will be discussing the feast day of {person} which was/will be commemorated on {event.date} in the {calendar} calendar. Make sure to identify the correct feast or person in cases where there are multiple saints with the same name."
-
-    agent_string = {
-        "catholic": "You are a Roman Catholic who is fully obedient to the magisterium of the Catholic Church, and familiar with the Catholic patrimony, traditions, and beliefs.",
-        "ordinariate": "You are a Roman Catholic who is fully obedient to the magisterium of the Catholic Church, a member of the Anglican Ordinariate, and familiar with the Anglican patrimony, especially the Book of Divine Worship and the Anglican Use of the Roman Rite.",
-        "acna": "You are a member of the Anglican Church in North America, obedient to the Anglican formularies such as the Book of Common Prayer and the 39 Articles. You are not a member of the Episcopal Church in the United States.",
-        "tec": "You are a member of the Episcopal Church in the United States, part of the worldwide Anglican Communion, familiar with the Anglican tradition and the modern Episcopal Church.",
-        "traditional": "You are a traditional Roman Catholic who is fully obedient to the magisterium of the Catholic Church and in communion with the Pope, steeped in the tradition of the Traditional Latin Mass and the pre-1970 Roman Rite (especially the 1954 or 1960 calendar), and familiar with the Catholic patrimony. You may belong to a traditional society like the FSSP or ICKSP, or be a layperson who attends the Traditional Latin Mass.",
-    }
-
-    religion_string = {
-        "catholic": "the Roman Catholic Church",
-        "ordinariate": "the Roman Catholic Church, especially the Anglican Ordinariate",
-        "acna": "the Anglican Church in North America",
-        "tec": "the Episcopal Church in the United States",
-        "traditional": "the Roman Catholic Church who attends the Traditional Latin Mass",
-    }
-
-    bible_version = {
-        "catholic": "New American Bible (NAB) (1970)",
-        "ordinariate": "Revised Standard Version, Second Catholic Edition (RSV2CE) (2006)",
-        "acna": "English Standard Version (ESV) (2025)",
-        "tec": "New Revised Standard Version (NRSV) (1989)",
-        "traditional": "Douay-Rheims Bible (Challoner Revision) (DRC) (1752)",
-    }
-
-    # Initialize the GenAI client
-    client = genai.Client(api_key=settings.GEMINI_API_KEY)
-
-    # Define the model name
-    model_name = "gemini-2.5-flash-preview-05-20"
-
-    # Define the system instruction
-    system_instruction = agent_string[religion]
-    system_instruction = f"{system_instruction} You are an expert in the life and contributions of saints in Christianity, from the perspective of someone in {religion_string[religion]}. You are based in the United States of America, but have a global outlook and care about traditions from both the U.S.A. and around the world."
-    system_instruction = f"{system_instruction} { feast_prompt }"
-
-    if not event.is_person:
-        prompts = [
+MODEL_NAME = "gemini-2.5-flash-preview-05-20"
+
+AGENT_STRINGS = {
+    "catholic": "You are a Roman Catholic who is fully obedient to the magisterium of the Catholic Church, and familiar with the Catholic patrimony, traditions, and beliefs.",
+    "ordinariate": "You are a Roman Catholic who is fully obedient to the magisterium of the Catholic Church, a member of the Anglican Ordinariate, and familiar with the Anglican patrimony, especially the Book of Divine Worship and the Anglican Use of the Roman Rite.",
+    "acna": "You are a member of the Anglican Church in North America, obedient to the Anglican formularies such as the Book of Common Prayer and the 39 Articles. You are not a member of the Episcopal Church in the United States.",
+    "tec": "You are a member of the Episcopal Church in the United States, part of the worldwide Anglican Communion, familiar with the Anglican tradition and the modern Episcopal Church.",
+    "traditional": "You are a traditional Roman Catholic who is fully obedient to the magisterium of the Catholic Church and in communion with the Pope, steeped in the tradition of the Traditional Latin Mass and the pre-1970 Roman Rite (especially the 1954 or 1960 calendar), and familiar with the Catholic patrimony. You may belong to a traditional society like the FSSP or ICKSP, or be a layperson who attends the Traditional Latin Mass.",
+}
+
+RELIGION_STRINGS = {
+    "catholic": "the Roman Catholic Church",
+    "ordinariate": "the Roman Catholic Church, especially the Anglican Ordinariate",
+    "acna": "the Anglican Church in North America",
+    "tec": "the Episcopal Church in the United States",
+    "traditional": "the Roman Catholic Church who attends the Traditional Latin Mass",
+}
+
+BIBLE_VERSIONS = {
+    "catholic": "New American Bible (NAB) (1970)",
+    "ordinariate": "Revised Standard Version, Second Catholic Edition (RSV2CE) (2006)",
+    "acna": "English Standard Version (ESV) (2025)",
+    "tec": "New Revised Standard Version (NRSV) (1989)",
+    "traditional": "Douay-Rheims Bible (Challoner Revision) (DRC) (1752)",
+}
+
+
+def build_system_instruction(person: str, religion: str, calendar: str, event_date) -> str:
+    feast_prompt = f"For all prompts, we will be discussing the feast day of {person} which was/will be commemorated on {event_date} in the {calendar} calendar. Make sure to identify the correct feast or person in cases where there are multiple saints with the same name."
+    system_instruction = AGENT_STRINGS[religion]
+    system_instruction = f"{system_instruction} You are an expert in the life and contributions of saints in Christianity, from the perspective of someone in {RELIGION_STRINGS[religion]}. You are based in the United States of America, but have a global outlook and care about traditions from both the U.S.A. and around the world."
+    return f"{system_instruction} { feast_prompt }"
+
+
+def build_prompts(person: str, religion: str, is_person: bool) -> list:
+    """The ``(section, schema, prompt)`` triples for a saint (``is_person``) or a feast."""
+    if not is_person:
+        return [
             (
                 "short_descriptions",
                 ShortDescriptions,
@@ -320,7 +387,7 @@ def generate_bio(person: str, religion: str, calendar: str):
             (
                 "verse",
                 BibleVerse,
-                f"What is one Bible verse in {bible_version[religion]} that best represents this feast {person}? Include the exact quote with book, chapter, and verse, and version of the Bible.",
+                f"What is one Bible verse in {BIBLE_VERSIONS[religion]} that best represents this feast {person}? Include the exact quote with book, chapter, and verse, and version of the Bible.",
             ),
             (
                 "ai_feast_description",
@@ -358,346 +425,330 @@ def generate_bio(person: str, religion: str, calendar: str):
                 f"Return 3-5 images of {person} that are in the public domain or have a Creative Commons license. Include the URL to the image, the title of the image, and the author of the image. Double check that the URL is valid, accessible, and is a direct link to the image. If there are no images, return none.",
             ),
         ]
+    return [
+        (
+            "short_descriptions",
+            ShortDescriptions,
+            f"Provide two very short descriptions of who {person} is, one that is a single sentence long and one that is a single paragraph long. Include what the person is known for and their role in the Christian life and church. You don't need to include the name of the religion.",
+        ),
+        (
+            "quotes",
+            Quote,
+            f"List one quote either by or about {person} that best represents them and their importance to Christianity.",
+        ),
+        (
+            "verse",
+            BibleVerse,
+            f"What is one Bible verse in {BIBLE_VERSIONS[religion]} that best represents the life, work, and beliefs of {person}? Include the exact quote with book, chapter, and verse, and version of the Bible.",
+        ),
+        (
+            "ai_hagiography",
+            Hagiography,
+            f"Write a hagiographical biography of {person} that is at least 6 paragraphs and 600 words and is rather detailed. Include just the biography—no intro text or other text. It should be an engaging narrative of the person's life and why they are important in the Christian tradition.",
+        ),
+        (
+            "ai_legend",
+            Legend,
+            f"Tell a story, anecdote, or pious legend from the life of {person} that is interesting and revealing of their character and faith. Include just the title and story—no intro text or other text. Tell it as a storyteller with a narrative, dramatic style.",
+        ),
+        (
+            "ai_bullet_points",
+            BulletPoints,
+            f"Summarize {person}'s life and contributions to the Christian life in 4-6 short bullet points. Include just the bullet points—no intro text or other text. Include important events, contributions, and beliefs that are significant in the Christian tradition.",
+        ),
+        (
+            "ai_traditions",
+            Traditions,
+            f"Include a bulleted list of interesting pious or popular traditions for the feast day of {person} from the U.S. and around the world with which country or region they are from including official and unofficial / popular traditions in the church, town, and home. If there is nothing notable, return None. Do not use the first person ever. Include just the bullet points—no intro text or other text.",
+        ),
+        (
+            "ai_foods",
+            Foods,
+            f"Include a bulleted list of interesting foods or culinary habits for the feast day of {person} from around the world with which country they are from. If there is nothing notable, return None. Do not use the first person ever. Include just the bullet points—no intro text or other text.",
+        ),
+        (
+            "ai_writings",
+            Writings,
+            f"Include two representative writings by {person} that best articulate their beliefs, teachings, or contributions to Christianity (one by the saint, if there is one, and one about the saint, if there is one). This should be a word-for-word original text of the writing (literally translated into English if necessary). Aim for 300-4000 words. Include just the writing—no intro text or other text.",
+        ),
+        (
+            "images",
+            Images,
+            f"Return 3-5 images of {person} that are in the public domain or have a Creative Commons license. Include the URL to the image, the title of the image, and the author of the image. Double check that the URL is valid, accessible, and is a direct link to the image. If there are no images, return none.",
+        ),
+    ]
+
+
+def find_event(person: str, calendar: str, biography_id: Optional[str] = None) -> CalendarEvent:
+    """The calendar event ``person``'s biography is written for, preferring 2025-2036 over 2020-2024.
+
+    With ``biography_id`` the biography's own linked events are used, so a stored biography whose name no
+    longer matches its events still finds them.  Raises ``LookupError`` when there is no event, which fails
+    the work unit.
+    """
+    if biography_id:
+        events = CalendarEvent.objects.filter(biography_id=biography_id)
     else:
-        prompts = [
-            (
-                "short_descriptions",
-                ShortDescriptions,
-                f"Provide two very short descriptions of who {person} is, one that is a single sentence long and one that is a single paragraph long. Include what the person is known for and their role in the Christian life and church. You don't need to include the name of the religion.",
-            ),
-            (
-                "quotes",
-                Quote,
-                f"List one quote either by or about {person} that best represents them and their importance to Christianity.",
-            ),
-            (
-                "verse",
-                BibleVerse,
-                f"What is one Bible verse in {bible_version[religion]} that best represents the life, work, and beliefs of {person}? Include the exact quote with book, chapter, and verse, and version of the Bible.",
-            ),
-            (
-                "ai_hagiography",
-                Hagiography,
-                f"Write a hagiographical biography of {person} that is at least 6 paragraphs and 600 words and is rather detailed. Include just the biography—no intro text or other text. It should be an engaging narrative of the person's life and why they are important in the Christian tradition.",
-            ),
-            (
-                "ai_legend",
-                Legend,
-                f"Tell a story, anecdote, or pious legend from the life of {person} that is interesting and revealing of their character and faith. Include just the title and story—no intro text or other text. Tell it as a storyteller with a narrative, dramatic style.",
-            ),
-            (
-                "ai_bullet_points",
-                BulletPoints,
-                f"Summarize {person}'s life and contributions to the Christian life in 4-6 short bullet points. Include just the bullet points—no intro text or other text. Include important events, contributions, and beliefs that are significant in the Christian tradition.",
-            ),
-            (
-                "ai_traditions",
-                Traditions,
-                f"Include a bulleted list of interesting pious or popular traditions for the feast day of {person} from the U.S. and around the world with which country or region they are from including official and unofficial / popular traditions in the church, town, and home. If there is nothing notable, return None. Do not use the first person ever. Include just the bullet points—no intro text or other text.",
-            ),
-            (
-                "ai_foods",
-                Foods,
-                f"Include a bulleted list of interesting foods or culinary habits for the feast day of {person} from around the world with which country they are from. If there is nothing notable, return None. Do not use the first person ever. Include just the bullet points—no intro text or other text.",
-            ),
-            (
-                "ai_writings",
-                Writings,
-                f"Include two representative writings by {person} that best articulate their beliefs, teachings, or contributions to Christianity (one by the saint, if there is one, and one about the saint, if there is one). This should be a word-for-word original text of the writing (literally translated into English if necessary). Aim for 300-4000 words. Include just the writing—no intro text or other text.",
-            ),
-            (
-                "images",
-                Images,
-                f"Return 3-5 images of {person} that are in the public domain or have a Creative Commons license. Include the URL to the image, the title of the image, and the author of the image. Double check that the URL is valid, accessible, and is a direct link to the image. If there are no images, return none.",
-            ),
-        ]
-    # Find existing Biography or create a new one
-    biography = Biography.objects.filter(name=person, religion=religion).first()
-    if biography:
+        events = CalendarEvent.objects.filter(name_key=name_key(person), calendar__in=event_calendars(calendar))
+    for first_year, last_year in [(2025, 2036), (2020, 2024)]:
+        event = events.filter(date__year__range=(first_year, last_year)).order_by("date").first()
+        if event:
+            return event
+    raise LookupError(f"No calendar event for {person} in {calendar}")
+
+
+def generate_bio(
+    person: str,
+    religion: str,
+    calendar: str,
+    regenerate: bool = False,
+    mode: str = "parallel",
+    sections: Optional[List[str]] = None,
+    biography_id: Optional[str] = None,
+    is_person: Optional[bool] = None,
+):
+    """Generate and store the biography of ``person``; returns the token and latency report.
+
+    ``mode`` is ``"parallel"`` (independent section prompts sharing a short
+    description, issued concurrently) or ``"conversation"`` (one growing chat).
+    Passing ``sections`` regenerates only those sections of an existing biography,
+    ``biography_id``, whose linked events give its date.  ``is_person`` (by default
+    the event's) decides which sections there are; stale runs pass the value
+    ``stale_sections`` chose the sections with.
+    """
+
+    print(f"Starting { person } in { calendar } for { religion }")
+    event = find_event(person, calendar, biography_id)
+    if is_person is None:
+        is_person = event.is_person
+
+    # Initialize the GenAI client
+    client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    model_name = MODEL_NAME
+
+    system_instruction = build_system_instruction(person, religion, calendar, event.date)
+    prompts = build_prompts(person, religion, is_person)
+
+    context = None
+    if sections:
+        prompts = [prompt for prompt in prompts if prompt[0] in sections]
+        if "short_descriptions" not in sections:
+            context = (
+                ShortDescriptionsModel.objects.filter(biography__name=person, biography__religion=religion)
+                .values_list("one_paragraph_description", flat=True)
+                .first()
+            )
+    elif not regenerate and Biography.objects.filter(name=person, religion=religion).exists():
         print("Already saved")
         return
-    if biography:
-        # Delete related objects (OneToOne and ForeignKey relationships)
-        if hasattr(biography, 'short_descriptions'):
-            biography.short_descriptions.delete()
-        if hasattr(biography, 'quote'):
-            biography.quote.delete()
-        if hasattr(biography, 'bible_verse'):
-            biography.bible_verse.delete()
-        if hasattr(biography, 'hagiography'):
-            biography.hagiography.delete()
-        if hasattr(biography, 'legend'):
-            biography.legend.delete()
-        if hasattr(biography, 'feast_description') and biography.feast_description.pk is not None:
-            biography.feast_description.delete()
-        if hasattr(biography, 'bullet_points'):
-            biography.bullet_points.delete()
-        biography.traditions.all().delete()
-        biography.foods.all().delete()
-        biography.writings.all().delete()
-        biography.images.all().delete()
-        # Optionally update fields if needed
-        biography.name = person
-        biography.religion = religion
-        biography.calendar = calendar
-        biography.save()
-    else:
-        biography = Biography.objects.create(name=person, religion=religion, calendar=calendar)
 
-    # Associate all matching CalendarEvents with this Biography
-    if calendar == "traditional":
-        CalendarEvent.objects.filter(english_name=person, calendar__in=["Rubrics 1960 - 1960", "Divino Afflatu - 1954"]).update(biography=biography)
+    started = time.monotonic()
+    if mode == "conversation":
+        results, stats = generate_sections_in_conversation(client, model_name, system_instruction, prompts, person)
     else:
-        CalendarEvent.objects.filter(english_name=person, calendar=calendar).update(biography=biography)
-
-    conversation_history = []
-    for p_name, p_model, p_text in prompts:
-        # Construct the formatted prompt with JSON schema
-        json_instruction = f"Use Google Search for every factual claim and cite your sources in the citation_metadata for all factual claims, and include a citation for every paragraph or fact whenever possible (in the citation_metadata attribute, not the content response). Format your response as valid JSON that conforms to this schema: {p_model.schema_json()}"
-        formatted_prompt = f"{p_text}\n\n{json_instruction}"
-
-        # Add the new user message to the conversation history
-        user_message = {"role": "user", "parts": [{"text": formatted_prompt}]}
-        conversation_history.append(user_message)
-
-        # Define the generation configuration
-        generation_config = types.GenerateContentConfig(
-            system_instruction=system_instruction,
-            temperature=0.7,
-            max_output_tokens=65535,
-            # tools=[Tool(google_search=GoogleSearch())],
-            response_mime_type="application/json",
-            response_schema=p_model,
+        results, stats = generate_sections_in_parallel(
+            client, model_name, system_instruction, prompts, person, context=context
         )
+    report = section_report(stats, time.monotonic() - started)
+    print_section_report(person, mode, report)
+
+    hashes = prompt_hashes(religion, is_person)
+    states = [
+        {
+            "section": section_stats.section,
+            "status": BiographySectionState.STATUS_OK if section_stats.ok else BiographySectionState.STATUS_FAILED,
+            "model_name": model_name,
+            "prompt_hash": hashes[section_stats.section],
+            "input_tokens": section_stats.input_tokens,
+            "output_tokens": section_stats.output_tokens,
+        }
+        for section_stats in stats
+    ]
 
-        # Attempt to generate content with retries
-        response = None
-        for attempt in range(5):
-            try:
-                response = client.models.generate_content(
-                    model=model_name,
-                    contents=conversation_history,
-                    config=generation_config,
-                )
-                break
-            except Exception as e:
-                print(f"Error during Gemini API call for {p_name} (attempt {attempt + 1}/5): {e}")
-                if attempt < 4:
-                    time.sleep(0.5 * (attempt + 1))
-                else:
-                    print(f"Failed to get {p_name} for {person} after 5 attempts.")
-                    continue
-
-        if not response or not response.candidates:
-            print(f"Failed to get a valid response for {p_name} for {person} from Gemini.")
-            continue
+    # Nothing is written until every section has been generated, then only the sections that changed
+    with transaction.atomic():
+        biography, changed = save_biography(person, religion, calendar, results)
+        record_section_states(biography, states)
+
+        # Associate all matching CalendarEvents with this Biography
+        link_biography(biography)
+    print(f"Saved {person} for {religion}: {len(changed)} of {len(results)} generated sections changed")
+    return report
+
+
+@dataclass
+class SectionStats:
+    section: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency: float = 0.0
+    queued: float = 0.0
+    attempts: int = 0
+    ok: bool = False
 
-        # Extract the response text
-        response_text = response.candidates[0].content.parts[0].text
-        cleaned_response_text = clean_json_string(response_text)
 
+def section_message(p_text: str, p_model) -> dict:
+    json_instruction = f"Use Google Search for every factual claim and cite your sources in the citation_metadata for all factual claims, and include a citation for every paragraph or fact whenever possible (in the citation_metadata attribute, not the content response). Format your response as valid JSON that conforms to this schema: {p_model.schema_json()}"
+    return {"role": "user", "parts": [{"text": f"{p_text}\n\n{json_instruction}"}]}
+
+
+def generate_section(client, model_name: str, system_instruction: str, contents: list, p_name: str, p_model, person: str):
+    """Run one section prompt with retries; returns the parsed result (or None), the raw response text and its stats.
+
+    ``latency`` is time spent in API calls; time spent waiting on the rate limiter is ``queued``.
+    """
+    stats = SectionStats(section=p_name)
+    generation_config = types.GenerateContentConfig(
+        system_instruction=system_instruction,
+        temperature=0.7,
+        max_output_tokens=65535,
+        # tools=[Tool(google_search=GoogleSearch())],
+        response_mime_type="application/json",
+        response_schema=p_model,
+    )
+
+    # Attempt to generate content with retries
+    started = time.monotonic()
+    response = None
+    for attempt in range(5):
+        stats.attempts = attempt + 1
         try:
-            completion_result = p_model.model_validate_json(cleaned_response_text)
-        except json.JSONDecodeError as e:
-            print(f"[ERROR] Failed to parse JSON response for {p_name} for {person}: {e}")
-            print(f"[ERROR] Raw response text: {cleaned_response_text}")
-            continue
+            stats.queued += ratelimit.acquire("gemini", model_name)
+            response = client.models.generate_content(
+                model=model_name,
+                contents=contents,
+                config=generation_config,
+            )
+            break
         except Exception as e:
-            print(f"[ERROR] Validation or parsing error for {p_name} for {person}: {e}")
-            print(f"[ERROR] Raw response text: {cleaned_response_text}")
+            print(f"Error during Gemini API call for {p_name} (attempt {attempt + 1}/5): {e}")
+            if attempt < 4:
+                time.sleep(0.5 * (attempt + 1))
+            else:
+                print(f"Failed to get {p_name} for {person} after 5 attempts.")
+    stats.latency = time.monotonic() - started - stats.queued
+
+    usage = getattr(response, "usage_metadata", None)
+    if usage:
+        stats.input_tokens = usage.prompt_token_count or 0
+        stats.output_tokens = usage.candidates_token_count or 0
+
+    if not response or not response.candidates:
+        print(f"Failed to get a valid response for {p_name} for {person} from Gemini.")
+        return None, None, stats
+
+    # Extract the response text
+    response_text = response.candidates[0].content.parts[0].text
+    cleaned_response_text = clean_json_string(response_text)
+
+    try:
+        completion_result = p_model.model_validate_json(cleaned_response_text)
+    except json.JSONDecodeError as e:
+        print(f"[ERROR] Failed to parse JSON response for {p_name} for {person}: {e}")
+        print(f"[ERROR] Raw response text: {cleaned_response_text}")
+        return None, response_text, stats
+    except Exception as e:
+        print(f"[ERROR] Validation or parsing error for {p_name} for {person}: {e}")
+        print(f"[ERROR] Raw response text: {cleaned_response_text}")
+        return None, response_text, stats
+
+    stats.ok = True
+    print(f"=== {p_name} ===")
+    return completion_result, response_text, stats
+
+
+def generate_sections_in_conversation(client, model_name, system_instruction, prompts, person):
+    """Ask for each section in turn within one conversation, resending the growing history every time."""
+    conversation_history = []
+    sections = []
+    stats = []
+    for p_name, p_model, p_text in prompts:
+        conversation_history.append(section_message(p_text, p_model))
+        completion_result, response_text, section_stats = generate_section(
+            client, model_name, system_instruction, conversation_history, p_name, p_model, person
+        )
+        stats.append(section_stats)
+        if completion_result is None:
             continue
+        sections.append((p_name, completion_result))
+        conversation_history.append({"role": "model", "parts": [{"text": response_text}]})
+    return sections, stats
 
-        # Save to DB
-        if p_name == "short_descriptions":
-            ShortDescriptionsModel.objects.create(
-                biography=biography,
-                one_sentence_description=getattr(completion_result, 'one_sentence_description', ""),
-                one_paragraph_description=getattr(completion_result, 'one_paragraph_description', ""),
-            )
-        elif p_name == "quotes":
-            QuoteModel.objects.create(
-                biography=biography,
-                quote=getattr(completion_result, 'quote', ""),
-                person=getattr(completion_result, 'person', ""),
-                date=getattr(completion_result, 'date', ""),
-            )
-        elif p_name == "verse":
-            BibleVerseModel.objects.create(
-                biography=biography,
-                citation=getattr(completion_result, 'citation', ""),
-                text=getattr(completion_result, 'text', ""),
-                bible_version_abbreviation=getattr(completion_result, 'bible_version_abbreviation', ""),
-                bible_version=getattr(completion_result, 'bible_version', ""),
-                bible_version_year=getattr(completion_result, 'bible_version_year', ""),
-            )
-        elif p_name == "ai_hagiography":
-            hagiography_model = HagiographyModel.objects.create(
-                biography=biography,
-                hagiography=getattr(completion_result, 'hagiography', ""),
-            )
-            if getattr(completion_result, 'citations', None):
-                for c in completion_result.citations:
-                    citation_obj, _ = HagiographyCitationModel.objects.get_or_create(
-                        citation=getattr(c, 'citation', ""),
-                        url=getattr(c, 'url', None),
-                        date_accessed=getattr(c, 'date_accessed', None),
-                        title=getattr(c, 'title', None),
-                    )
-                    hagiography_model.citations.add(citation_obj)
-        elif p_name == "ai_feast_description":
-            from saints.models import FeastDescriptionModel
-            # Delete existing FeastDescriptionModel if it exists
-            if hasattr(biography, 'feast_description') and biography.feast_description.pk is not None:
-                biography.feast_description.delete()
-            feast_description_model = FeastDescriptionModel.objects.create(
-                biography=biography,
-                feast_description=getattr(completion_result, 'feast_description', ""),
-            )
-            if getattr(completion_result, 'citations', None):
-                for c in completion_result.citations:
-                    citation_obj, _ = HagiographyCitationModel.objects.get_or_create(
-                        citation=getattr(c, 'citation', ""),
-                        url=getattr(c, 'url', None),
-                        date_accessed=getattr(c, 'date_accessed', None),
-                        title=getattr(c, 'title', None),
-                    )
-                    feast_description_model.citations.add(citation_obj)
-        elif p_name == "ai_legend":
-            legend_model = LegendModel.objects.create(
-                biography=biography,
-                legend=getattr(completion_result, 'legend', ""),
-                title=getattr(completion_result, 'title', ""),
+
+def generate_sections_in_parallel(client, model_name, system_instruction, prompts, person, context=None):
+    """Generate the short descriptions first, then every other section at once with them as shared context.
+
+    Each request carries only the system instruction, the one-paragraph description
+    and its own prompt, so its size no longer grows with the number of sections.
+    When the short descriptions are not being generated, ``context`` (the stored
+    one-paragraph description) is shared instead.
+    """
+    if context:
+        system_instruction = f"{system_instruction} In brief: {context}"
+    sections = []
+    stats = []
+    rest = list(prompts)
+    descriptions = next((prompt for prompt in prompts if prompt[0] == "short_descriptions"), None)
+    if descriptions:
+        rest.remove(descriptions)
+        p_name, p_model, p_text = descriptions
+        completion_result, _, section_stats = generate_section(
+            client, model_name, system_instruction, [section_message(p_text, p_model)], p_name, p_model, person
+        )
+        stats.append(section_stats)
+        if completion_result is not None:
+            sections.append((p_name, completion_result))
+            system_instruction = f"{system_instruction} In brief: {completion_result.one_paragraph_description}"
+
+    with ThreadPoolExecutor(max_workers=settings.BIO_SECTION_CONCURRENCY) as pool:
+        futures = [
+            pool.submit(
+                generate_section,
+                client,
+                model_name,
+                system_instruction,
+                [section_message(p_text, p_model)],
+                p_name,
+                p_model,
+                person,
             )
-            if getattr(completion_result, 'citations', None):
-                for c in completion_result.citations:
-                    citation_obj, _ = HagiographyCitationModel.objects.get_or_create(
-                        citation=getattr(c, 'citation', ""),
-                        url=getattr(c, 'url', None),
-                        date_accessed=getattr(c, 'date_accessed', None),
-                        title=getattr(c, 'title', None),
-                    )
-                    legend_model.citations.add(citation_obj)
-        elif p_name == "ai_bullet_points":
-            bullet_points_model = BulletPointsModel.objects.create(biography=biography)
-            if getattr(completion_result, 'bullet_points', None):
-                for i, bp in enumerate(completion_result.bullet_points):
-                    BulletPoint.objects.create(bullet_points_model=bullet_points_model, text=bp, order=i)
-            if getattr(completion_result, 'citations', None):
-                for c in completion_result.citations:
-                    citation_obj, _ = HagiographyCitationModel.objects.get_or_create(
-                        citation=getattr(c, 'citation', ""),
-                        url=getattr(c, 'url', None),
-                        date_accessed=getattr(c, 'date_accessed', None),
-                        title=getattr(c, 'title', None),
-                    )
-                    bullet_points_model.citations.add(citation_obj)
-        elif p_name == "ai_traditions":
-            if getattr(completion_result, 'traditions', None):
-                for idx, t in enumerate(completion_result.traditions):
-                    TraditionModel.objects.create(
-                        biography=biography,
-                        tradition=getattr(t, 'tradition', ""),
-                        country_of_origin=getattr(t, 'country_of_origin', None),
-                        reason_associated_with_saint=getattr(t, 'reason_associated_with_saint', None),
-                        order=idx,
-                    )
-        elif p_name == "ai_foods":
-            if getattr(completion_result, 'foods', None):
-                for idx, f in enumerate(completion_result.foods):
-                    FoodModel.objects.create(
-                        biography=biography,
-                        food_name=getattr(f, 'food_name', ""),
-                        description=getattr(f, 'description', ""),
-                        country_of_origin=getattr(f, 'country_of_origin', None),
-                        reason_associated_with_saint=getattr(f, 'reason_associated_with_saint', None),
-                        order=idx,
-                    )
-        elif p_name == "ai_writings":
-            if getattr(completion_result, 'writing_by_saint', None):
-                WritingModel.objects.create(
-                    biography=biography,
-                    writing=getattr(completion_result.writing_by_saint, 'writing', ""),
-                    date=getattr(completion_result.writing_by_saint, 'date', ""),
-                    title=getattr(completion_result.writing_by_saint, 'title', ""),
-                    url=getattr(completion_result.writing_by_saint, 'url', None),
-                    author=getattr(completion_result.writing_by_saint, 'author', None),
-                    type="by",
-                    order=0,
-                )
-            if getattr(completion_result, 'writing_about_saint', None):
-                WritingModel.objects.create(
-                    biography=biography,
-                    writing=getattr(completion_result.writing_about_saint, 'writing', ""),
-                    date=getattr(completion_result.writing_about_saint, 'date', ""),
-                    title=getattr(completion_result.writing_about_saint, 'title', ""),
-                    url=getattr(completion_result.writing_about_saint, 'url', None),
-                    author=getattr(completion_result.writing_about_saint, 'author', None),
-                    type="about",
-                    order=1,
-                )
-            if getattr(completion_result, 'writing_about_feast', None):
-                WritingModel.objects.create(
-                    biography=biography,
-                    writing=getattr(completion_result.writing_about_feast, 'writing', ""),
-                    date=getattr(completion_result.writing_about_feast, 'date', ""),
-                    title=getattr(completion_result.writing_about_feast, 'title', ""),
-                    url=getattr(completion_result.writing_about_feast, 'url', None),
-                    author=getattr(completion_result.writing_about_feast, 'author', None),
-                    type="about",
-                    order=2,
-                )
-        elif p_name == "images":
-            if getattr(completion_result, 'images', None):
-                for idx, img in enumerate(completion_result.images):
-                    ImageModel.objects.create(
-                        biography=biography,
-                        url=getattr(img, 'url', ""),
-                        title=getattr(img, 'title', ""),
-                        author=getattr(img, 'author', None),
-                        date=getattr(img, 'date', None),
-                        order=idx,
-                    )
-
-        # Add the model's response to the conversation history
-        model_message = {"role": "model", "parts": [{"text": response_text}]}
-        conversation_history.append(model_message)
-
-        # Print the completion result
-        print(f"=== {p_name} ===")
-        # print("Completion result:", completion_result)
-
-        # Handle citations if available
-        citation_metadata = response.candidates[0].citation_metadata
-        # print("Citations (Annotations):")
-        if citation_metadata and getattr(citation_metadata, 'citations', None):
-            for source in citation_metadata.citations:
-                pass
-                # print(f"  - Start Index: {getattr(source, 'start_index', 'N/A')}, "
-                #       f"End Index: {getattr(source, 'end_index', 'N/A')}, "
-                #       f"URI: {getattr(source, 'uri', 'N/A')}, "
-                #       f"License: {getattr(source, 'license', 'N/A')}")
-        else:
-            pass
-            # print("  None")
+            for p_name, p_model, p_text in rest
+        ]
+        for (p_name, _, _), future in zip(rest, futures):
+            completion_result, _, section_stats = future.result()
+            stats.append(section_stats)
+            if completion_result is not None:
+                sections.append((p_name, completion_result))
+    return sections, stats
+
+
+def section_report(stats: List[SectionStats], elapsed: float) -> dict:
+    """JSON-serialisable token and latency totals for one biography, with the per-section figures."""
+    return {
+        "sections": [asdict(section_stats) for section_stats in stats],
+        "generated": sum(section_stats.ok for section_stats in stats),
+        "input_tokens": sum(section_stats.input_tokens for section_stats in stats),
+        "output_tokens": sum(section_stats.output_tokens for section_stats in stats),
+        "api_seconds": round(sum(section_stats.latency for section_stats in stats), 2),
+        "elapsed_seconds": round(elapsed, 2),
+    }
 
 
-def clean_calendar_event_names():
-    suffixes = [
-        " Solemnity",
-        " Feast",
-        " Memorial",
-        " Optional Memorial",
-        " Commemoration",
-    ]
-    for event in CalendarEvent.objects.all():
-        original_name = event.english_name
-        new_name = original_name
-        for suffix in suffixes:
-            if new_name.endswith(suffix):
-                new_name = new_name[: -len(suffix)]
-                break
-        if new_name != original_name:
-            print(f"Before: {original_name} | After: {new_name}")
-            event.english_name = new_name
-            event.save()
+def print_section_report(person: str, mode: str, report: dict):
+    for row in report["sections"]:
+        status = "ok" if row["ok"] else "FAILED"
+        print(
+            f"  {row['section']:<22} {row['input_tokens']:>7} in {row['output_tokens']:>7} out "
+            f"{row['latency']:6.1f}s ({row['attempts']} attempts) {status}"
+        )
+    print(
+        f"{person} ({mode}): {report['generated']}/{len(report['sections'])} sections, "
+        f"{report['input_tokens']} input + {report['output_tokens']} output tokens, "
+        f"{report['api_seconds']}s of API time in {report['elapsed_seconds']}s"
+    )
 
+
+def clean_calendar_event_names():
+    """Re-apply name normalisation to stored events; importers already do this at ingest time."""
+    for rule, count in normalize_calendar_events(connection, CalendarEvent).items():
+        print(f"{rule}: {count} rows")
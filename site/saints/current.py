@@ -11,13 +11,24 @@ from google.genai import types
 from pydantic import BaseModel, Field
 
 from saints import settings
+from saints.jobs import register_job, run_job
 from saints.models import CalendarEvent
+from saints.sync import YEAR_DOCUMENT, event_row, fetch_document, group_by_month, sync_month
+
+SOURCE = "gcatholic"
+CALENDAR_URL = "https://gcatholic.org/calendar/{year}/US-D-en"
+YEARS = range(2023, 2029)
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
 
 
 def parse_gcatholic_calendar(url):
     year = int(url.strip("/").split("/")[-2])  # Extract year from URL
     response = requests.get(url)
-    soup = BeautifulSoup(response.text, "html.parser")
+    return parse_gcatholic_html(response.text, year)
+
+
+def parse_gcatholic_html(html, year):
+    soup = BeautifulSoup(html, "html.parser")
 
     table = soup.find("table", class_="tb")
     rows = table.find_all("tr")
@@ -161,39 +172,71 @@ def enhance(text):
     return result
 
 
-def run():
-    years = list(range(2023, 2029))
-    for year in years:
-        url = f"https://gcatholic.org/calendar/{year}/US-D-en"
-        calendar_entries = parse_gcatholic_calendar(url)
-        for entry in calendar_entries:
-            if entry["name"] in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]:
-                continue
-            event = CalendarEvent.objects.get_or_create(
-                year=entry["year"],
-                month=entry["month"],
-                day=entry["day"],
+def build_event_rows(entries):
+    rows = []
+    for entry in entries:
+        if entry["name"] in WEEKDAY_NAMES:
+            continue
+        enhancement = enhance(entry["name"])
+        rows.append(
+            event_row(
+                date(entry["year"], entry["month"], entry["day"]),
                 english_name=entry["name"],
-                calendar="current",
-                subcalendar="usa",
-            )[0]
-
-            event.english_rank = entry["rank"]
-            event.color = entry["color"]
-            event.season = entry["season"]
-            event.order = entry["order"]
-
-            enhancement = enhance(entry["name"])
-            event.is_person = enhancement["is_person"]
-            event.saint_name = enhancement["saint_name"]
-            event.saint_category = enhancement["saint_category"]
-            event.saint_categories = json.dumps(enhancement["saint_categories"])
-            event.saint_singular_or_plural = enhancement["saint_singular_or_plural"]
-
-            event.save()
-            print(event.english_name)
-
-            CalendarEvent.objects.filter(
-                english_name__in=["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-            ).delete()
-
+                english_rank=entry["rank"],
+                color=entry["color"],
+                season=entry["season"],
+                order=entry["order"],
+                is_person=enhancement["is_person"],
+                saint_name=enhancement["saint_name"],
+                saint_category=enhancement["saint_category"],
+                saint_categories=json.dumps(enhancement["saint_categories"]),
+                saint_singular_or_plural=enhancement["saint_singular_or_plural"],
+            )
+        )
+    return rows
+
+
+def sync_year(year, incremental=True):
+    """Import one year of the GCatholic USA calendar, re-importing only the months whose entries changed."""
+    url = CALENDAR_URL.format(year=year)
+    document = fetch_document(SOURCE, "current", year, YEAR_DOCUMENT, url, force=not incremental)
+    if not document.changed:
+        print(f"Unchanged: {url}")
+        return None
+
+    calendar_entries = parse_gcatholic_html(document.text, year)
+    months = group_by_month(calendar_entries, lambda entry: entry["month"])
+    totals = {"created": 0, "updated": 0, "deleted": 0}
+    for month, month_entries in sorted(months.items()):
+        counts = sync_month(
+            SOURCE,
+            "current",
+            year,
+            month,
+            month_entries,
+            build_event_rows,
+            subcalendar="usa",
+            incremental=incremental,
+        )
+        if counts is not None:
+            print(f"Synced current {year}-{month:02d}: {counts[0]} created, {counts[1]} updated, {counts[2]} deleted")
+            for total, count in zip(totals, counts):
+                totals[total] += count
+    document.mark_synced(len(calendar_entries))
+    return totals
+
+
+def plan_job(params):
+    for year in params.get("years", list(YEARS)):
+        yield str(year), {"year": year}
+
+
+def handle_unit(payload, params):
+    return sync_year(payload["year"], incremental=params.get("incremental", True))
+
+
+register_job("gcatholic", plan_job, handle_unit, "GCatholic USA calendar, one unit per year")
+
+
+def run(years=YEARS, incremental=False):
+    return run_job("gcatholic", {"incremental": incremental, "years": list(years)})
@@ -0,0 +1,91 @@
+"""What both podcasts need for one date, built once per nightly run.
+
+Saints and Seasons and Saintly Adventures are made from the same
+biographies.  ``DayContext.build`` reads and serializes them once and each
+generator takes the context instead of querying again, so the two shows can
+be built side by side from one snapshot.  ``research`` coordinates their
+research stages: a query one show is already researching is waited for by the
+other instead of being paid for twice.  Research finished on earlier runs
+comes from ``saints.research_cache``.  ``saints.podcast_batch`` builds several
+dates at once and shares one ``SharedResearch`` between all of them.
+"""
+
+import datetime
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.utils import timezone
+
+from saints.api import BiographySerializer
+from saints.models import CalendarEvent
+
+CALENDAR_PRIORITY = [
+    "catholic",
+    "Divino Afflatu - 1954",
+    "Rubrics 1960 - 1960",
+    "ordinariate",
+]
+
+
+def next_episode_date() -> datetime.date:
+    """Tomorrow in US Eastern time, the date the nightly run builds episodes for."""
+    from zoneinfo import ZoneInfo
+
+    eastern_now = timezone.now().astimezone(ZoneInfo("America/New_York"))
+    return eastern_now.date() + datetime.timedelta(days=1)
+
+
+def biographies_for_day(target_date: datetime.date) -> List[Dict[str, Any]]:
+    """The serialized biographies linked to ``target_date``'s events, ordered by calendar priority."""
+    events = CalendarEvent.objects.filter(date=target_date, calendar__in=CALENDAR_PRIORITY)
+    if not events.exists():
+        return []
+    events_by_calendar: Dict[str, List[Any]] = {}
+    for event in events:
+        if hasattr(event, "biography") and event.biography:
+            cal = event.calendar
+            if cal not in events_by_calendar:
+                events_by_calendar[cal] = []
+            events_by_calendar[cal].append(event.biography)
+
+    prioritized_biographies: List[Any] = []
+    for cal in CALENDAR_PRIORITY:
+        if cal in events_by_calendar:
+            prioritized_biographies.extend(events_by_calendar[cal])
+
+    return list(BiographySerializer(prioritized_biographies, many=True).data)
+
+
+class SharedResearch:
+    """Research in progress during one run, by query key."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.futures: Dict[str, Future] = {}
+
+    def claim(self, key: str) -> Tuple[Future, bool]:
+        """The future for ``key`` and whether the caller claimed it (and must research it and set its result)."""
+        with self.lock:
+            if key in self.futures:
+                return self.futures[key], False
+            future = Future()
+            self.futures[key] = future
+            return future, True
+
+
+@dataclass
+class DayContext:
+    date: datetime.date
+    bios: List[Dict[str, Any]]
+    research: SharedResearch = field(default_factory=SharedResearch)
+
+    @classmethod
+    def build(cls, target_date: datetime.date, research: Optional[SharedResearch] = None) -> "DayContext":
+        """The context for ``target_date``; batch runs pass one ``research`` to every date they build."""
+        started = time.monotonic()
+        bios = biographies_for_day(target_date)
+        print(f"[GEN] Day context for {target_date}: {len(bios)} biographies ({time.monotonic() - started:.1f}s)")
+        return cls(target_date, bios, research or SharedResearch())
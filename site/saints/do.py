@@ -11,9 +11,16 @@ from google.genai import types
 from pydantic import BaseModel, Field
 
 from saints import settings
+from saints.jobs import register_job, run_job
 from saints.models import CalendarEvent
+from saints.sync import event_row, fetch_document, sync_month_events
 
+SOURCE = "divinumofficium"
 BASE_URL = "https://www.divinumofficium.com/cgi-bin/horas/kalendar.pl"
+CALENDARS = ["Divino Afflatu - 1954", "Rubrics 1960 - 1960"]
+DEFAULT_CALENDARS = ["Rubrics 1960 - 1960"]
+START_YEAR = 2020
+END_YEAR = 2035
 
 
 class FeastName(BaseModel):
@@ -274,60 +281,110 @@ def scrape_divinum_officium(month, year, calendar):
     return all_data
 
 
-def run():
-    date_ranges = generate_date_range(1, 2020, 12, 2035)
-    calendars = ["Divino Afflatu - 1954", "Rubrics 1960 - 1960"]
-    calendars = ["Rubrics 1960 - 1960"]
-    for calendar in calendars:
-        for year, month in date_ranges:
-            print(f"Year: {year}, Month: {month}")
-            data = scrape_divinum_officium(month, year, calendar)
-            for date_str, table in data.items():
-                for row in table:
-                    feasts = row[-1] + row[-2]
-                    middle_step = sorted(
-                        feasts,
-                        key=lambda feast: (
-                            feast["Superior_or_Subordinate"] != "superior",
-                            feast["Temporale_or_Sanctorale"] != "sanctorale",
-                            feast["Order"],
-                        ),
-                    )
-                    first_type = middle_step[0]["Temporale_or_Sanctorale"]
-                    feasts = sorted(
-                        middle_step,
-                        key=lambda feast: (
-                            feast["Superior_or_Subordinate"] != "superior",
-                            feast["Temporale_or_Sanctorale"] != first_type,
-                            feast["Order"],
-                        ),
-                    )
-                    for order, feast in enumerate(feasts):
-                        feasts[order]["Overall_Order"] = order
-                        feasts[order]["Year"] = int(year)
-                        feasts[order]["Month"] = int(month)
-                        feasts[order]["Day"] = int(row[0])
-
-                        calendar_event = CalendarEvent.objects.get_or_create(
-                            month=feasts[order]["Month"],
-                            day=feasts[order]["Day"],
-                            year=feasts[order]["Year"],
-                            english_name=feast["English_Name"],
-                            english_translation=feast["English_Translation"],
-                            latin_name=feast["Latin_Name"],
-                            color=feast["Color"],
-                            latin_notes=feast["Latin_Notes"],
-                            english_notes=feast["English_Notes"],
-                            order=feast["Overall_Order"],
-                            is_primary_for_day=feast["Superior_or_Subordinate"] == "superior",
-                            temporale_or_sanctorale=feast["Temporale_or_Sanctorale"],
-                            latin_rank=feast["Latin_Rank"],
-                            english_rank=feast["English_Rank"],
-                            is_person=feast["Is_Person"],
-                            saint_name=feast["Saint_Name"],
-                            saint_category=feast["Saint_Category"],
-                            saint_categories=json.dumps(feast["Saint_Categories"]),
-                            saint_singular_or_plural=feast["Saint_Singular_or_Plural"],
-                            calendar=calendar,
-                            subcalendar="",
-                        )[0]
+def order_feasts(row):
+    feasts = row[-1] + row[-2]
+    middle_step = sorted(
+        feasts,
+        key=lambda feast: (
+            feast["Superior_or_Subordinate"] != "superior",
+            feast["Temporale_or_Sanctorale"] != "sanctorale",
+            feast["Order"],
+        ),
+    )
+    first_type = middle_step[0]["Temporale_or_Sanctorale"]
+    return sorted(
+        middle_step,
+        key=lambda feast: (
+            feast["Superior_or_Subordinate"] != "superior",
+            feast["Temporale_or_Sanctorale"] != first_type,
+            feast["Order"],
+        ),
+    )
+
+
+def build_event_rows(table, year, month):
+    rows = []
+    for row in table:
+        for order, feast in enumerate(order_feasts(row)):
+            rows.append(
+                event_row(
+                    date(int(year), int(month), int(row[0])),
+                    english_name=feast["English_Name"],
+                    english_translation=feast["English_Translation"],
+                    latin_name=feast["Latin_Name"],
+                    color=feast["Color"],
+                    latin_notes=feast["Latin_Notes"],
+                    english_notes=feast["English_Notes"],
+                    order=order,
+                    is_primary_for_day=feast["Superior_or_Subordinate"] == "superior",
+                    temporale_or_sanctorale=feast["Temporale_or_Sanctorale"],
+                    latin_rank=feast["Latin_Rank"],
+                    english_rank=feast["English_Rank"],
+                    is_person=feast["Is_Person"],
+                    saint_name=feast["Saint_Name"],
+                    saint_category=feast["Saint_Category"],
+                    saint_categories=json.dumps(feast["Saint_Categories"]),
+                    saint_singular_or_plural=feast["Saint_Singular_or_Plural"],
+                    subcalendar="",
+                )
+            )
+    return rows
+
+
+def sync_calendar_month(calendar, year, month, incremental=True, session=None):
+    """Import one month of a Divinum Officium calendar, skipping it when the page is unchanged."""
+    form_data = {"kyear": int(year), "kmonth": int(month), "version": calendar}
+    document = fetch_document(
+        SOURCE,
+        calendar,
+        year,
+        month,
+        BASE_URL,
+        session=session,
+        method="POST",
+        data=form_data,
+        force=not incremental,
+    )
+    if not document.changed:
+        print(f"Unchanged: {calendar} {month}/{year}")
+        return None
+
+    print(f"Year: {year}, Month: {month}")
+    table = parse_calendar_table(BeautifulSoup(document.text, "html.parser"))
+    rows = build_event_rows(table, year, month)
+    counts = sync_month_events(calendar, year, month, rows, key_fields=("latin_name", "temporale_or_sanctorale"))
+    document.mark_synced(len(rows))
+    print(f"Synced {calendar} {month}/{year}: {counts[0]} created, {counts[1]} updated, {counts[2]} deleted")
+    return counts
+
+
+def sync_calendar(calendar, date_ranges, incremental=True):
+    """Import a Divinum Officium calendar month by month, skipping months whose page is unchanged."""
+    session = requests.Session()
+    for year, month in date_ranges:
+        try:
+            sync_calendar_month(calendar, year, month, incremental=incremental, session=session)
+        except requests.RequestException as e:
+            print(f"Failed to fetch {month}/{year}: {e}")
+
+
+def plan_job(params):
+    for calendar in params.get("calendars", DEFAULT_CALENDARS):
+        for year, month in generate_date_range(
+            1, params.get("start_year", START_YEAR), 12, params.get("end_year", END_YEAR)
+        ):
+            yield f"{calendar}:{year}-{month:02d}", {"calendar": calendar, "year": year, "month": month}
+
+
+def handle_unit(payload, params):
+    counts = sync_calendar_month(
+        payload["calendar"], payload["year"], payload["month"], incremental=params.get("incremental", True)
+    )
+    return None if counts is None else dict(zip(("created", "updated", "deleted"), counts))
+
+
+register_job("divinum", plan_job, handle_unit, "Divinum Officium calendars, one unit per calendar month")
+
+
+def run(incremental=False, calendars=DEFAULT_CALENDARS):
+    return run_job("divinum", {"incremental": incremental, "calendars": list(calendars)})
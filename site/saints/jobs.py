@@ -0,0 +1,351 @@
+"""Resumable ingestion jobs backed by a persisted work ledger.
+
+A job type is a *planner*, which splits a run into keyed units of work, plus a
+*handler*, which processes one unit.  Starting a job writes a ``JobRun`` and one
+``WorkUnit`` per planned unit; workers then claim units under a time-limited
+lease (``SELECT ... FOR UPDATE SKIP LOCKED``), so several worker processes can
+share a job and a unit held by a crashed worker is picked up again once its
+lease expires.  Handlers must be idempotent: a unit may run more than once.
+
+Importer modules register their job types when imported; ``load_job_types``
+imports them all so the registry is complete.
+"""
+
+import hashlib
+import importlib
+import os
+import socket
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from saints.models import JobRun, WorkUnit
+
+LEASE_SECONDS = 15 * 60
+MAX_ATTEMPTS = 3
+IDLE_POLL_SECONDS = 5
+
+JOB_MODULES = [
+    "saints.acna",
+    "saints.do",
+    "saints.universalis",
+    "saints.current",
+    "saints.bios",
+]
+
+Planner = Callable[[Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]]
+Handler = Callable[[Dict[str, Any], Dict[str, Any]], Any]
+
+
+@dataclass
+class JobType:
+    name: str
+    plan: Planner
+    handle: Handler
+    description: str = ""
+
+
+JOB_TYPES: Dict[str, JobType] = {}
+
+
+def register_job(name: str, plan: Planner, handle: Handler, description: str = "") -> JobType:
+    """Register a job type.
+
+    ``plan(params)`` yields ``(key, payload)`` pairs, one per unit of work, with
+    keys unique within the job.  ``handle(payload, params)`` processes one unit
+    and may return a JSON-serialisable result to store on the unit.
+    """
+    job_type = JobType(name=name, plan=plan, handle=handle, description=description)
+    JOB_TYPES[name] = job_type
+    return job_type
+
+
+def load_job_types() -> Dict[str, JobType]:
+    for module in JOB_MODULES:
+        importlib.import_module(module)
+    return JOB_TYPES
+
+
+def get_job_type(name: str) -> JobType:
+    if name not in JOB_TYPES:
+        load_job_types()
+    try:
+        return JOB_TYPES[name]
+    except KeyError:
+        raise ValueError(f"Unknown job type {name!r}; registered types: {', '.join(sorted(JOB_TYPES))}")
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def unit_key(key: str) -> str:
+    """``key`` if it fits ``WorkUnit.key``, otherwise a prefix of it and a hash of the whole, which stays unique."""
+    limit = WorkUnit._meta.get_field("key").max_length
+    if len(key) <= limit:
+        return key
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return f"{key[:limit - len(digest) - 1]}#{digest}"
+
+
+def start_job(name: str, params: Optional[Dict[str, Any]] = None, max_attempts: int = MAX_ATTEMPTS) -> JobRun:
+    """Plan a new run of job type ``name`` and persist its units."""
+    job_type = get_job_type(name)
+    params = params or {}
+    with transaction.atomic():
+        job = JobRun.objects.create(job_type=name, params=params, max_attempts=max_attempts)
+        units = []
+        seen = set()
+        for key, payload in job_type.plan(params):
+            key = unit_key(key)
+            if key in seen:
+                continue
+            seen.add(key)
+            units.append(WorkUnit(job=job, key=key, payload=payload, position=len(units)))
+        WorkUnit.objects.bulk_create(units, batch_size=1000)
+    print(f"Started {job_type.name} job {job.pk} with {len(units)} units")
+    return job
+
+
+def claimable_units(job: JobRun, now=None):
+    """Units a worker may take: pending, retryable failures, and running units whose lease has expired."""
+    now = now or timezone.now()
+    return WorkUnit.objects.filter(job=job, attempts__lt=job.max_attempts).filter(
+        Q(status=WorkUnit.STATUS_PENDING)
+        | Q(status=WorkUnit.STATUS_FAILED)
+        | Q(status=WorkUnit.STATUS_RUNNING, lease_expires__lt=now)
+    )
+
+
+def claim_units(job: JobRun, worker_id: str, limit: int = 1, lease_seconds: int = LEASE_SECONDS) -> List[WorkUnit]:
+    """Lease up to ``limit`` units to ``worker_id``; rows locked by another worker are skipped, not waited on."""
+    now = timezone.now()
+    with transaction.atomic():
+        units = list(claimable_units(job, now).select_for_update(skip_locked=True).order_by("position")[:limit])
+        for unit in units:
+            unit.status = WorkUnit.STATUS_RUNNING
+            unit.leased_by = worker_id
+            unit.lease_expires = now + timedelta(seconds=lease_seconds)
+            unit.attempts += 1
+            unit.started_at = now
+        if units:
+            WorkUnit.objects.bulk_update(units, ["status", "leased_by", "lease_expires", "attempts", "started_at"])
+    return units
+
+
+def renew_lease(unit: WorkUnit, worker_id: str, lease_seconds: int = LEASE_SECONDS) -> bool:
+    """Extend a held lease; returns ``False`` if the unit has since been taken over by another worker."""
+    return bool(
+        WorkUnit.objects.filter(pk=unit.pk, leased_by=worker_id, status=WorkUnit.STATUS_RUNNING).update(
+            lease_expires=timezone.now() + timedelta(seconds=lease_seconds)
+        )
+    )
+
+
+def complete_unit(unit: WorkUnit, worker_id: str, result: Any = None) -> None:
+    WorkUnit.objects.filter(pk=unit.pk, leased_by=worker_id).update(
+        status=WorkUnit.STATUS_DONE,
+        result=result,
+        last_error="",
+        lease_expires=None,
+        finished_at=timezone.now(),
+    )
+
+
+def fail_unit(unit: WorkUnit, worker_id: str, error: str) -> None:
+    WorkUnit.objects.filter(pk=unit.pk, leased_by=worker_id).update(
+        status=WorkUnit.STATUS_FAILED,
+        last_error=error,
+        lease_expires=None,
+        finished_at=timezone.now(),
+    )
+
+
+class LeaseKeeper(threading.Thread):
+    """Renews a unit's lease in the background while its handler runs, so long units are not stolen."""
+
+    def __init__(self, unit: WorkUnit, worker_id: str, lease_seconds: int):
+        super().__init__(daemon=True)
+        self.unit = unit
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.stopped = threading.Event()
+
+    def run(self):
+        try:
+            while not self.stopped.wait(max(1, self.lease_seconds // 3)):
+                if not renew_lease(self.unit, self.worker_id, self.lease_seconds):
+                    return
+        finally:
+            connection.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def unit_counts(job: JobRun) -> Dict[str, int]:
+    counts = {status: 0 for status, _ in WorkUnit.STATUS_CHOICES}
+    for row in job.units.order_by().values("status").annotate(total=Count("pk")):
+        counts[row["status"]] = row["total"]
+    return counts
+
+
+def refresh_job_status(job: JobRun) -> JobRun:
+    """Mark the job finished once no unit is outstanding: completed if all succeeded, failed otherwise."""
+    # A worker that died on its last permitted attempt leaves a lease nobody may reclaim
+    job.units.filter(
+        status=WorkUnit.STATUS_RUNNING, lease_expires__lt=timezone.now(), attempts__gte=job.max_attempts
+    ).update(status=WorkUnit.STATUS_FAILED, last_error="Lease expired on final attempt", lease_expires=None)
+    if claimable_units(job).exists() or job.units.filter(status=WorkUnit.STATUS_RUNNING).exists():
+        return job
+    exhausted = job.units.filter(status=WorkUnit.STATUS_FAILED).exists()
+    job.status = JobRun.STATUS_FAILED if exhausted else JobRun.STATUS_COMPLETED
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at", "updated"])
+    return job
+
+
+def run_unit(job: JobRun, job_type: JobType, unit: WorkUnit, worker_id: str, lease_seconds: int) -> bool:
+    keeper = LeaseKeeper(unit, worker_id, lease_seconds)
+    keeper.start()
+    started = time.monotonic()
+    try:
+        result = job_type.handle(unit.payload, job.params)
+    except Exception as e:
+        keeper.stop()
+        fail_unit(unit, worker_id, f"{type(e).__name__}: {e}\n{traceback.format_exc()}")
+        print(f"Failed {unit.key} (attempt {unit.attempts}/{job.max_attempts}): {type(e).__name__}: {e}")
+        return False
+    keeper.stop()
+    complete_unit(unit, worker_id, result)
+    print(f"Done {unit.key} in {time.monotonic() - started:.1f}s")
+    return True
+
+
+class Progress:
+    """Thread-safe tally of processed units with throughput and an ETA for the units outstanding at the start."""
+
+    def __init__(self, total: int, max_units: Optional[int] = None):
+        self.total = total if max_units is None else min(total, max_units)
+        self.max_units = max_units
+        self.claimed = 0
+        self.counts = {"done": 0, "failed": 0}
+        self.retries = 0
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> bool:
+        """Book a slot for one more unit, unless ``max_units`` have already been taken."""
+        with self.lock:
+            if self.max_units is not None and self.claimed >= self.max_units:
+                return False
+            self.claimed += 1
+            return True
+
+    def release(self) -> None:
+        with self.lock:
+            self.claimed -= 1
+
+    def record(self, ok: bool, will_retry: bool = False) -> None:
+        with self.lock:
+            self.counts["done" if ok else "failed"] += 1
+            self.retries += will_retry
+            print(self.summary())
+
+    def summary(self) -> str:
+        finished = self.counts["done"] + self.counts["failed"] - self.retries
+        elapsed = time.monotonic() - self.started
+        rate = finished / elapsed if elapsed else 0.0
+        line = (
+            f"Progress: {finished}/{self.total} units ({self.counts['failed'] - self.retries} failed, "
+            f"{self.retries} retries), {rate * 60:.1f}/min"
+        )
+        remaining = self.total - finished
+        if rate and remaining > 0:
+            line += f", ETA {timedelta(seconds=round(remaining / rate))}"
+        return line
+
+
+def _work_loop(
+    job: JobRun, job_type: JobType, worker_id: str, lease_seconds: int, wait: bool, progress: Progress
+) -> None:
+    while progress.reserve():
+        close_old_connections()
+        units = claim_units(job, worker_id, limit=1, lease_seconds=lease_seconds)
+        if not units:
+            progress.release()
+            if wait and job.units.filter(status=WorkUnit.STATUS_RUNNING).exclude(leased_by=worker_id).exists():
+                time.sleep(IDLE_POLL_SECONDS)
+                continue
+            return
+        ok = run_unit(job, job_type, units[0], worker_id, lease_seconds)
+        progress.record(ok, will_retry=not ok and units[0].attempts < job.max_attempts)
+
+
+def _work_thread(*args) -> None:
+    try:
+        _work_loop(*args)
+    finally:
+        connection.close()
+
+
+def work(
+    job: JobRun,
+    worker_id: Optional[str] = None,
+    lease_seconds: int = LEASE_SECONDS,
+    max_units: Optional[int] = None,
+    wait: bool = False,
+    concurrency: int = 1,
+) -> Dict[str, int]:
+    """Claim and process units of ``job`` until none are left (or ``max_units`` have been processed).
+
+    With ``concurrency`` above one, that many threads claim and process units
+    side by side, each under its own worker id; this is the global cap on units
+    in flight, while per-provider quotas are left to ``saints.ratelimit``.
+
+    When other workers still hold leases, ``wait`` keeps polling so this worker can
+    pick up their units if they die; otherwise it returns as soon as nothing is claimable.
+    """
+    job_type = get_job_type(job.job_type)
+    worker_id = worker_id or default_worker_id()
+    progress = Progress(claimable_units(job).count(), max_units)
+    if concurrency <= 1:
+        _work_loop(job, job_type, worker_id, lease_seconds, wait, progress)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"{job.job_type}-worker") as pool:
+            threads = [
+                pool.submit(_work_thread, job, job_type, f"{worker_id}/{i}", lease_seconds, wait, progress)
+                for i in range(concurrency)
+            ]
+            for thread in threads:
+                thread.result()
+    refresh_job_status(job)
+    return dict(progress.counts)
+
+
+def resume_job(job: JobRun, reset_failed: bool = False) -> JobRun:
+    """Reopen a job so workers pick it up again, optionally giving exhausted units a fresh set of attempts."""
+    if reset_failed:
+        job.units.filter(status=WorkUnit.STATUS_FAILED).update(status=WorkUnit.STATUS_PENDING, attempts=0)
+    job.status = JobRun.STATUS_RUNNING
+    job.finished_at = None
+    job.save(update_fields=["status", "finished_at", "updated"])
+    return job
+
+
+def run_job(name: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> JobRun:
+    """Start a job and work it to completion in this process."""
+    job = start_job(name, params)
+    processed = work(job, **kwargs)
+    job.refresh_from_db()
+    print(f"{name} job {job.pk} {job.status}: {processed['done']} done, {processed['failed']} failed")
+    return job
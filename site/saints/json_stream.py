@@ -0,0 +1,63 @@
+"""Incremental extraction of array items from a JSON object that is still being streamed.
+
+A script streamed from an LLM arrives as text deltas of one JSON object, e.g.
+``{"lines": [{"PodcastHostName": "John", "Content": "..."}, ...]}``.
+``ArrayItemStream("lines")`` is fed those deltas and returns each object in
+the ``lines`` array as soon as its closing brace arrives, so its dialogue can
+be synthesized while the model is still writing the rest.  It only tracks
+strings, escapes and nesting depth; each finished item is decoded with
+``json.loads``, and the complete text should still be validated at the end.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+class ArrayItemStream:
+    def __init__(self, key: str):
+        self.key = key
+        self.text = ""
+        self.position = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.string_start = 0
+        self.last_string = ""
+        self.current_key: Optional[str] = None
+        self.in_array = False
+        self.item_start: Optional[int] = None
+
+    def feed(self, delta: str) -> List[Dict[str, Any]]:
+        """Add the next piece of text; returns the array items it completed."""
+        self.text += delta
+        items = []
+        while self.position < len(self.text):
+            ch = self.text[self.position]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+                    self.last_string = self.text[self.string_start : self.position + 1]
+            elif ch == '"':
+                self.in_string = True
+                self.string_start = self.position
+            elif ch == ":" and self.depth == 1:
+                self.current_key = json.loads(self.last_string)
+            elif ch in "{[":
+                self.depth += 1
+                if ch == "[" and self.depth == 2 and self.current_key == self.key:
+                    self.in_array = True
+                elif ch == "{" and self.in_array and self.depth == 3:
+                    self.item_start = self.position
+            elif ch in "}]":
+                if ch == "}" and self.in_array and self.depth == 3 and self.item_start is not None:
+                    items.append(json.loads(self.text[self.item_start : self.position + 1]))
+                    self.item_start = None
+                elif ch == "]" and self.in_array and self.depth == 2:
+                    self.in_array = False
+                self.depth -= 1
+            self.position += 1
+        return items
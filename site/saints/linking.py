@@ -0,0 +1,228 @@
+"""Linking calendar events to biographies by name.
+
+Events and biographies both store a ``name_key`` (see ``saints.names``), so
+exact matches are an indexed equality lookup (``link_biography``).  Names that
+differ slightly between calendars and years ("St. John Bosco" / "John Bosco,
+Priest") are matched by trigram similarity of their keys, in the manner of
+PostgreSQL's ``pg_trgm``:
+
+* ``propose_links`` takes every distinct unlinked ``(name_key, calendar)`` and
+  ranks candidate biographies of the same calendar by similarity.  On
+  PostgreSQL this is one query using the trigram index on
+  ``Biography.name_key``; elsewhere the same scores are computed in Python.
+* ``accepted`` keeps the proposals whose best candidate is both good enough and
+  clearly better than the runner-up, and ``apply_links`` writes them in one
+  UPDATE.
+
+Anything not accepted is left for review with its candidate scores.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.db import connection, transaction
+
+from saints.models import Biography, CalendarEvent
+
+# Biographies are generated per calendar; the traditional ones cover both pre-1970 calendars
+EVENT_CALENDARS: Dict[str, List[str]] = {
+    "traditional": ["Divino Afflatu - 1954", "Rubrics 1960 - 1960"],
+}
+
+# pg_trgm's default similarity threshold; candidates below it are not considered at all
+CANDIDATE_THRESHOLD = 0.3
+MIN_SCORE = 0.6
+# Required lead of the best candidate over the second best, so near-ties are left for review
+MIN_MARGIN = 0.1
+
+
+def event_calendars(calendar: str) -> List[str]:
+    """The ``CalendarEvent.calendar`` values covered by biographies of ``calendar``."""
+    return EVENT_CALENDARS.get(calendar, [calendar])
+
+
+def biography_calendar(event_calendar: str) -> str:
+    for calendar, event_calendar_names in EVENT_CALENDARS.items():
+        if event_calendar in event_calendar_names:
+            return calendar
+    return event_calendar
+
+
+def link_biography(biography: Biography) -> int:
+    """Point every event whose name key equals the biography's, in the calendars it covers, at it."""
+    return CalendarEvent.objects.filter(
+        name_key=biography.name_key, calendar__in=event_calendars(biography.calendar)
+    ).update(biography=biography)
+
+
+def trigrams(key: str) -> Set[str]:
+    """The trigrams ``pg_trgm`` extracts from an already normalised key: each word padded with two spaces
+    in front and one behind."""
+    grams = set()
+    for word in key.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """Shared trigrams over all distinct trigrams, as ``pg_trgm``'s ``similarity()``."""
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+@dataclass
+class Candidate:
+    biography_id: str
+    name: str
+    score: float
+
+
+@dataclass
+class Proposal:
+    """The unlinked events sharing one name key in one calendar, and the biographies they might belong to."""
+
+    name_key: str
+    calendar: str
+    english_name: str
+    events: int
+    candidates: List[Candidate] = field(default_factory=list)
+
+    @property
+    def best(self) -> Optional[Candidate]:
+        return self.candidates[0] if self.candidates else None
+
+    def margin(self) -> float:
+        if not self.candidates:
+            return 0.0
+        runner_up = self.candidates[1].score if len(self.candidates) > 1 else 0.0
+        return self.candidates[0].score - runner_up
+
+    def is_accepted(self, min_score: float = MIN_SCORE, min_margin: float = MIN_MARGIN) -> bool:
+        return bool(self.candidates) and self.best.score >= min_score and self.margin() >= min_margin
+
+
+def _unlinked(calendars: Optional[Iterable[str]] = None):
+    events = CalendarEvent.objects.filter(biography__isnull=True, name_key__isnull=False).exclude(name_key="")
+    if calendars:
+        events = events.filter(calendar__in=list(calendars))
+    return events
+
+
+PROPOSALS_SQL = """
+WITH unlinked AS (
+    SELECT name_key, calendar, MIN(english_name) AS english_name, COUNT(*) AS events,
+           CASE calendar {calendar_cases} ELSE calendar END AS biography_calendar
+    FROM saints_calendarevent
+    WHERE biography_id IS NULL AND name_key IS NOT NULL AND name_key <> '' {calendar_filter}
+    GROUP BY name_key, calendar
+)
+SELECT u.name_key, u.calendar, u.english_name, u.events, c.uuid, c.name, c.score
+FROM unlinked u
+LEFT JOIN LATERAL (
+    SELECT b.uuid, b.name, similarity(b.name_key, u.name_key) AS score
+    FROM saints_biography b
+    WHERE b.name_key %% u.name_key AND b.calendar = u.biography_calendar
+    ORDER BY score DESC, b.name
+    LIMIT %s
+) c ON TRUE
+ORDER BY u.calendar, u.name_key, c.score DESC
+"""
+
+
+def _proposals_sql(calendars, limit: int, threshold: float) -> List[Proposal]:
+    cases = []
+    params: List[object] = []
+    for calendar, event_calendar_names in EVENT_CALENDARS.items():
+        for event_calendar in event_calendar_names:
+            cases.append("WHEN %s THEN %s")
+            params += [event_calendar, calendar]
+    calendar_filter = ""
+    if calendars:
+        calendar_filter = "AND calendar = ANY(%s)"
+        params.append(list(calendars))
+    params.append(limit)
+    sql = PROPOSALS_SQL.format(calendar_cases=" ".join(cases), calendar_filter=calendar_filter)
+
+    proposals: Dict[tuple, Proposal] = {}
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Scoped to this transaction; the % operator (and so the trigram index) uses it as its cut-off
+        cursor.execute("SELECT set_config('pg_trgm.similarity_threshold', %s, true)", [str(threshold)])
+        cursor.execute(sql, params)
+        for key, calendar, english_name, events, biography_id, name, score in cursor.fetchall():
+            proposal = proposals.setdefault((key, calendar), Proposal(key, calendar, english_name, events))
+            if biography_id is not None:
+                proposal.candidates.append(Candidate(str(biography_id), name, round(score, 3)))
+    return list(proposals.values())
+
+
+def _proposals_python(calendars, limit: int, threshold: float) -> List[Proposal]:
+    biographies: Dict[str, list] = {}
+    for pk, name, key, calendar in Biography.objects.exclude(name_key=None).values_list(
+        "pk", "name", "name_key", "calendar"
+    ):
+        biographies.setdefault(calendar, []).append((str(pk), name, key))
+
+    groups = {}
+    for key, calendar, english_name in _unlinked(calendars).values_list("name_key", "calendar", "english_name"):
+        group = groups.setdefault((key, calendar), [english_name, 0])
+        group[0] = min(group[0], english_name)
+        group[1] += 1
+
+    proposals = []
+    for (key, calendar), (english_name, events) in sorted(groups.items(), key=lambda item: (item[0][1], item[0][0])):
+        scored = [
+            Candidate(pk, name, round(similarity(key, biography_key), 3))
+            for pk, name, biography_key in biographies.get(biography_calendar(calendar), [])
+        ]
+        scored = sorted((c for c in scored if c.score >= threshold), key=lambda c: (-c.score, c.name))
+        proposals.append(Proposal(key, calendar, english_name, events, scored[:limit]))
+    return proposals
+
+
+def propose_links(
+    calendars: Optional[Iterable[str]] = None, limit: int = 3, threshold: float = CANDIDATE_THRESHOLD
+) -> List[Proposal]:
+    """Up to ``limit`` candidate biographies, best first, for each unlinked name key and calendar."""
+    calendars = list(calendars or [])
+    if connection.vendor == "postgresql":
+        return _proposals_sql(calendars, limit, threshold)
+    return _proposals_python(calendars, limit, threshold)
+
+
+def accepted(proposals: Iterable[Proposal], min_score: float = MIN_SCORE, min_margin: float = MIN_MARGIN):
+    return [proposal for proposal in proposals if proposal.is_accepted(min_score, min_margin)]
+
+
+def apply_links(proposals: Iterable[Proposal]) -> int:
+    """Link the still-unlinked events of each proposal to its best candidate; returns the events linked.
+
+    On PostgreSQL this is a single UPDATE joined against the proposals; other
+    backends get one UPDATE per proposal in a single transaction.
+    """
+    proposals = [proposal for proposal in proposals if proposal.best]
+    if not proposals:
+        return 0
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE saints_calendarevent e SET biography_id = m.biography_id "
+                "FROM unnest(%s::text[], %s::text[], %s::uuid[]) AS m(name_key, calendar, biography_id) "
+                "WHERE e.name_key = m.name_key AND e.calendar = m.calendar AND e.biography_id IS NULL",
+                [
+                    [proposal.name_key for proposal in proposals],
+                    [proposal.calendar for proposal in proposals],
+                    [proposal.best.biography_id for proposal in proposals],
+                ],
+            )
+            return cursor.rowcount
+
+    linked = 0
+    with transaction.atomic():
+        for proposal in proposals:
+            linked += CalendarEvent.objects.filter(
+                name_key=proposal.name_key, calendar=proposal.calendar, biography__isnull=True
+            ).update(biography_id=proposal.best.biography_id)
+    return linked
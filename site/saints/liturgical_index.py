@@ -0,0 +1,162 @@
+"""Precomputed liturgical coordinates for every day from 1900 to 2100.
+
+The index holds one small integer array per coordinate (liturgical year, season,
+week of season, Sunday and weekday cycle) with one slot per day, plus the First
+Sunday of Advent for each year, so a lookup is an array subscript.  It is loaded
+from ``data/liturgical_index.npz`` when present (regenerate it with the
+``build_liturgical_index`` command) and otherwise computed from
+``saints.roman_calendar`` on first use, once per process.
+
+``liturgical_year`` is the calendar year in which a liturgical year ends, which
+is what the Sunday and weekday cycles are keyed on; ``start_year`` is the year
+its Advent begins, which is how the site labels liturgical years.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from saints import roman_calendar
+
+INDEX_PATH = Path(__file__).resolve().parent / "data" / "liturgical_index.npz"
+FORMAT_VERSION = 1
+ORIGIN = np.datetime64(f"{roman_calendar.FIRST_YEAR}-01-01", "D")
+
+
+@dataclass(frozen=True)
+class LiturgicalDay:
+    date: date
+    liturgical_year: int
+    season: int
+    week: int
+    sunday_cycle: str
+    weekday_cycle: str
+
+    @property
+    def season_name(self) -> str:
+        return roman_calendar.SEASON_NAMES[self.season]
+
+    @property
+    def start_year(self) -> int:
+        return self.liturgical_year - 1
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "date": self.date,
+            "liturgical_year": self.liturgical_year,
+            "season": self.season_name,
+            "week": self.week,
+            "sunday_cycle": self.sunday_cycle,
+            "weekday_cycle": self.weekday_cycle,
+        }
+
+
+class LiturgicalIndex:
+    def __init__(self, liturgical_year, season, week, advent):
+        self.liturgical_year = liturgical_year
+        self.season = season
+        self.week = week
+        self.sunday_cycle = ((liturgical_year + 2) % 3).astype(np.int8)
+        self.weekday_cycle = (liturgical_year % 2).astype(np.int8)
+        self.advent = advent
+        self.first_year = roman_calendar.FIRST_YEAR
+        self.last_year = roman_calendar.LAST_YEAR
+
+    @classmethod
+    def build(cls) -> "LiturgicalIndex":
+        table = roman_calendar.compute_days(roman_calendar.FIRST_YEAR, roman_calendar.LAST_YEAR)
+        keys = roman_calendar.key_dates(np.arange(roman_calendar.FIRST_YEAR, roman_calendar.LAST_YEAR + 1))
+        return cls(table.liturgical_year, table.season, table.week, keys.advent)
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> "LiturgicalIndex":
+        with np.load(path) as data:
+            if int(data["version"]) != FORMAT_VERSION:
+                raise ValueError(f"{path} has format version {int(data['version'])}, expected {FORMAT_VERSION}")
+            return cls(data["liturgical_year"], data["season"], data["week"], data["advent"])
+
+    def save(self, path: Path = INDEX_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            version=np.int16(FORMAT_VERSION),
+            liturgical_year=self.liturgical_year,
+            season=self.season,
+            week=self.week,
+            advent=self.advent,
+        )
+
+    def _offset(self, day: date) -> int:
+        offset = (day - date(self.first_year, 1, 1)).days
+        if not 0 <= offset < len(self.season):
+            raise ValueError(f"{day} is outside {self.first_year}-{self.last_year}")
+        return offset
+
+    def lookup(self, day: date) -> LiturgicalDay:
+        i = self._offset(day)
+        return LiturgicalDay(
+            date=day,
+            liturgical_year=int(self.liturgical_year[i]),
+            season=int(self.season[i]),
+            week=int(self.week[i]),
+            sunday_cycle=roman_calendar.SUNDAY_CYCLES[self.sunday_cycle[i]],
+            weekday_cycle=roman_calendar.WEEKDAY_CYCLES[self.weekday_cycle[i]],
+        )
+
+    def lookup_many(self, days: Iterable) -> Dict[str, np.ndarray]:
+        """Vectorised lookup: ``days`` may be dates, ISO strings or ``datetime64`` values."""
+        offsets = (np.asarray(days, dtype="datetime64[D]") - ORIGIN).astype(np.int64)
+        if offsets.size and (offsets.min() < 0 or offsets.max() >= len(self.season)):
+            raise ValueError(f"Dates must be within {self.first_year}-{self.last_year}")
+        return {
+            "liturgical_year": self.liturgical_year[offsets],
+            "season": self.season[offsets],
+            "week": self.week[offsets],
+            "sunday_cycle": self.sunday_cycle[offsets],
+            "weekday_cycle": self.weekday_cycle[offsets],
+        }
+
+    def first_sunday_of_advent(self, year: int) -> date:
+        if self.first_year <= year <= self.last_year:
+            return self.advent[year - self.first_year].item()
+        return roman_calendar.key_dates([year]).advent[0].item()
+
+    def start_year(self, day: date) -> int:
+        """Calendar year in which the liturgical year containing ``day`` began."""
+        if self.first_year <= day.year <= self.last_year:
+            return int(self.liturgical_year[self._offset(day)]) - 1
+        return day.year if day >= self.first_sunday_of_advent(day.year) else day.year - 1
+
+    def year_bounds(self, start_year: int) -> Tuple[date, date]:
+        """First and last day of the liturgical year that begins in Advent of ``start_year``."""
+        return self.first_sunday_of_advent(start_year), self.first_sunday_of_advent(start_year + 1) - timedelta(days=1)
+
+
+@lru_cache(maxsize=1)
+def get_index() -> LiturgicalIndex:
+    if INDEX_PATH.exists():
+        try:
+            return LiturgicalIndex.load()
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Rebuilding liturgical index, could not load {INDEX_PATH}: {e}")
+    return LiturgicalIndex.build()
+
+
+def lookup(day: date) -> LiturgicalDay:
+    return get_index().lookup(day)
+
+
+def first_sunday_of_advent(year: int) -> date:
+    return get_index().first_sunday_of_advent(year)
+
+
+def liturgical_year_start(day: date) -> int:
+    return get_index().start_year(day)
+
+
+def liturgical_year_bounds(start_year: int) -> Tuple[date, date]:
+    return get_index().year_bounds(start_year)
@@ -0,0 +1,174 @@
+import contextlib
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, replace
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from saints import day_context, kidspodcasts, podcasts, settings
+from saints.models import Podcast
+from saints.podcast_generator import ServicesConfig
+
+GENERATORS = {
+    "saints_and_seasons": podcasts._get_generator,
+    "saintly_adventures": kidspodcasts._get_generator,
+}
+# Used when the database has no biographies for the date
+SYNTHETIC_BIOS = [
+    {"name": "Saint Martin of Tours", "biography": "Soldier, monk and bishop who shared his cloak with a beggar."},
+    {"name": "Saint Cecilia", "biography": "Roman virgin martyr, patron of musicians."},
+]
+LATENCY_OPTIONS = {
+    "llm_seconds": "OFFLINE_LLM_SECONDS",
+    "llm_chars_per_second": "OFFLINE_LLM_CHARS_PER_SECOND",
+    "search_seconds": "OFFLINE_SEARCH_SECONDS",
+    "tts_seconds": "OFFLINE_TTS_SECONDS",
+    "script_lines": "OFFLINE_SCRIPT_LINES",
+}
+
+
+def max_rss() -> int:
+    """The process's peak resident set size in bytes (Linux reports KiB, macOS bytes)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def children_cpu() -> float:
+    """CPU seconds used by finished subprocesses (ffmpeg)."""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+@dataclass
+class StageUsage:
+    stage: str
+    wall: float
+    # CPU seconds of this process (every thread) and of the subprocesses it waited for
+    cpu: float
+    child_cpu: float
+    # Peak Python allocations during the stage (0 without memory tracing) and the process's RSS high-water mark
+    python_peak: int
+    max_rss: int
+
+
+class StageMeter:
+    """A ``measure`` hook for ``create_full_podcast`` that records each stage's time, CPU and memory."""
+
+    def __init__(self):
+        self.stages = []
+
+    @contextlib.contextmanager
+    def __call__(self, stage):
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        wall, cpu, child_cpu = time.perf_counter(), time.process_time(), children_cpu()
+        try:
+            yield
+        finally:
+            self.stages.append(
+                StageUsage(
+                    stage,
+                    time.perf_counter() - wall,
+                    time.process_time() - cpu,
+                    children_cpu() - child_cpu,
+                    tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0,
+                    max_rss(),
+                )
+            )
+
+
+class Command(BaseCommand):
+    help = (
+        "Run create_full_podcast end to end against the offline stand-ins (saints.offline) for the LLM, search "
+        "and TTS, and report each stage's wall time, CPU and memory. Nothing it writes is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--show", choices=sorted(GENERATORS), default="saints_and_seasons")
+        parser.add_argument("--date", help="Episode date (YYYY-MM-DD); defaults to tomorrow in US Eastern time.")
+        parser.add_argument("--runs", type=int, default=1)
+        parser.add_argument("--llm-seconds", type=float, help="Simulated LLM latency before the first output.")
+        parser.add_argument("--llm-chars-per-second", type=float, help="Simulated LLM output speed.")
+        parser.add_argument("--search-seconds", type=float, help="Simulated latency of one search.")
+        parser.add_argument("--tts-seconds", type=float, help="Simulated latency of one dialogue batch.")
+        parser.add_argument("--script-lines", type=int, help="Lines in the offline script.")
+        parser.add_argument("--no-stream", action="store_true", help="Write the whole script before synthesizing it.")
+        parser.add_argument(
+            "--no-trace-memory",
+            action="store_true",
+            help="Skip tracemalloc (Python peak memory), which slows allocation-heavy stages.",
+        )
+
+    def write_usage(self, usage):
+        self.stdout.write(
+            f"{usage.stage:>12}: {usage.wall:7.2f}s wall  {usage.cpu:6.2f}s CPU  {usage.child_cpu:6.2f}s ffmpeg CPU  "
+            f"{usage.python_peak / 1_000_000:7.1f} MB Python peak  {usage.max_rss / 1_000_000:7.1f} MB max RSS"
+        )
+
+    def run_once(self, options, target_date):
+        generator = GENERATORS[options["show"]]()
+        config = generator.config
+        config.ai = replace(config.ai, provider="offline", model="offline")
+        if options["no_stream"]:
+            config.ai.stream_script = False
+        config.services = ServicesConfig(search="offline", tts="offline")
+
+        meter = StageMeter()
+        path = None
+        with transaction.atomic():
+            Podcast.objects.get_or_create(
+                slug=config.linkage.podcast_slug, defaults={"title": options["show"], "religion": "catholic"}
+            )
+            bios = day_context.biographies_for_day(target_date) or SYNTHETIC_BIOS
+            context = day_context.DayContext(target_date, bios)
+            wall, cpu, child_cpu = time.perf_counter(), time.process_time(), children_cpu()
+            try:
+                path = generator.create_full_podcast(target_date, context=context, measure=meter)
+            finally:
+                # Episode, checkpoints and everything else the run wrote to the database go, and its audio
+                transaction.set_rollback(True)
+                if path:
+                    default_storage.delete(path)
+        total = StageUsage(
+            "total",
+            time.perf_counter() - wall,
+            time.process_time() - cpu,
+            children_cpu() - child_cpu,
+            max((usage.python_peak for usage in meter.stages), default=0),
+            max_rss(),
+        )
+        return meter.stages + [total]
+
+    def handle(self, *args, **options):
+        target_date = parse_date(options["date"]) if options["date"] else day_context.next_episode_date()
+        if not target_date:
+            raise CommandError(f"Invalid --date: {options['date']}")
+        for option, name in LATENCY_OPTIONS.items():
+            if options[option] is not None:
+                setattr(settings, name, options[option])
+        self.stdout.write(
+            f"Offline {options['show']} for {target_date}: LLM {settings.OFFLINE_LLM_SECONDS}s + "
+            f"{settings.OFFLINE_LLM_CHARS_PER_SECOND:.0f} chars/s, search {settings.OFFLINE_SEARCH_SECONDS}s, "
+            f"TTS {settings.OFFLINE_TTS_SECONDS}s per batch, {settings.OFFLINE_SCRIPT_LINES} script lines"
+        )
+
+        if not options["no_trace_memory"]:
+            tracemalloc.start()
+        try:
+            runs = [self.run_once(options, target_date) for _ in range(options["runs"])]
+        finally:
+            tracemalloc.stop()
+
+        for index, stages in enumerate(runs, 1):
+            self.stdout.write(f"Run {index}:")
+            for usage in stages:
+                self.write_usage(usage)
+        totals = [stages[-1].wall for stages in runs]
+        self.stdout.write(
+            self.style.SUCCESS(f"⏱️ {len(runs)} runs: fastest {min(totals):.2f}s, slowest {max(totals):.2f}s")
+        )
@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from saints.liturgical_index import INDEX_PATH, LiturgicalIndex
+
+
+class Command(BaseCommand):
+    help = "Rebuild the shipped liturgical date index (saints/data/liturgical_index.npz)."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        index = LiturgicalIndex.build()
+        index.save()
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Wrote {len(index.season)} days ({index.first_year}-{index.last_year}) to {INDEX_PATH} "
+                f"in {elapsed:.0f} ms ({INDEX_PATH.stat().st_size / 1024:.0f} KiB)"
+            )
+        )
@@ -1,44 +1,86 @@
-from django.core.management.base import BaseCommand
+import time
+
 from django.apps import apps
+from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.db.models import Exists, OuterRef
 from saints.models import Biography
 
+BATCH_SIZE = 1000
+
+
 class Command(BaseCommand):
     help = "Deletes any rows with orphaned biography_id foreign keys."
 
-    def handle(self, *args, **options):
-        biography_uuids = set(Biography.objects.values_list('uuid', flat=True))
-        total_deleted = 0
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows would be deleted.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Rows deleted per transaction, so locks are only held briefly.",
+        )
 
+    def biography_fields(self):
         for model in apps.get_models():
-            if not hasattr(model, '_meta'):
-                continue
-
-            fields = {f.name: f for f in model._meta.fields}
+            for field in model._meta.fields:
+                if field.is_relation and field.related_model is Biography:
+                    yield model, field
 
-            if 'biography' not in fields:
-                continue
+    def orphans(self, model, field):
+        """Rows whose biography reference points at no Biography, as a NOT EXISTS anti-join."""
+        biography = Biography.objects.filter(pk=OuterRef(field.attname))
+        return model._default_manager.filter(**{f"{field.name}__isnull": False}).filter(~Exists(biography))
 
-            field = fields['biography']
-            if not getattr(field, 'remote_field', None):
-                continue
+    def delete_in_batches(self, model, field, batch_size):
+        """Delete orphans in primary-key order, one short transaction per batch, without loading them all.
 
-            if getattr(field.remote_field.model, '__name__', '') != 'Biography':
-                continue
+        Returns the orphans deleted and the dependent rows removed with them by cascades.
+        """
+        deleted = 0
+        cascaded = 0
+        last_pk = None
+        while True:
+            batch = self.orphans(model, field).order_by("pk")
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            pks = list(batch.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                return deleted, cascaded
+            with transaction.atomic():
+                # Re-check inside the transaction in case a biography was restored meanwhile
+                count, per_model = self.orphans(model, field).filter(pk__in=pks).delete()
+            rows = per_model.get(model._meta.label, 0)
+            deleted += rows
+            cascaded += count - rows
+            last_pk = pks[-1]
+            self.stdout.write(f"   … deleted {deleted} so far")
 
-            self.stdout.write(f"\n🔍 Checking model: {model.__name__}")
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        total = 0
+        started = time.perf_counter()
 
-            # Exclude rows with null biography_id
-            qs = model.objects.exclude(biography__isnull=True)
-            orphaned = qs.exclude(biography_id__in=biography_uuids)
+        for model, field in self.biography_fields():
+            self.stdout.write(f"\n🔍 Checking model: {model.__name__}.{field.name}")
+            model_started = time.perf_counter()
+            cascaded = 0
+            if dry_run:
+                count = self.orphans(model, field).count()
+            else:
+                count, cascaded = self.delete_in_batches(model, field, options["batch_size"])
+            elapsed = time.perf_counter() - model_started
 
-            count = orphaned.count()
-            if count > 0:
-                with transaction.atomic():
-                    orphaned.delete()
-                self.stdout.write(f"❌ Deleted {count} orphaned rows from {model.__name__}")
-                total_deleted += count
+            if count:
+                verb = "Would delete" if dry_run else "Deleted"
+                self.stdout.write(f"❌ {verb} {count} orphaned rows from {model.__name__} ({elapsed:.2f}s)")
+                if cascaded:
+                    self.stdout.write(f"   … and {cascaded} dependent rows by cascade")
+                total += count
             else:
-                self.stdout.write(f"✅ No orphaned rows in {model.__name__}")
+                self.stdout.write(f"✅ No orphaned rows in {model.__name__} ({elapsed:.2f}s)")
 
-        self.stdout.write(f"\n🧹 Cleanup complete. Total rows deleted: {total_deleted}")
+        summary = "would be deleted" if dry_run else "deleted"
+        self.stdout.write(
+            f"\n🧹 Cleanup complete. Total rows {summary}: {total} ({time.perf_counter() - started:.2f}s)"
+        )
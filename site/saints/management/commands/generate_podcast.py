@@ -1,33 +1,89 @@
-from django.core.management.base import BaseCommand
-from saints.podcasts import generate_next_day_podcast as generate_next_day_podcast_saints_and_seasons
-from saints.kidspodcasts import generate_next_day_podcast as generate_next_day_podcast_saintly_adventures
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from saints import podcast_batch
+from saints.day_context import next_episode_date
+from saints.podcast_checkpoints import STAGES
+from saints.podcasts import generate_podcast_for_date as generate_podcast_for_date_saints_and_seasons
+from saints.kidspodcasts import generate_podcast_for_date as generate_podcast_for_date_saintly_adventures
 
 
 class Command(BaseCommand):
-    help = "Generate a podcast episode for tomorrow and set it to publish today at 5 PM"
+    help = (
+        "Generate podcast episodes for tomorrow (or, with --days, a run of dates ahead) "
+        "and set each to publish at 5 PM the day before"
+    )
 
-    def _run_generator(self, label, func):
-        try:
-            result = func()
-            if result is None:
-                self.stdout.write(
-                    self.style.WARNING(f"⚠️ {label}: Podcast for tomorrow already exists, skipping generation")
-                )
-            else:
-                self.stdout.write(
-                    self.style.SUCCESS(f"✅ {label}: Successfully generated podcast: {result}")
-                )
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f"❌ {label}: Failed to generate podcast: {e}")
-            )
-            raise
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Reuse the saved output of stages that already completed with the same inputs",
+        )
+        parser.add_argument(
+            "--from-stage",
+            choices=STAGES,
+            help="Rebuild this stage and every later one, reusing the saved output of earlier stages",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=1,
+            help="Number of consecutive dates to generate, starting with --start-date; dates with episodes are skipped",
+        )
+        parser.add_argument(
+            "--start-date",
+            type=str,
+            help="First date to generate (YYYY-MM-DD); defaults to tomorrow in US Eastern time",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=2,
+            help="Maximum number of episodes to build at once",
+        )
+        parser.add_argument(
+            "--sequential",
+            action="store_true",
+            help="Build one episode at a time (same as --concurrency 1)",
+        )
 
     def handle(self, *args, **options):
-        self.stdout.write("🎙️ Starting podcast generation for tomorrow...")
-        generators = [
-            ("Saints and Seasons", generate_next_day_podcast_saints_and_seasons),
-            ("Saintly Adventures", generate_next_day_podcast_saintly_adventures),
+        if options["start_date"]:
+            start = parse_date(options["start_date"])
+            if not start:
+                raise CommandError(f"Invalid --start-date: {options['start_date']}")
+        else:
+            start = next_episode_date()
+        if options["days"] < 1:
+            raise CommandError("--days must be at least 1")
+        dates = podcast_batch.episode_dates(start, options["days"])
+        self.stdout.write(f"🎙️ Starting podcast generation for {dates[0]} to {dates[-1]}...")
+
+        shows = [
+            ("Saints and Seasons", generate_podcast_for_date_saints_and_seasons),
+            ("Saintly Adventures", generate_podcast_for_date_saintly_adventures),
         ]
-        for label, func in generators:
-            self._run_generator(label, func)
\ No newline at end of file
+        results = podcast_batch.generate_dates(
+            shows,
+            dates,
+            concurrency=1 if options["sequential"] else options["concurrency"],
+            resume=options["resume"],
+            from_stage=options["from_stage"],
+        )
+
+        for result in results:
+            label = f"{result.date} {result.show}"
+            if result.status == podcast_batch.GENERATED:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"✅ {label}: Successfully generated podcast: {result.path} ({result.seconds:.0f}s)"
+                    )
+                )
+            elif result.status == podcast_batch.EXISTS:
+                self.stdout.write(self.style.WARNING(f"⚠️ {label}: Podcast already exists, skipping generation"))
+            else:
+                self.stdout.write(self.style.ERROR(f"❌ {label}: Failed to generate podcast: {result.error}"))
+        failed = [result for result in results if result.status == podcast_batch.FAILED]
+        if failed:
+            raise CommandError(f"{len(failed)} of {len(results)} episodes failed")
@@ -0,0 +1,120 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from saints import jobs
+from saints.models import JobRun, WorkUnit
+
+
+class Command(BaseCommand):
+    help = "Start, resume, work and inspect resumable ingestion jobs."
+
+    def add_arguments(self, parser):
+        subparsers = parser.add_subparsers(dest="action", required=True)
+
+        subparsers.add_parser("types", help="List the registered job types.")
+
+        start = subparsers.add_parser("start", help="Plan a new job and (unless --no-work) start working it.")
+        start.add_argument("job_type")
+        start.add_argument(
+            "--params",
+            default="{}",
+            help='Job parameters as JSON, e.g. \'{"incremental": true, "years": [2025, 2026]}\'.',
+        )
+        start.add_argument("--max-attempts", type=int, default=jobs.MAX_ATTEMPTS)
+        start.add_argument("--no-work", action="store_true", help="Only plan the job; leave the units to workers.")
+        self._add_worker_arguments(start)
+
+        work = subparsers.add_parser("work", help="Claim and process units of an existing job.")
+        work.add_argument("job_id")
+        self._add_worker_arguments(work)
+
+        resume = subparsers.add_parser("resume", help="Reopen a stopped or failed job and work it.")
+        resume.add_argument("job_id")
+        resume.add_argument(
+            "--reset-failed",
+            action="store_true",
+            help="Give units that exhausted their attempts a fresh set of attempts.",
+        )
+        self._add_worker_arguments(resume)
+
+        status = subparsers.add_parser("status", help="Show recent jobs, or one job's units in detail.")
+        status.add_argument("job_id", nargs="?")
+        status.add_argument("--limit", type=int, default=20)
+
+    def _add_worker_arguments(self, parser):
+        parser.add_argument("--lease-seconds", type=int, default=jobs.LEASE_SECONDS)
+        parser.add_argument("--max-units", type=int, help="Stop after processing this many units.")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Units to process at once in this process, each in its own thread.",
+        )
+        parser.add_argument(
+            "--wait",
+            action="store_true",
+            help="Keep polling while other workers hold leases, taking over their units if they die.",
+        )
+
+    def handle(self, *args, **options):
+        getattr(self, f"handle_{options['action']}")(options)
+
+    def _get_job(self, job_id):
+        try:
+            return JobRun.objects.get(pk=job_id)
+        except (JobRun.DoesNotExist, ValidationError, ValueError):
+            raise CommandError(f"No job with id {job_id}")
+
+    def _work(self, job, options):
+        self.stdout.write(f"⚙️ Working {job.job_type} job {job.pk}")
+        processed = jobs.work(
+            job,
+            lease_seconds=options["lease_seconds"],
+            max_units=options["max_units"],
+            wait=options["wait"],
+            concurrency=options["concurrency"],
+        )
+        job.refresh_from_db()
+        style = self.style.SUCCESS if job.status == JobRun.STATUS_COMPLETED else self.style.WARNING
+        self.stdout.write(style(f"{job}: {processed['done']} done, {processed['failed']} failed this run"))
+
+    def handle_types(self, options):
+        for name, job_type in sorted(jobs.load_job_types().items()):
+            self.stdout.write(f"{name}: {job_type.description}")
+
+    def handle_start(self, options):
+        try:
+            params = json.loads(options["params"])
+            job = jobs.start_job(options["job_type"], params, max_attempts=options["max_attempts"])
+        except (ValueError, TypeError) as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f"✅ Started {job.job_type} job {job.pk}"))
+        if not options["no_work"]:
+            self._work(job, options)
+
+    def handle_work(self, options):
+        self._work(self._get_job(options["job_id"]), options)
+
+    def handle_resume(self, options):
+        job = jobs.resume_job(self._get_job(options["job_id"]), reset_failed=options["reset_failed"])
+        self._work(job, options)
+
+    def handle_status(self, options):
+        if not options["job_id"]:
+            for job in JobRun.objects.all()[: options["limit"]]:
+                counts = jobs.unit_counts(job)
+                summary = ", ".join(f"{count} {status}" for status, count in counts.items() if count)
+                self.stdout.write(f"{job.pk}  {job}  [{summary or 'no units'}]")
+            return
+
+        job = self._get_job(options["job_id"])
+        self.stdout.write(f"{job}  params={json.dumps(job.params)}  max_attempts={job.max_attempts}")
+        for status, count in jobs.unit_counts(job).items():
+            self.stdout.write(f"  {status}: {count}")
+        for unit in job.units.filter(status=WorkUnit.STATUS_RUNNING):
+            self.stdout.write(f"  running {unit.key} on {unit.leased_by} until {unit.lease_expires:%H:%M:%S}")
+        for unit in job.units.filter(status=WorkUnit.STATUS_FAILED):
+            error = unit.last_error.splitlines()[0] if unit.last_error else ""
+            self.stdout.write(self.style.ERROR(f"  failed {unit.key} ({unit.attempts} attempts): {error}"))
@@ -0,0 +1,79 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from saints import linking
+
+
+class Command(BaseCommand):
+    help = "Propose biographies for calendar events without one, by trigram similarity of their name keys."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--apply", action="store_true", help="Link the accepted proposals.")
+        parser.add_argument("--calendar", action="append", help="Only events of this calendar (repeatable).")
+        parser.add_argument("--candidates", type=int, default=3, help="Candidates reported per event name.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=linking.CANDIDATE_THRESHOLD,
+            help="Lowest similarity considered a candidate.",
+        )
+        parser.add_argument(
+            "--min-score", type=float, default=linking.MIN_SCORE, help="Lowest similarity that is linked."
+        )
+        parser.add_argument(
+            "--min-margin",
+            type=float,
+            default=linking.MIN_MARGIN,
+            help="Lead the best candidate needs over the second to be linked.",
+        )
+        parser.add_argument("--json", dest="json_path", help="Also write the full report to this file.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        proposals = linking.propose_links(options["calendar"], options["candidates"], options["threshold"])
+        accepted = linking.accepted(proposals, options["min_score"], options["min_margin"])
+        accepted_keys = {(proposal.name_key, proposal.calendar) for proposal in accepted}
+        unmatched = [proposal for proposal in proposals if (proposal.name_key, proposal.calendar) not in accepted_keys]
+        self.stdout.write(
+            f"🔍 {len(proposals)} unlinked event names: {len(accepted)} matched, {len(unmatched)} unmatched "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+
+        for proposal in accepted:
+            self.stdout.write(
+                f"✅ {proposal.english_name} [{proposal.calendar}, {proposal.events} events] → "
+                f"{proposal.best.name} ({proposal.best.score:.2f})"
+            )
+        for proposal in unmatched:
+            candidates = ", ".join(f"{c.name} ({c.score:.2f})" for c in proposal.candidates) or "no candidates"
+            self.stdout.write(
+                f"❌ {proposal.english_name} [{proposal.calendar}, {proposal.events} events]: {candidates}"
+            )
+
+        if options["json_path"]:
+            report = {
+                "matched": [self.as_dict(proposal) for proposal in accepted],
+                "unmatched": [self.as_dict(proposal) for proposal in unmatched],
+            }
+            with open(options["json_path"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"📝 Report written to {options['json_path']}")
+
+        if options["apply"]:
+            linked = linking.apply_links(accepted)
+            self.stdout.write(self.style.SUCCESS(f"🔗 Linked {linked} events"))
+        elif accepted:
+            self.stdout.write("Dry run; pass --apply to link the matched events.")
+
+    def as_dict(self, proposal):
+        return {
+            "english_name": proposal.english_name,
+            "name_key": proposal.name_key,
+            "calendar": proposal.calendar,
+            "events": proposal.events,
+            "candidates": [
+                {"biography": c.biography_id, "name": c.name, "score": c.score} for c in proposal.candidates
+            ],
+        }
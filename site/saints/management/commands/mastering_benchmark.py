@@ -0,0 +1,119 @@
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from saints import mastering, podcast_assets
+
+LOUDNORM = f"loudnorm=I={mastering.TARGET_I}:LRA=11:TP={mastering.TARGET_TP}"
+ENCODE = ["-c:a", "libmp3lame", "-b:a", mastering.BITRATE]
+
+
+def run(args):
+    subprocess.run(["ffmpeg", "-y", "-hide_banner", "-nostats"] + args, capture_output=True, check=True)
+
+
+def previous_master(parts, output_path, intro, outro, work_dir):
+    """The former pipeline: concat to an MP3, single-pass loudnorm to an MP3, then mix and loudnorm again."""
+    raw = os.path.join(work_dir, "dialogue_raw.mp3")
+    inputs = [arg for path in parts for arg in ("-i", path)]
+    run(
+        inputs + ["-filter_complex", f"concat=n={len(parts)}:v=0:a=1[dialogue]", "-map", "[dialogue]"] + ENCODE + [raw]
+    )
+    dialogue = os.path.join(work_dir, "dialogue.mp3")
+    run(["-i", raw, "-filter_complex", f"[0:a]{LOUDNORM}[final]", "-map", "[final]"] + ENCODE + [dialogue])
+    tracks = [mastering.Track(dialogue)]
+    if intro:
+        tracks.insert(0, mastering.music_track(intro))
+    if outro:
+        tracks.append(mastering.music_track(outro))
+    chains = []
+    labels = []
+    for index, track in enumerate(tracks):
+        if track.fade_out_start is None:
+            labels.append(f"[{index}:a]")
+            continue
+        chains.append(f"[{index}:a]afade=t=out:st={track.fade_out_start}:d={mastering.FADE_SECONDS}[faded{index}]")
+        labels.append(f"[faded{index}]")
+    chains.append(f"{''.join(labels)}concat=n={len(tracks)}:v=0:a=1[mixed];[mixed]{LOUDNORM}[final]")
+    inputs = [arg for track in tracks for arg in ("-i", track.path)]
+    run(inputs + ["-filter_complex", ";".join(chains), "-map", "[final]"] + ENCODE + [output_path])
+
+
+class Command(BaseCommand):
+    help = "Time episode mastering (measure, then one levelled encode) against the former three-encode pipeline."
+
+    def add_arguments(self, parser):
+        parser.add_argument("parts", nargs="*", help="Dialogue part files (default: synthetic parts).")
+        parser.add_argument("--synthetic-parts", type=int, default=8, help="Number of synthetic parts to generate.")
+        parser.add_argument("--part-seconds", type=float, default=90.0, help="Length of each synthetic part.")
+        parser.add_argument("--intro", default="intro_music.mp3", help="File in MEDIA_ROOT/podcast_assets, or ''.")
+        parser.add_argument("--outro", default="outro_music.mp3", help="File in MEDIA_ROOT/podcast_assets, or ''.")
+        parser.add_argument("--runs", type=int, default=3)
+
+    def synthetic_parts(self, work_dir, count, seconds):
+        parts = []
+        for index in range(count):
+            path = os.path.join(work_dir, f"part_{index}.mp3")
+            # Pink noise at varying levels stands in for speech with uneven loudness between batches
+            source = f"anoisesrc=color=pink:amplitude={0.1 + 0.05 * (index % 4)}:duration={seconds}:r=44100"
+            run(["-f", "lavfi", "-i", source] + ENCODE + [path])
+            parts.append(path)
+        return parts
+
+    def asset(self, name):
+        if not name:
+            return None
+        path = os.path.join(settings.MEDIA_ROOT, "podcast_assets", name)
+        if not os.path.exists(path):
+            raise CommandError(f"No such asset: {path}")
+        return path
+
+    def handle(self, *args, **options):
+        if not shutil.which("ffmpeg"):
+            raise CommandError("ffmpeg is not installed")
+        intro, outro = self.asset(options["intro"]), self.asset(options["outro"])
+        work_dir = tempfile.mkdtemp()
+        try:
+            parts = options["parts"] or self.synthetic_parts(
+                work_dir, options["synthetic_parts"], options["part_seconds"]
+            )
+            self.stdout.write(f"Mastering {len(parts)} parts, intro={bool(intro)}, outro={bool(outro)}")
+
+            outputs = {
+                "previous": os.path.join(work_dir, "previous.mp3"),
+                "levelled": os.path.join(work_dir, "single.mp3"),
+            }
+            timings = {"previous": [], "levelled": []}
+            for _ in range(options["runs"]):
+                started = time.perf_counter()
+                previous_master(parts, outputs["previous"], intro, outro, work_dir)
+                timings["previous"].append(time.perf_counter() - started)
+                report = mastering.master(
+                    parts,
+                    outputs["levelled"],
+                    intro=podcast_assets.music_track(intro),
+                    outro=podcast_assets.music_track(outro),
+                )
+                timings["levelled"].append(report.seconds)
+                self.stdout.write(
+                    f"   levelled: analysis {report.analysis_seconds:.2f}s + encode {report.encode_seconds:.2f}s"
+                )
+
+            for name, values in timings.items():
+                # How close each pipeline lands to the target, measured on its output
+                measured = mastering.measure(outputs[name])
+                self.stdout.write(
+                    f"{name:>14}: median {statistics.median(values):.2f}s, min {min(values):.2f}s; "
+                    f"{measured['input_i']:.1f} LUFS (target {mastering.TARGET_I}), "
+                    f"true peak {measured['input_tp']:.1f} dBTP (max {mastering.TARGET_TP})"
+                )
+            speedup = statistics.median(timings["previous"]) / statistics.median(timings["levelled"])
+            self.stdout.write(self.style.SUCCESS(f"⏱️ Mastering is {speedup:.2f}x the previous speed"))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
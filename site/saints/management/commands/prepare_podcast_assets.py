@@ -0,0 +1,24 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from saints import podcast_assets
+
+
+class Command(BaseCommand):
+    help = "Analyse and render every intro/outro file in MEDIA_ROOT/podcast_assets that is not prepared yet."
+
+    def handle(self, *args, **options):
+        directory = podcast_assets.asset_path("")
+        for name in sorted(os.listdir(directory)):
+            if not name.lower().endswith((".mp3", ".wav", ".m4a", ".flac")):
+                continue
+            started = time.perf_counter()
+            asset = podcast_assets.prepare(os.path.join(directory, name))
+            self.stdout.write(
+                f"🎵 {name}: {asset.duration:.1f}s, {asset.measured['input_i']} LUFS, "
+                f"true peak {asset.measured['input_tp']} dBTP ({time.perf_counter() - started:.2f}s)"
+            )
+        self.stdout.write(self.style.SUCCESS(f"✅ Prepared assets are in {settings.PODCAST_ASSET_CACHE_DIR}"))
@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from saints import search
+
+
+class Command(BaseCommand):
+    help = "Recompute the full-text search vectors of every biography and calendar event."
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            raise CommandError("Full-text search needs PostgreSQL")
+        started = time.perf_counter()
+        counts = search.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Indexed {counts['biographies']} biographies and {counts['calendar_events']} calendar events "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+        )
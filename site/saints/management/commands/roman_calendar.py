@@ -0,0 +1,86 @@
+import time
+from datetime import date
+from itertools import groupby
+
+from django.core.management.base import BaseCommand, CommandError
+
+from saints import roman_calendar
+from saints.sync import sync_month_events
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute the current Roman calendar (USA) locally, print it, write it to a calendar, "
+        "or check it against a scraped calendar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("years", nargs="*", type=int, help="Years to compute (default: this year).")
+        parser.add_argument(
+            "--validate",
+            action="store_true",
+            help="Compare each day's primary celebration with the scraped calendar instead of printing it.",
+        )
+        parser.add_argument("--calendar", default="catholic", help="Scraped calendar to validate against.")
+        parser.add_argument("--show-mismatches", type=int, default=20, help="Mismatching days to list per year.")
+        parser.add_argument(
+            "--min-agreement",
+            type=float,
+            default=0.0,
+            help="Fail when the share of days whose rank and color agree falls below this fraction.",
+        )
+        parser.add_argument("--write", metavar="CALENDAR", help="Upsert the computed rows into this calendar.")
+
+    def handle(self, *args, **options):
+        years = options["years"] or [date.today().year]
+        try:
+            roman_calendar.check_years(min(years), max(years))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if options["validate"]:
+            return self.validate(years, options)
+
+        started = time.perf_counter()
+        rows = roman_calendar.calendar_rows(years)
+        elapsed = (time.perf_counter() - started) * 1000
+        self.stdout.write(f"⏱️ Computed {len(rows)} rows for {len(years)} year(s) in {elapsed:.1f} ms")
+
+        if options["write"]:
+            for (year, month), month_rows in groupby(rows, key=lambda row: (row["year"], row["month"])):
+                created, updated, deleted = sync_month_events(
+                    options["write"], year, month, list(month_rows), key_fields=("english_name", "order")
+                )
+                self.stdout.write(
+                    f"{options['write']} {year}-{month:02d}: {created} created, {updated} updated, {deleted} deleted"
+                )
+            return
+
+        for row in rows:
+            prefix = f"{row['date']}" if row["order"] == 0 else " " * 10 + "  or"
+            self.stdout.write(f"{prefix}  {row['english_name']} [{row['english_rank']}, {row['color']}]")
+
+    def validate(self, years, options):
+        failed = False
+        for year in years:
+            result = roman_calendar.compare_with_scraped(year, options["calendar"])
+            days = result["days"]
+            if not days:
+                self.stdout.write(self.style.WARNING(f"⚠️ {year}: no scraped {options['calendar']} rows to compare"))
+                continue
+            self.stdout.write(
+                f"{year}: {days} days, rank {result['rank'] / days:.1%}, color {result['color'] / days:.1%}, "
+                f"name {result['name'] / days:.1%}"
+            )
+            for day, expected, actual in result["mismatches"][: options["show_mismatches"]]:
+                self.stdout.write(
+                    f"  {day}: scraped {expected['english_name']!r} [{expected['english_rank']}, {expected['color']}]"
+                    f" / computed {actual['english_name']!r} [{actual['english_rank']}, {actual['color']}]"
+                )
+            agreement = min(result["rank"], result["color"]) / days
+            if agreement < options["min_agreement"]:
+                failed = True
+                self.stdout.write(self.style.ERROR(f"❌ {year}: agreement {agreement:.1%} below threshold"))
+        if failed:
+            raise CommandError("Computed calendar disagrees with the scraped calendar")
+        self.stdout.write(self.style.SUCCESS("✅ Validation finished"))
@@ -0,0 +1,71 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from saints import search
+from saints.models import Biography, CalendarEvent
+
+DEFAULT_QUERIES = [
+    "Francis",
+    "martyr",
+    "virgin martyr",
+    '"Blessed Virgin Mary"',
+    "apostle -Paul",
+    "Sanctae Mariae",
+    "pope or bishop",
+    "Ascension",
+]
+
+
+class Command(BaseCommand):
+    help = "Time full-text search queries (match count plus first result page) against the whole corpus."
+
+    def add_arguments(self, parser):
+        parser.add_argument("queries", nargs="*", help="Queries to time (default: a fixed mix of names and words).")
+        parser.add_argument("--runs", type=int, default=20, help="Timed runs per query, after one warm-up run.")
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--explain", action="store_true", help="Print the query plan of each search.")
+
+    def time_search(self, results, runs, page_size):
+        timings = []
+        for run in range(runs + 1):
+            started = time.perf_counter()
+            count = results.count()
+            list(results[:page_size])
+            if run:
+                timings.append((time.perf_counter() - started) * 1000)
+        return count, timings
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            raise CommandError("Full-text search needs PostgreSQL")
+
+        self.stdout.write(
+            f"Corpus: {Biography.objects.count()} biographies "
+            f"({Biography.objects.filter(search_vector__isnull=False).count()} indexed), "
+            f"{CalendarEvent.objects.count()} calendar events "
+            f"({CalendarEvent.objects.filter(search_vector__isnull=False).count()} indexed)"
+        )
+        all_timings = []
+        for text in options["queries"] or DEFAULT_QUERIES:
+            for kind, results in [
+                ("biographies", search.search_biographies(text)),
+                ("events", search.search_calendar_events(text)),
+            ]:
+                count, timings = self.time_search(results, options["runs"], options["page_size"])
+                all_timings.extend(timings)
+                p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+                self.stdout.write(
+                    f"{text!r:>24} {kind:<12} {count:>7} matches  "
+                    f"median {statistics.median(timings):7.2f} ms  p95 {p95:7.2f} ms"
+                )
+                if options["explain"]:
+                    self.stdout.write(results[: options["page_size"]].explain(analyze=True))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"⏱️ {len(all_timings)} searches: median {statistics.median(all_timings):.2f} ms, "
+                f"max {max(all_timings):.2f} ms"
+            )
+        )
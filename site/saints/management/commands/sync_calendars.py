@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+
+from saints import acna, current, do, universalis
+
+
+class Command(BaseCommand):
+    help = "Incrementally sync the scraped calendars, re-importing only months that changed upstream."
+
+    sources = {
+        "acna": lambda options: acna.run(incremental=not options["full"], concurrency=options["concurrency"]),
+        "divinum": lambda options: do.run(incremental=not options["full"]),
+        "universalis": lambda options: universalis.run(incremental=not options["full"]),
+        "gcatholic": lambda options: current.run(incremental=not options["full"]),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            action="append",
+            choices=sorted(self.sources),
+            help="Limit the sync to one upstream source (may be repeated). Defaults to all sources.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore stored fingerprints and re-parse every month (changed rows are still diffed).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=acna.CONCURRENCY,
+            help="Maximum concurrent requests to the dailyoffice2019 calendar API.",
+        )
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Only re-fetch ACNA/TEC months recorded as failed in the sync ledger.",
+        )
+
+    def handle(self, *args, **options):
+        if options["retry_failed"]:
+            for calendar in acna.CALENDARS:
+                self.stdout.write(f"🔁 Retrying failed months for {calendar}")
+                acna.retry_failed(calendar, concurrency=options["concurrency"])
+            return
+
+        for source in options["source"] or sorted(self.sources):
+            self.stdout.write(f"🔄 Syncing {source} ({'full' if options['full'] else 'incremental'})")
+            self.sources[source](options)
+            self.stdout.write(self.style.SUCCESS(f"✅ {source} synced"))
@@ -0,0 +1,252 @@
+"""Episode mastering: dialogue parts plus optional intro/outro music to one loudness-normalised MP3.
+
+Mastering is two ffmpeg runs over the same inputs, encoding only once:
+
+1. an analysis pass that decodes and measures, writing nothing (``-f null``).
+   Every track that has no measurement yet gets its own ``ebur128`` (the EBU
+   R128 loudness meter) in one filter graph, so the dialogue parts are all
+   measured in a single decode.  Prepared music (``saints.podcast_assets``)
+   carries its measurement and is not decoded here at all;
+2. the encode, a single filter graph that brings each track to the target
+   loudness with a fixed gain, fades the music, concatenates everything in
+   order and runs a peak limiter a little under the true-peak target.  It
+   writes a file, or pipes the MP3 to a ``consume`` callback (which saves it
+   to storage as it arrives), and reports the episode's duration from
+   ffmpeg's progress output.
+
+This supersedes the earlier two-pass ``loudnorm`` over the whole episode.
+With ElevenLabs batches of uneven loudness, one linear gain often pushed the
+true peak over target, so ``loudnorm`` fell back to its slow, off-target
+dynamic mode, and the intro/outro music was re-decoded and re-measured for
+every episode.  Levelling each track with a fixed gain keeps the batches even
+without pumping, keeps the loudness range, and runs nothing at ``loudnorm``'s
+internal 192 kHz.
+"""
+
+import re
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple
+
+# EBU R128 targets for spoken-word podcasts
+TARGET_I = -16.0
+TARGET_TP = -1.5
+FADE_SECONDS = 2.0
+SAMPLE_RATE = 44100
+BITRATE = "128k"
+# A fixed format after the concat, whatever mix of mono dialogue and stereo music goes in
+OUTPUT_FORMAT = f"aformat=sample_rates={SAMPLE_RATE}:channel_layouts=stereo"
+
+ANALYSIS_FILTER = "ebur128=peak=true:framelog=quiet"
+# dB between the sample-peak limiter's ceiling and TARGET_TP, room for inter-sample peaks
+LIMITER_MARGIN = 0.5
+LIMITER = f"alimiter=limit={10 ** ((TARGET_TP - LIMITER_MARGIN) / 20):.4f}:attack=5:release=50:level=false"
+# Tracks quieter than this are silence (ebur128 reports -70 LUFS) and are not amplified
+SILENCE_I = -60.0
+# Gains smaller than this are not worth a filter
+MIN_GAIN = 0.05
+# ebur128 reports silence as -inf dBFS true peak
+MEASURED_FLOOR = -99.0
+
+EBUR128_PATTERNS = {
+    "input_i": r"Integrated loudness:\s+I:\s+(\S+) LUFS",
+    "input_thresh": r"Integrated loudness:\s+I:\s+\S+ LUFS\s+Threshold:\s+(\S+) LUFS",
+    "input_lra": r"Loudness range:\s+LRA:\s+(\S+) LU",
+    "input_tp": r"True peak:\s+Peak:\s+(\S+) dBFS",
+}
+SUMMARY_HEADER = re.compile(r"\[Parsed_ebur128_(\d+) @ [^\]]+\] Summary:")
+# "-progress" reports how much audio has been written so far
+PROGRESS_TIME = re.compile(r"^out_time_us=(\d+)$", re.MULTILINE)
+
+
+@dataclass
+class Track:
+    path: str
+    # Fade the track out over its last FADE_SECONDS, starting here (unprepared music)
+    fade_out_start: Optional[float] = None
+    # ebur128 figures, when already known (prepared music)
+    measured: Optional[Dict[str, float]] = None
+
+
+@dataclass
+class MasteringReport:
+    tracks: int
+    analysis_seconds: float
+    encode_seconds: float
+    gains: List[float] = field(default_factory=list)
+    # Seconds of audio written
+    duration: Optional[float] = None
+
+    @property
+    def seconds(self) -> float:
+        return self.analysis_seconds + self.encode_seconds
+
+
+def probe_duration(path: str, default: float = 10.0) -> float:
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "quiet", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return float(result.stdout.strip())
+    except Exception:
+        return default
+
+
+def music_track(path: str, duration: Optional[float] = None) -> Track:
+    """An unprepared intro/outro file, faded out and measured at mastering time."""
+    duration = probe_duration(path) if duration is None else duration
+    return Track(path, fade_out_start=max(0.0, duration - FADE_SECONDS))
+
+
+def parse_ebur128_summary(summary: str) -> Dict[str, float]:
+    """The integrated loudness, threshold, loudness range and true peak from one ``ebur128`` summary."""
+    measured = {}
+    for name, pattern in EBUR128_PATTERNS.items():
+        match = re.search(pattern, summary)
+        if not match:
+            raise RuntimeError(f"ebur128 printed no {name} measurement:\n{summary[-2000:]}")
+        measured[name] = max(MEASURED_FLOOR, float(match.group(1)))
+    return measured
+
+
+def measure_files(paths: Sequence[str]) -> List[Dict[str, float]]:
+    """``ebur128`` figures for each file, measured side by side in one ffmpeg run."""
+    if not paths:
+        return []
+    inputs = [arg for path in paths for arg in ("-i", path)]
+    graph = ";".join(f"[{index}:a]{ANALYSIS_FILTER}[measured{index}]" for index in range(len(paths)))
+    outputs = [arg for index in range(len(paths)) for arg in ("-map", f"[measured{index}]", "-f", "null", "-")]
+    result = subprocess.run(
+        ["ffmpeg", "-y", "-hide_banner", "-nostats"] + inputs + ["-filter_complex", graph] + outputs,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Each instance prints "[Parsed_ebur128_<n> @ 0x…] Summary:" followed by its figures
+    pieces = SUMMARY_HEADER.split(result.stderr)
+    summaries = {int(index): text for index, text in zip(pieces[1::2], pieces[2::2])}
+    if len(summaries) != len(paths):
+        raise RuntimeError(f"ebur128 printed {len(summaries)} summaries for {len(paths)} files")
+    return [parse_ebur128_summary(summaries[index]) for index in range(len(paths))]
+
+
+def measure(path: str) -> Dict[str, float]:
+    return measure_files([path])[0]
+
+
+def analyze(tracks: Sequence[Track]) -> float:
+    """Measure the tracks without a measurement; returns the seconds taken."""
+    started = time.monotonic()
+    pending = [track for track in tracks if track.measured is None]
+    for track, measured in zip(pending, measure_files([track.path for track in pending])):
+        track.measured = measured
+    return time.monotonic() - started
+
+
+def track_gain(measured: Dict[str, float]) -> float:
+    """dB bringing a track to ``TARGET_I``; silence is left alone."""
+    if measured["input_i"] <= SILENCE_I:
+        return 0.0
+    return TARGET_I - measured["input_i"]
+
+
+def track_filters(track: Track, gain: float) -> List[str]:
+    filters = []
+    if abs(gain) >= MIN_GAIN:
+        filters.append(f"volume={gain:.2f}dB")
+    if track.fade_out_start is not None:
+        filters.append(f"afade=t=out:st={track.fade_out_start}:d={FADE_SECONDS}")
+    return filters
+
+
+def build_filter_graph(tracks: Sequence[Track], gains: Sequence[float]) -> str:
+    """Level and fade ``tracks`` (ffmpeg inputs 0..n-1), concatenate them in order and limit into ``[final]``."""
+    chains = []
+    labels = []
+    for index, (track, gain) in enumerate(zip(tracks, gains)):
+        filters = track_filters(track, gain)
+        if not filters:
+            labels.append(f"[{index}:a]")
+            continue
+        chains.append(f"[{index}:a]{','.join(filters)}[track{index}]")
+        labels.append(f"[track{index}]")
+    chains.append(f"{''.join(labels)}concat=n={len(tracks)}:v=0:a=1,{OUTPUT_FORMAT},{LIMITER}[final]")
+    return ";".join(chains)
+
+
+def encode(
+    tracks: Sequence[Track],
+    gains: Sequence[float],
+    output_path: Optional[str] = None,
+    consume: Optional[Callable[[BinaryIO], None]] = None,
+) -> Tuple[float, Optional[float]]:
+    """Write the mastered episode to ``output_path``, or pipe it to ``consume`` as it is encoded.
+
+    ``consume`` is given ffmpeg's stdout and must read it to the end.  Returns the seconds taken and the
+    duration of the episode.
+    """
+    started = time.monotonic()
+    inputs = [arg for track in tracks for arg in ("-i", track.path)]
+    graph = build_filter_graph(tracks, gains)
+    output = ["-f", "mp3", "pipe:1"] if consume else [output_path]
+    command = (
+        ["ffmpeg", "-y", "-hide_banner", "-nostats", "-progress", "pipe:2"]
+        + inputs
+        + ["-filter_complex", graph, "-map", "[final]", "-c:a", "libmp3lame", "-b:a", BITRATE]
+        + output
+    )
+    # stderr goes to a file so a long log can never block ffmpeg while its stdout is being read
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE if consume else subprocess.DEVNULL, stderr=stderr)
+        try:
+            if consume:
+                with process.stdout:
+                    consume(process.stdout)
+            process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        stderr.seek(0)
+        log = stderr.read().decode("utf-8", errors="replace")
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command, stderr=log)
+    times = PROGRESS_TIME.findall(log)
+    duration = int(times[-1]) / 1_000_000 if times else None
+    return time.monotonic() - started, duration
+
+
+def master_tracks(
+    tracks: Sequence[Track],
+    output_path: Optional[str] = None,
+    consume: Optional[Callable[[BinaryIO], None]] = None,
+) -> MasteringReport:
+    analysis_seconds = analyze(tracks)
+    gains = [track_gain(track.measured) for track in tracks]
+    encode_seconds, duration = encode(tracks, gains, output_path, consume)
+    return MasteringReport(len(tracks), analysis_seconds, encode_seconds, gains, duration)
+
+
+def master(
+    parts: Sequence[str],
+    output_path: Optional[str] = None,
+    intro: Optional[Track] = None,
+    outro: Optional[Track] = None,
+    consume: Optional[Callable[[BinaryIO], None]] = None,
+) -> MasteringReport:
+    """Master the dialogue ``parts``, in order, between the optional intro and outro music.
+
+    The episode is written to ``output_path`` or piped to ``consume`` (see ``encode``).  The music normally
+    comes prepared by ``saints.podcast_assets``; ``music_track`` covers unprepared files.
+    """
+    tracks = [Track(path) for path in parts]
+    if intro:
+        tracks.insert(0, intro)
+    if outro:
+        tracks.append(outro)
+    return master_tracks(tracks, output_path, consume)
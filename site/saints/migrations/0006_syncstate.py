@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:13
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "saints",
+            "0005_rename_saints_podcastlisten_created_idx_saints_podc_created_15c443_idx_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncState",
+            fields=[
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("source", models.CharField(max_length=64)),
+                ("calendar", models.CharField(max_length=255)),
+                ("year", models.PositiveSmallIntegerField()),
+                (
+                    "month",
+                    models.PositiveSmallIntegerField(
+                        help_text="Month covered by the upstream document, or 0 for a document covering the whole year"
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(blank=True, default="", max_length=64),
+                ),
+                ("etag", models.CharField(blank=True, max_length=255, null=True)),
+                (
+                    "last_modified",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("event_count", models.PositiveIntegerField(default=0)),
+                ("last_checked", models.DateTimeField(blank=True, null=True)),
+                ("last_changed", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="syncstate",
+            constraint=models.UniqueConstraint(
+                fields=("source", "calendar", "year", "month"), name="unique_sync_state"
+            ),
+        ),
+    ]
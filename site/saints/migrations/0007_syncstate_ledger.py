@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0006_syncstate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="syncstate",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0, help_text="Fetch attempts made during the last sync"),
+        ),
+        migrations.AddField(
+            model_name="syncstate",
+            name="error",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="syncstate",
+            name="status",
+            field=models.CharField(
+                choices=[("ok", "OK"), ("failed", "Failed")],
+                default="ok",
+                max_length=16,
+            ),
+        ),
+    ]
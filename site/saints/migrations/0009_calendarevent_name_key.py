@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0008_jobrun_workunit"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calendarevent",
+            name="name_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="Normalised english_name used to match events across calendars and to biographies",
+                max_length=2500,
+                null=True,
+            ),
+        ),
+    ]
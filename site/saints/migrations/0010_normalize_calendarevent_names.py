@@ -0,0 +1,84 @@
+import re
+
+from django.db import migrations
+
+# Frozen copies of the rules in saints.names as of this migration
+RANK_SUFFIX_PATTERN = r"\s+(?:Optional Memorial|Solemnity|Feast|Memorial|Commemoration)$"
+ACCENTED = "áàâäãåāăąçćčďéèêëēėęěíìîïīįñńňóòôöõøōőŕřśšşťúùûüūůűųýÿźžż"
+UNACCENTED = "aaaaaaaaacccdeeeeeeeeiiiiiinnnoooooooorrssstuuuuuuuuyyzzz"
+
+NORMALIZE_SQL = [
+    (
+        "strip rank suffixes",
+        "UPDATE saints_calendarevent SET english_name = regexp_replace(english_name, %s, '') "
+        "WHERE english_name ~ %s",
+        [RANK_SUFFIX_PATTERN, RANK_SUFFIX_PATTERN],
+    ),
+    (
+        "collapse whitespace",
+        "UPDATE saints_calendarevent SET english_name = btrim(regexp_replace(english_name, '\\s+', ' ', 'g')) "
+        "WHERE english_name ~ '(^\\s|\\s$|\\s\\s|[\\t\\n\\r])'",
+        [],
+    ),
+    (
+        "set name keys",
+        "UPDATE saints_calendarevent "
+        "SET name_key = btrim(regexp_replace(translate(lower(regexp_replace(english_name, %s, '')), %s, %s), "
+        "'[^a-z0-9]+', ' ', 'g')) "
+        "WHERE english_name IS NOT NULL",
+        [RANK_SUFFIX_PATTERN, ACCENTED, UNACCENTED],
+    ),
+]
+
+RANK_SUFFIX = re.compile(RANK_SUFFIX_PATTERN)
+WHITESPACE = re.compile(r"\s+")
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+ACCENT_TABLE = str.maketrans(ACCENTED, UNACCENTED)
+
+
+def clean_display_name(name):
+    return WHITESPACE.sub(" ", RANK_SUFFIX.sub("", name)).strip()
+
+
+def name_key(name):
+    return NON_ALPHANUMERIC.sub(" ", clean_display_name(name).lower().translate(ACCENT_TABLE)).strip()
+
+
+def normalize(apps, schema_editor, batch_size=1000):
+    CalendarEvent = apps.get_model("saints", "CalendarEvent")
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            for rule, sql, params in NORMALIZE_SQL:
+                cursor.execute(sql, params)
+                print(f"  {rule}: {cursor.rowcount} rows")
+        return
+
+    # Other backends lack regexp_replace; fall back to batched bulk updates
+    changed = 0
+    batch = []
+    for event in CalendarEvent.objects.exclude(english_name=None).only("pk", "english_name", "name_key").iterator():
+        name = clean_display_name(event.english_name)
+        key = name_key(name)
+        if (name, key) != (event.english_name, event.name_key):
+            event.english_name, event.name_key = name, key
+            batch.append(event)
+        if len(batch) >= batch_size:
+            CalendarEvent.objects.bulk_update(batch, ["english_name", "name_key"])
+            changed += len(batch)
+            batch = []
+    if batch:
+        CalendarEvent.objects.bulk_update(batch, ["english_name", "name_key"])
+        changed += len(batch)
+    print(f"  normalized: {changed} rows")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0009_calendarevent_name_key"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize, migrations.RunPython.noop),
+    ]
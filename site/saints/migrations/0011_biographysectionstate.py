@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0010_normalize_calendarevent_names"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BiographySectionState",
+            fields=[
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("section", models.CharField(max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("ok", "OK"), ("failed", "Failed")],
+                        default="ok",
+                        max_length=16,
+                    ),
+                ),
+                ("model_name", models.CharField(max_length=128)),
+                (
+                    "prompt_hash",
+                    models.CharField(
+                        help_text="Hash of the prompt template and response schema used",
+                        max_length=64,
+                    ),
+                ),
+                ("generated_at", models.DateTimeField()),
+                ("input_tokens", models.PositiveIntegerField(default=0)),
+                ("output_tokens", models.PositiveIntegerField(default=0)),
+                (
+                    "biography",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="section_states",
+                        to="saints.biography",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="biographysectionstate",
+            constraint=models.UniqueConstraint(fields=("biography", "section"), name="unique_biography_section_state"),
+        ),
+    ]
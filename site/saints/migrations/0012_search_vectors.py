@@ -0,0 +1,70 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:36
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Frozen copies of saints.search.biography_vector and calendar_event_vector as of this migration
+BIOGRAPHY_VECTOR_SQL = """
+UPDATE saints_biography b SET search_vector =
+    setweight(to_tsvector('english', coalesce(b.name, '')), 'A')
+    || setweight(to_tsvector('english',
+        coalesce((SELECT one_sentence_description FROM saints_shortdescriptionsmodel WHERE biography_id = b.uuid), '')
+        || ' ' ||
+        coalesce((SELECT one_paragraph_description FROM saints_shortdescriptionsmodel WHERE biography_id = b.uuid), '')
+    ), 'B')
+    || setweight(to_tsvector('english',
+        coalesce((SELECT hagiography FROM saints_hagiographymodel WHERE biography_id = b.uuid), '')
+        || ' ' ||
+        coalesce((SELECT feast_description FROM saints_feastdescriptionmodel WHERE biography_id = b.uuid), '')
+    ), 'C')
+    || setweight(to_tsvector('english',
+        coalesce((SELECT title FROM saints_legendmodel WHERE biography_id = b.uuid), '')
+        || ' ' ||
+        coalesce((SELECT legend FROM saints_legendmodel WHERE biography_id = b.uuid), '')
+    ), 'D')
+"""
+CALENDAR_EVENT_VECTOR_SQL = """
+UPDATE saints_calendarevent SET search_vector =
+    setweight(to_tsvector('english', coalesce(english_name, '') || ' ' || coalesce(saint_name, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(english_translation, '')), 'B')
+    || setweight(to_tsvector('simple', coalesce(latin_name, '')), 'B')
+"""
+
+
+def build_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for name, sql in [("biographies", BIOGRAPHY_VECTOR_SQL), ("calendar_events", CALENDAR_EVENT_VECTOR_SQL)]:
+            cursor.execute(sql)
+            print(f"  {name}: {cursor.rowcount} rows indexed")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0011_biographysectionstate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="biography",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="calendarevent",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="biography",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="biography_search_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="calendarevent",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["search_vector"], name="calendarevent_search_idx"),
+        ),
+        migrations.RunPython(build_search_vectors, migrations.RunPython.noop),
+    ]
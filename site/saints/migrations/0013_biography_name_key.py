@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-19 03:39
+
+import re
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+# Frozen copy of saints.names.name_key as of this migration
+RANK_SUFFIX = re.compile(r"\s+(?:Optional Memorial|Solemnity|Feast|Memorial|Commemoration)$")
+WHITESPACE = re.compile(r"\s+")
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+ACCENT_TABLE = str.maketrans(
+    "áàâäãåāăąçćčďéèêëēėęěíìîïīįñńňóòôöõøōőŕřśšşťúùûüūůűųýÿźžż",
+    "aaaaaaaaacccdeeeeeeeeiiiiiinnnoooooooorrssstuuuuuuuuyyzzz",
+)
+
+
+def name_key(name):
+    if name is None:
+        return None
+    name = WHITESPACE.sub(" ", RANK_SUFFIX.sub("", name)).strip()
+    return NON_ALPHANUMERIC.sub(" ", name.lower().translate(ACCENT_TABLE)).strip()
+
+
+def set_name_keys(apps, schema_editor):
+    Biography = apps.get_model("saints", "Biography")
+    biographies = list(Biography.objects.only("pk", "name"))
+    for biography in biographies:
+        biography.name_key = name_key(biography.name)
+    Biography.objects.bulk_update(biographies, ["name_key"], batch_size=1000)
+    print(f"  name keys: {len(biographies)} biographies")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0012_search_vectors"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="biography",
+            name="name_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="Normalised name matched against CalendarEvent.name_key",
+                max_length=2500,
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="biography",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name_key"],
+                name="biography_name_key_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.RunPython(set_name_keys, migrations.RunPython.noop),
+    ]
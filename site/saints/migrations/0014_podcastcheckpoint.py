@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0013_biography_name_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PodcastCheckpoint",
+            fields=[
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                ("date", models.DateField(help_text="Date the episode is for")),
+                ("stage", models.CharField(max_length=32)),
+                (
+                    "input_hash",
+                    models.CharField(
+                        help_text="Hash of the stage's inputs and the settings it depends on",
+                        max_length=64,
+                    ),
+                ),
+                ("output", models.JSONField()),
+                (
+                    "seconds",
+                    models.FloatField(
+                        default=0,
+                        help_text="Time the stage took to produce this output",
+                    ),
+                ),
+                (
+                    "podcast",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="checkpoints",
+                        to="saints.podcast",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="podcastcheckpoint",
+            constraint=models.UniqueConstraint(
+                fields=("podcast", "date", "stage", "input_hash"),
+                name="unique_podcast_checkpoint",
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:07
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0014_podcastcheckpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResearchSummary",
+            fields=[
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                (
+                    "query_key",
+                    models.CharField(
+                        help_text="The query lower-cased with punctuation collapsed",
+                        max_length=1000,
+                        unique=True,
+                    ),
+                ),
+                ("query", models.TextField()),
+                ("summary", models.TextField()),
+                ("sources", models.JSONField(blank=True, default=list)),
+                ("model_name", models.CharField(max_length=128)),
+                ("expires_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "verbose_name_plural": "research summaries",
+            },
+        ),
+    ]
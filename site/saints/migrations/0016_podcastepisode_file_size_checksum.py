@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0015_researchsummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="podcastepisode",
+            name="checksum",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="SHA-256 of the audio file",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="podcastepisode",
+            name="file_size",
+            field=models.BigIntegerField(blank=True, help_text="Size of the audio file in bytes", null=True),
+        ),
+    ]
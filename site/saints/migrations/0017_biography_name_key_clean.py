@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:31
+
+import re
+
+from django.db import migrations
+
+# Frozen copy of saints.names.name_key as of this migration: rank suffix removed, whitespace collapsed,
+# lower case, accents folded, punctuation collapsed
+RANK_SUFFIX = re.compile(r"\s+(?:Optional Memorial|Solemnity|Feast|Memorial|Commemoration)$")
+WHITESPACE = re.compile(r"\s+")
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+ACCENT_TABLE = str.maketrans(
+    "áàâäãåāăąçćčďéèêëēėęěíìîïīįñńňóòôöõøōőŕřśšşťúùûüūůűųýÿźžż",
+    "aaaaaaaaacccdeeeeeeeeiiiiiinnnoooooooorrssstuuuuuuuuyyzzz",
+)
+
+
+def name_key(name):
+    if name is None:
+        return None
+    name = WHITESPACE.sub(" ", RANK_SUFFIX.sub("", name)).strip()
+    return NON_ALPHANUMERIC.sub(" ", name.lower().translate(ACCENT_TABLE)).strip()
+
+
+def set_name_keys(apps, schema_editor):
+    """Recompute biography keys from the cleaned name, as calendar event keys are."""
+    Biography = apps.get_model("saints", "Biography")
+    changed = []
+    for biography in Biography.objects.only("pk", "name", "name_key").iterator():
+        key = name_key(biography.name)
+        if key != biography.name_key:
+            biography.name_key = key
+            changed.append(biography)
+    Biography.objects.bulk_update(changed, ["name_key"], batch_size=1000)
+    print(f"  name keys: {len(changed)} biographies")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0016_podcastepisode_file_size_checksum"),
+    ]
+
+    operations = [
+        migrations.RunPython(set_name_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 04:34
+
+import hashlib
+
+from django.db import migrations, models
+
+KEY_LENGTH = 255
+
+
+def shorten_keys(apps, schema_editor):
+    """Shorten existing keys that would not fit, as ``saints.jobs.unit_key`` does (frozen here)."""
+    WorkUnit = apps.get_model("saints", "WorkUnit")
+    units = list(WorkUnit.objects.filter(key__regex=r"^.{%d,}$" % (KEY_LENGTH + 1)).only("pk", "key"))
+    for unit in units:
+        digest = hashlib.sha256(unit.key.encode("utf-8")).hexdigest()
+        unit.key = f"{unit.key[:KEY_LENGTH - len(digest) - 1]}#{digest}"
+    WorkUnit.objects.bulk_update(units, ["key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("saints", "0017_biography_name_key_clean"),
+    ]
+
+    operations = [
+        migrations.RunPython(shorten_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="workunit",
+            name="key",
+            field=models.CharField(max_length=255),
+        ),
+    ]
@@ -1,10 +1,14 @@
 import uuid
 from datetime import date
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.db.models import DateTimeField
 from django.conf import settings
 
+from saints.names import name_key
+
 
 class UUIDModel(models.Model):
     uuid = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -154,6 +158,13 @@ class CalendarEvent(models.Model):
     year = models.PositiveSmallIntegerField()
     latin_name = models.CharField(max_length=2500, blank=True, null=True)
     english_name = models.CharField(max_length=2500, blank=True, null=True)
+    name_key = models.CharField(
+        max_length=2500,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="Normalised english_name used to match events across calendars and to biographies",
+    )
     english_translation = models.CharField(max_length=2500, blank=True, null=True)
     color = models.CharField(max_length=255, blank=True, null=True)
     latin_notes = models.CharField(max_length=255, blank=True, null=True)
@@ -176,6 +187,12 @@ class CalendarEvent(models.Model):
     biography = models.ForeignKey(
         "Biography", null=True, blank=True, on_delete=models.SET_NULL, related_name="calendar_events"
     )
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="calendarevent_search_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         if self.year and self.month and self.day and not self.date:
@@ -184,6 +201,7 @@ class CalendarEvent(models.Model):
             self.year = self.date.year
             self.month = self.date.month
             self.day = self.date.day
+        self.name_key = name_key(self.english_name)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -194,6 +212,24 @@ class Biography(BaseModel):
     name = models.CharField(max_length=2500)
     religion = models.CharField(max_length=64)
     calendar = models.CharField(max_length=64)
+    name_key = models.CharField(
+        max_length=2500,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text="Normalised name matched against CalendarEvent.name_key",
+    )
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="biography_search_idx"),
+            GinIndex(fields=["name_key"], name="biography_name_key_trgm_idx", opclasses=["gin_trgm_ops"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.name_key = name_key(self.name)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.name} ({self.religion})"
@@ -299,6 +335,34 @@ class FeastDescriptionModel(models.Model):
     citations = models.ManyToManyField(HagiographyCitationModel, blank=True, related_name="feast_descriptions")
 
 
+class BiographySectionState(BaseModel):
+    """When, how and with what result one section of a ``Biography`` was last generated."""
+
+    STATUS_OK = "ok"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_OK, "OK"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    biography = models.ForeignKey(Biography, on_delete=models.CASCADE, related_name="section_states")
+    section = models.CharField(max_length=64)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_OK)
+    model_name = models.CharField(max_length=128)
+    prompt_hash = models.CharField(max_length=64, help_text="Hash of the prompt template and response schema used")
+    generated_at = models.DateTimeField()
+    input_tokens = models.PositiveIntegerField(default=0)
+    output_tokens = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["biography", "section"], name="unique_biography_section_state"),
+        ]
+
+    def __str__(self):
+        return f"{self.biography} {self.section} ({self.status})"
+
+
 class Podcast(BaseModel):
     slug = models.SlugField(unique=True, max_length=500)
     religion = models.CharField(max_length=64)
@@ -323,6 +387,8 @@ class PodcastEpisode(BaseModel):
     episode_long_description = models.TextField()
     episode_full_text = models.TextField()
     duration = models.IntegerField(null=True, blank=True, help_text="Duration of the episode in seconds")
+    file_size = models.BigIntegerField(null=True, blank=True, help_text="Size of the audio file in bytes")
+    checksum = models.CharField(max_length=64, blank=True, default="", help_text="SHA-256 of the audio file")
     episode_number = models.PositiveIntegerField(null=True, blank=True, help_text="Episode number within the podcast")
 
     class Meta:
@@ -332,6 +398,48 @@ class PodcastEpisode(BaseModel):
         return self.episode_title
 
 
+class PodcastCheckpoint(BaseModel):
+    """The saved output of one episode generation stage, reused when a run is resumed with the same input."""
+
+    podcast = models.ForeignKey(
+        Podcast, on_delete=models.CASCADE, null=True, blank=True, related_name="checkpoints"
+    )
+    date = models.DateField(help_text="Date the episode is for")
+    stage = models.CharField(max_length=32)
+    input_hash = models.CharField(max_length=64, help_text="Hash of the stage's inputs and the settings it depends on")
+    output = models.JSONField()
+    seconds = models.FloatField(default=0, help_text="Time the stage took to produce this output")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["podcast", "date", "stage", "input_hash"], name="unique_podcast_checkpoint"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.podcast} {self.date} {self.stage}"
+
+
+class ResearchSummary(BaseModel):
+    """Synthesized research for one podcast research query, shared by both shows and reused until it expires."""
+
+    query_key = models.CharField(
+        max_length=1000, unique=True, help_text="The query lower-cased with punctuation collapsed"
+    )
+    query = models.TextField()
+    summary = models.TextField()
+    sources = models.JSONField(default=list, blank=True)
+    model_name = models.CharField(max_length=128)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        verbose_name_plural = "research summaries"
+
+    def __str__(self):
+        return self.query
+
+
 class PodcastListenLog(BaseModel):
     """Per-request listen log for podcast media streaming."""
 
@@ -391,3 +499,100 @@ class PodcastListenLog(BaseModel):
     def __str__(self):
         ep = self.episode.episode_title if self.episode else "Unknown episode"
         return f"Listen from {self.ip_address or 'unknown ip'} on {self.created:%Y-%m-%d %H:%M} to {ep}"
+
+
+class SyncState(BaseModel):
+    """Fingerprint of the last upstream calendar document imported for a (source, calendar, month)."""
+
+    STATUS_OK = "ok"
+    STATUS_FAILED = "failed"
+
+    source = models.CharField(max_length=64)
+    calendar = models.CharField(max_length=255)
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField(
+        help_text="Month covered by the upstream document, or 0 for a document covering the whole year"
+    )
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    etag = models.CharField(max_length=255, blank=True, null=True)
+    last_modified = models.CharField(max_length=255, blank=True, null=True)
+    event_count = models.PositiveIntegerField(default=0)
+    last_checked = models.DateTimeField(null=True, blank=True)
+    last_changed = models.DateTimeField(null=True, blank=True)
+    status = models.CharField(max_length=16, choices=[(STATUS_OK, "OK"), (STATUS_FAILED, "Failed")], default=STATUS_OK)
+    attempts = models.PositiveSmallIntegerField(default=0, help_text="Fetch attempts made during the last sync")
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["source", "calendar", "year", "month"], name="unique_sync_state"),
+        ]
+
+    def __str__(self):
+        period = f"{self.year}" if not self.month else f"{self.year}-{self.month:02d}"
+        return f"{self.source} {self.calendar} {period}"
+
+
+class JobRun(BaseModel):
+    """A resumable ingestion job whose work is split into independently claimable ``WorkUnit`` rows."""
+
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_RUNNING, "Running"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    job_type = models.CharField(max_length=64)
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_RUNNING)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created"]
+
+    def __str__(self):
+        return f"{self.job_type} ({self.status}) {self.created:%Y-%m-%d %H:%M}"
+
+
+class WorkUnit(BaseModel):
+    """One idempotent piece of a ``JobRun``, claimed by workers under a time-limited lease."""
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    job = models.ForeignKey(JobRun, on_delete=models.CASCADE, related_name="units")
+    key = models.CharField(max_length=255)
+    position = models.PositiveIntegerField(default=0)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    leased_by = models.CharField(max_length=255, blank=True, null=True)
+    lease_expires = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        ordering = ["position"]
+        constraints = [
+            models.UniqueConstraint(fields=["job", "key"], name="unique_work_unit_key"),
+        ]
+        indexes = [
+            models.Index(fields=["job", "status", "position"]),
+        ]
+
+    def __str__(self):
+        return f"{self.key} ({self.status})"
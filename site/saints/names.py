@@ -0,0 +1,109 @@
+"""Normalisation of calendar event names.
+
+Importers pass every name through ``clean_display_name`` (rank suffixes such as
+" Memorial" removed, whitespace collapsed) and store ``name_key`` alongside it:
+the cleaned name in lower case, common accents folded, punctuation collapsed to
+single spaces.  The key is what names are matched on across calendars and
+against biographies, whose names are not cleaned and may keep their suffix.
+
+The same rules are expressed as SQL in ``NORMALIZE_SQL`` so existing rows can be
+fixed set-based, one statement per rule, and the two must be kept in step.
+"""
+
+import re
+from typing import Dict, Optional
+
+RANK_SUFFIXES = ["Optional Memorial", "Solemnity", "Feast", "Memorial", "Commemoration"]
+RANK_SUFFIX_PATTERN = r"\s+(?:" + "|".join(RANK_SUFFIXES) + r")$"
+
+# Folded with str.translate here and translate() in SQL, so both sides produce identical keys
+ACCENTED = "áàâäãåāăąçćčďéèêëēėęěíìîïīįñńňóòôöõøōőŕřśšşťúùûüūůűųýÿźžż"
+UNACCENTED = (
+    "aaaaaaaaaccc" + "d" + "eeeeeeee" + "iiiiii" + "nnn" + "oooooooo" + "rr" + "sss" + "t" + "uuuuuuuu" + "yy" + "zzz"
+)
+ACCENT_TABLE = str.maketrans(ACCENTED, UNACCENTED)
+
+_rank_suffix = re.compile(RANK_SUFFIX_PATTERN)
+_whitespace = re.compile(r"\s+")
+_non_alphanumeric = re.compile(r"[^a-z0-9]+")
+
+
+def clean_display_name(name: Optional[str]) -> Optional[str]:
+    if name is None:
+        return None
+    return _whitespace.sub(" ", _rank_suffix.sub("", name)).strip()
+
+
+def fold_key(text: Optional[str]) -> Optional[str]:
+    """Lower case, accents folded, punctuation collapsed; no rank suffix is removed."""
+    if text is None:
+        return None
+    return _non_alphanumeric.sub(" ", text.lower().translate(ACCENT_TABLE)).strip()
+
+
+def name_key(name: Optional[str]) -> Optional[str]:
+    return fold_key(clean_display_name(name))
+
+
+def normalize_fields(fields: Dict[str, object]) -> Dict[str, object]:
+    """Clean ``english_name`` in a ``CalendarEvent`` field dict and set its ``name_key``."""
+    if fields.get("english_name") is not None:
+        fields["english_name"] = clean_display_name(fields["english_name"])
+        fields["name_key"] = name_key(fields["english_name"])
+    return fields
+
+
+NORMALIZE_SQL = [
+    (
+        "strip rank suffixes",
+        "UPDATE saints_calendarevent SET english_name = regexp_replace(english_name, %s, '') "
+        "WHERE english_name ~ %s",
+        [RANK_SUFFIX_PATTERN, RANK_SUFFIX_PATTERN],
+    ),
+    (
+        "collapse whitespace",
+        "UPDATE saints_calendarevent SET english_name = btrim(regexp_replace(english_name, '\\s+', ' ', 'g')) "
+        "WHERE english_name ~ '(^\\s|\\s$|\\s\\s|[\\t\\n\\r])'",
+        [],
+    ),
+    (
+        "set name keys",
+        "UPDATE saints_calendarevent "
+        "SET name_key = btrim(regexp_replace(translate(lower(regexp_replace(english_name, %s, '')), %s, %s), "
+        "'[^a-z0-9]+', ' ', 'g')) "
+        "WHERE english_name IS NOT NULL",
+        [RANK_SUFFIX_PATTERN, ACCENTED, UNACCENTED],
+    ),
+]
+
+
+def normalize_calendar_events(connection, model, batch_size: int = 1000) -> Dict[str, int]:
+    """Apply the normalisation rules to every stored ``CalendarEvent``; returns rows changed per rule.
+
+    On PostgreSQL each rule is a single UPDATE.  Other backends (lacking
+    ``regexp_replace``) fall back to batched bulk updates.
+    """
+    if connection.vendor == "postgresql":
+        changed = {}
+        with connection.cursor() as cursor:
+            for label, sql, params in NORMALIZE_SQL:
+                cursor.execute(sql, params)
+                changed[label] = cursor.rowcount
+        return changed
+
+    changed = 0
+    batch = []
+    for event in model.objects.exclude(english_name=None).only("pk", "english_name", "name_key").iterator():
+        name = clean_display_name(event.english_name)
+        key = name_key(name)
+        if (name, key) != (event.english_name, event.name_key):
+            event.english_name, event.name_key = name, key
+            batch.append(event)
+        if len(batch) >= batch_size:
+            model.objects.bulk_update(batch, ["english_name", "name_key"])
+            changed += len(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_update(batch, ["english_name", "name_key"])
+        changed += len(batch)
+    return {"normalized": changed}
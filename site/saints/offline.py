@@ -0,0 +1,261 @@
+"""Local stand-ins for the podcast generator's outside services, for benchmarks and offline runs.
+
+* ``FakeLLM`` answers the ``offline`` AI provider (``saints.ai_providers``)
+  with deterministic, schema-valid replies: research queries, summaries,
+  ``StructuredResponse`` feasts, ``PodcastScriptModel`` and
+  ``KidsPodcastScriptModel`` scripts and episode metadata.  Like a real model
+  it reads what it needs from the prompt: the hosts' names, the allowed voice
+  ids and the keys a JSON object should have.
+* ``FakeCustomSearch`` stands in for the Google Custom Search client.
+* ``FakeElevenLabs`` stands in for the ElevenLabs client, returning real
+  (silent) MP3 frames of about the length the text would take to say.
+
+Each waits as configured by the ``OFFLINE_*`` settings, read on every call so
+``benchmark_podcast`` can change them.  Replies depend only on the request, so
+repeated runs do the same work.
+"""
+
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from saints import settings
+from saints.podcast_generator import (
+    KidsPodcastScriptModel,
+    PodcastLineModel,
+    PodcastScriptModel,
+    ResearchQueryModel,
+    ScriptLineModel,
+    StructuredBioModel,
+    StructuredResponse,
+    VoiceAssignment,
+)
+
+SAINTS = [
+    "Saint Martin of Tours",
+    "Saint Cecilia",
+    "Saint Nicholas",
+    "Saint Lucy",
+    "Saint Francis of Assisi",
+    "Saint Teresa of Avila",
+    "Saint Benedict",
+    "Saint Scholastica",
+    "Saint Patrick",
+    "Saint Clare",
+]
+TOPICS = ["feast day customs", "patronage", "early life", "miracles", "relics", "hymns", "iconography", "legends"]
+WORDS = (
+    "pilgrims gathered at the shrine bread was blessed and shared the bishop preached on charity "
+    "the village kept a vigil candles were lit for the poor a hymn was sung at dawn the monks copied "
+    "the story into their chronicle children carried lanterns through the streets the relics were "
+    "translated to a new church the faithful asked for healing the legend grew with each telling"
+).split()
+# The hosts named in the adult script prompt ("dialogue between hosts Maria and John")
+HOSTS = re.compile(r"hosts (\w+) and (\w+)")
+# ElevenLabs voice ids listed in the kids script prompt ("- 7tRwuZTD1EWi6nydVerp: ['Narrator'] (male)")
+VOICE_ID = re.compile(r"^- ([A-Za-z0-9]{20}):", re.MULTILINE)
+# "Return only a JSON object with keys: subtitle, short_description, long_description."
+JSON_KEYS = re.compile(r"keys: ([\w, ]+)")
+
+# One silent MPEG-1 Layer III frame: 128 kbit/s, 44.1 kHz, mono, no CRC.  Every side-info and main-data
+# byte is zero, which decodes as 1152 samples of silence.
+MP3_SAMPLES_PER_FRAME = 1152
+MP3_SAMPLE_RATE = 44100
+MP3_FRAME_BYTES = 144 * 128000 / MP3_SAMPLE_RATE
+
+
+def mp3_frame(padded: bool) -> bytes:
+    header = bytes([0xFF, 0xFB, 0x92 if padded else 0x90, 0xC4])
+    return header + bytes(int(MP3_FRAME_BYTES) + padded - len(header))
+
+
+SILENT_FRAMES = (mp3_frame(False), mp3_frame(True))
+
+
+def silent_mp3(seconds: float) -> bytes:
+    """``seconds`` of silence as an MP3 stream, padding frames as an encoder would to keep 128 kbit/s."""
+    frames = max(1, math.ceil(seconds * MP3_SAMPLE_RATE / MP3_SAMPLES_PER_FRAME))
+    out = bytearray()
+    owed = 0.0
+    for _ in range(frames):
+        owed += MP3_FRAME_BYTES - int(MP3_FRAME_BYTES)
+        padded = owed >= 1
+        owed -= padded
+        out += SILENT_FRAMES[padded]
+    return bytes(out)
+
+
+def seeded(*parts: Any) -> random.Random:
+    text = json.dumps(parts, sort_keys=True, default=str)
+    return random.Random(hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+
+def sentences(rng: random.Random, count: int) -> str:
+    return " ".join(" ".join(rng.choices(WORDS, k=rng.randint(10, 18))).capitalize() + "." for _ in range(count))
+
+
+def prompt_text(messages: Sequence[Dict[str, Any]]) -> str:
+    return "\n".join(str(message.get("content", "")) for message in messages)
+
+
+def payload(messages: Sequence[Dict[str, Any]]) -> str:
+    """The data the last message carries after its instructions (JSON biographies or script data), if any."""
+    content = str(messages[-1].get("content", "")) if messages else ""
+    for marker in ("\nDATA:\n", "\n[", "\n{"):
+        if marker in content:
+            return content[content.index(marker) :]
+    return content
+
+
+class FakeLLM:
+    def reply(
+        self,
+        messages: Sequence[Dict[str, Any]],
+        response_model: Optional[Type[BaseModel]] = None,
+        json_object: bool = False,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """The reply text: JSON for ``response_model`` or a JSON object, otherwise prose that fits ``max_tokens``."""
+        rng = seeded(messages, response_model.__name__ if response_model else json_object)
+        prompt = prompt_text(messages)
+        if response_model is ResearchQueryModel:
+            # Seeded by the biographies alone, so both shows ask the same questions about the same day
+            rng = seeded(payload(messages))
+            saints = rng.sample(SAINTS, 2)
+            queries = [f"{saint} {topic}" for saint in saints for topic in rng.sample(TOPICS, 3)]
+            return ResearchQueryModel(queries=queries).model_dump_json()
+        if response_model is StructuredResponse:
+            return StructuredResponse(feasts=[self.feast(rng) for _ in range(2)]).model_dump_json()
+        if response_model is PodcastScriptModel:
+            return self.script(rng, prompt).model_dump_json()
+        if response_model is KidsPodcastScriptModel:
+            return self.kids_script(rng, prompt).model_dump_json()
+        if response_model is not None:
+            raise ValueError(f"No offline reply for {response_model.__name__}")
+        if json_object:
+            match = JSON_KEYS.search(prompt)
+            keys = [key.strip() for key in match.group(1).split(",") if key.strip()] if match else []
+            return json.dumps({key: sentences(rng, 2) for key in keys})
+        # A sentence is about 30 tokens; an episode title (100 tokens) gets one, a research summary eight
+        return sentences(rng, max(1, min(8, (max_tokens or 1000) // 100)))
+
+    @staticmethod
+    def feast(rng: random.Random) -> StructuredBioModel:
+        return StructuredBioModel(
+            Title=rng.choice(SAINTS),
+            Calendars=["catholic"],
+            Summary=sentences(rng, 4),
+            Themes=[rng.choice(TOPICS) for _ in range(3)],
+            CommemorationIdeas=[sentences(rng, 1) for _ in range(2)],
+            DiscussionQuestion=sentences(rng, 1),
+            Traditions=[sentences(rng, 1) for _ in range(2)],
+            Legends=[sentences(rng, 1)],
+        )
+
+    @staticmethod
+    def script(rng: random.Random, prompt: str) -> PodcastScriptModel:
+        match = HOSTS.search(prompt)
+        hosts = list(match.groups()) if match else ["Host", "Guest"]
+        lines = [
+            PodcastLineModel(PodcastHostName=hosts[index % 2], Content=sentences(rng, rng.randint(2, 5)))
+            for index in range(settings.OFFLINE_SCRIPT_LINES)
+        ]
+        return PodcastScriptModel(lines=lines)
+
+    @staticmethod
+    def kids_script(rng: random.Random, prompt: str) -> KidsPodcastScriptModel:
+        voice_ids = VOICE_ID.findall(prompt) or ["offline-voice"]
+        characters = ["Narrator", "Saint", "Villager", "Child"]
+        voices = [
+            VoiceAssignment(character=character, voice_id=voice_ids[index % len(voice_ids)])
+            for index, character in enumerate(characters)
+        ]
+        lines = [
+            ScriptLineModel(character=rng.choice(characters), text=sentences(rng, rng.randint(2, 5)))
+            for _ in range(settings.OFFLINE_SCRIPT_LINES)
+        ]
+        return KidsPodcastScriptModel(
+            title=sentences(rng, 1),
+            saint_name=rng.choice(SAINTS),
+            characters=characters,
+            script_lines=lines,
+            voices=voices,
+        )
+
+    @staticmethod
+    def usage(messages: Sequence[Dict[str, Any]], reply: str) -> Tuple[int, int]:
+        """Token counts at the usual four characters a token."""
+        return len(json.dumps(messages)) // 4, len(reply) // 4
+
+    def complete(
+        self,
+        messages: Sequence[Dict[str, Any]],
+        response_model: Optional[Type[BaseModel]] = None,
+        json_object: bool = False,
+        max_tokens: Optional[int] = None,
+    ) -> Tuple[str, Tuple[int, int]]:
+        """The whole reply after the time a model would take to write it; returns the text and token usage."""
+        text = self.reply(messages, response_model, json_object, max_tokens)
+        time.sleep(settings.OFFLINE_LLM_SECONDS + len(text) / settings.OFFLINE_LLM_CHARS_PER_SECOND)
+        return text, self.usage(messages, text)
+
+    def stream(self, messages: Sequence[Dict[str, Any]], response_model: Type[BaseModel]) -> Iterator[str]:
+        """The reply in small pieces at the model's writing speed."""
+        text = self.reply(messages, response_model)
+        time.sleep(settings.OFFLINE_LLM_SECONDS)
+        for start in range(0, len(text), 40):
+            delta = text[start : start + 40]
+            time.sleep(len(delta) / settings.OFFLINE_LLM_CHARS_PER_SECOND)
+            yield delta
+
+
+class FakeCustomSearch:
+    """``build("customsearch", "v1", ...)``: ``cse().list(q=...).execute()`` returns five results."""
+
+    def cse(self) -> "FakeCustomSearch":
+        return self
+
+    def list(self, q: str, num: int = 5, **kwargs) -> "FakeSearchRequest":
+        return FakeSearchRequest(q, num)
+
+
+class FakeSearchRequest:
+    def __init__(self, query: str, num: int):
+        self.query = query
+        self.num = num
+
+    def execute(self) -> Dict[str, List[Dict[str, str]]]:
+        time.sleep(settings.OFFLINE_SEARCH_SECONDS)
+        rng = seeded(self.query)
+        items = []
+        for index in range(self.num):
+            host = f"example{rng.randint(1, 99)}.org"
+            items.append(
+                {
+                    "title": f"{self.query} ({index + 1})",
+                    "snippet": sentences(rng, 2),
+                    "link": f"https://{host}/{index}",
+                    "displayLink": host,
+                }
+            )
+        return {"items": items}
+
+
+class FakeTextToDialogue:
+    def convert(self, inputs: Sequence[Any], model_id: str, output_format: str) -> Iterator[bytes]:
+        """Silent audio as long as the text would take to say, streamed in chunks like the real API."""
+        chars = sum(len(item.text) for item in inputs)
+        time.sleep(settings.OFFLINE_TTS_SECONDS)
+        audio = silent_mp3(chars / settings.OFFLINE_SPEECH_CHARS_PER_SECOND)
+        return (audio[start : start + 65536] for start in range(0, len(audio), 65536))
+
+
+class FakeElevenLabs:
+    def __init__(self):
+        self.text_to_dialogue = FakeTextToDialogue()
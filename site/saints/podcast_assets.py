@@ -0,0 +1,112 @@
+"""Intro and outro music, analysed and rendered once per file.
+
+``prepare`` hashes a file in ``MEDIA_ROOT/podcast_assets`` and looks the hash
+up in ``PODCAST_ASSET_CACHE_DIR``.  On a miss it measures the file's duration
+and loudness, renders a faded-out 44.1 kHz PCM WAV levelled to the mastering
+target, and measures that too, storing the figures in a JSON record next to
+it.  Episodes of either show then master with the rendered WAV: it is cheap
+to decode, needs no fade or gain, and is never re-measured.
+
+The cache key includes the fade length and loudness settings, so changing them
+in ``saints.mastering`` renders the music again instead of reusing stale files.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+
+from django.conf import settings
+
+from saints import mastering
+from saints.audio_cache import digest
+
+PCM_OUTPUT = ["-ar", str(mastering.SAMPLE_RATE), "-ac", "2", "-c:a", "pcm_s16le"]
+
+_lock = threading.Lock()
+
+
+@dataclass
+class PreparedAsset:
+    source: str
+    sha256: str
+    duration: float
+    rendered_path: str
+    # ebur128 figures of the source file and of the rendered WAV
+    measured: Dict[str, float] = field(default_factory=dict)
+    rendered: Dict[str, float] = field(default_factory=dict)
+
+    def track(self) -> mastering.Track:
+        return mastering.Track(self.rendered_path, measured=self.rendered)
+
+
+def file_sha256(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def asset_path(name: str) -> str:
+    return os.path.join(settings.MEDIA_ROOT, "podcast_assets", name)
+
+
+def render(source: str, duration: float, measured: Dict[str, float], output_path: str) -> None:
+    track = mastering.music_track(source, duration)
+    filters = ",".join(mastering.track_filters(track, mastering.track_gain(measured)) + [mastering.LIMITER])
+    subprocess.run(
+        ["ffmpeg", "-y", "-hide_banner", "-nostats", "-i", source, "-af", filters] + PCM_OUTPUT + [output_path],
+        capture_output=True,
+        check=True,
+    )
+
+
+def prepare(source: str, cache_dir: Optional[str] = None) -> PreparedAsset:
+    """The prepared version of the music file ``source``, analysing and rendering it if not cached yet."""
+    cache_dir = cache_dir or settings.PODCAST_ASSET_CACHE_DIR
+    sha256 = file_sha256(source)
+    key = digest(sha256, mastering.FADE_SECONDS, mastering.TARGET_I, mastering.TARGET_TP, mastering.LIMITER_MARGIN)
+    record_path = os.path.join(cache_dir, f"{key}.json")
+    rendered_path = os.path.join(cache_dir, f"{key}.wav")
+
+    # One render per asset even when both shows are built at once
+    with _lock:
+        if os.path.exists(record_path) and os.path.exists(rendered_path):
+            with open(record_path) as f:
+                record = json.load(f)
+            return PreparedAsset(**dict(record, source=source, rendered_path=rendered_path))
+
+        os.makedirs(cache_dir, exist_ok=True)
+        duration = mastering.probe_duration(source)
+        measured = mastering.measure(source)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".wav")
+        os.close(fd)
+        try:
+            render(source, duration, measured, tmp_path)
+            rendered = mastering.measure(tmp_path)
+            os.replace(tmp_path, rendered_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        asset = PreparedAsset(source, sha256, duration, rendered_path, measured, rendered)
+        record = {name: value for name, value in asdict(asset).items() if name not in ("source", "rendered_path")}
+        with open(record_path, "w") as f:
+            json.dump(record, f, indent=2)
+        print(
+            f"[GEN] Prepared {os.path.basename(source)}: {duration:.1f}s, "
+            f"{measured['input_i']} LUFS levelled to {rendered['input_i']} LUFS"
+        )
+        return asset
+
+
+def music_track(source: Optional[str]) -> Optional[mastering.Track]:
+    """The mastering track for an intro or outro file, or None without one."""
+    if not source:
+        return None
+    return prepare(source).track()
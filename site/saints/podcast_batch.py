@@ -0,0 +1,97 @@
+"""Generate episodes for a range of dates, to keep a buffer of episodes ready ahead of time.
+
+``generate_dates`` builds every show's episode for each date, a few at a
+time, skipping dates a show already has an episode for.  All dates share one
+``SharedResearch`` (on top of the research cache, the TTS cache and the pooled
+AI providers every run already shares), so a saint whose research is in
+flight for one date is not researched again for another.  Each episode still
+publishes at 5 PM US Eastern on the eve of its date.
+
+Episodes are built concurrently but each show's episodes are inserted in date
+order, so episode numbers follow the calendar even when a later date finishes
+first.  A failed date is reported and does not stop the others.
+"""
+
+import datetime
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from django.db import connection
+
+from saints.day_context import DayContext, SharedResearch
+
+GENERATED = "generated"
+EXISTS = "exists"
+FAILED = "failed"
+
+
+@dataclass
+class DateResult:
+    date: datetime.date
+    show: str
+    status: str
+    seconds: float
+    path: Optional[str] = None
+    error: Optional[str] = None
+
+
+def episode_dates(start: datetime.date, days: int) -> List[datetime.date]:
+    return [start + datetime.timedelta(days=offset) for offset in range(days)]
+
+
+def generate_dates(
+    shows: Sequence[Tuple[str, Callable[..., Optional[str]]]],
+    dates: Sequence[datetime.date],
+    concurrency: int = 2,
+    resume: bool = False,
+    from_stage: Optional[str] = None,
+) -> List[DateResult]:
+    """Build each show's episode for each of ``dates``; returns one result per show and date, in date order.
+
+    ``shows`` pairs a label with a ``generate_podcast_for_date`` function; at most ``concurrency`` episodes
+    are built at once.
+    """
+    dates = sorted(dates)
+    research = SharedResearch()
+    contexts = {target_date: DayContext.build(target_date, research) for target_date in dates}
+    inserted: Dict[Tuple[str, datetime.date], threading.Event] = {
+        (label, target_date): threading.Event() for label, _ in shows for target_date in dates
+    }
+
+    def run(label: str, generate: Callable[..., Optional[str]], index: int) -> DateResult:
+        target_date = dates[index]
+
+        def before_insert():
+            # Tasks start in date order, so the earlier date is already being built (or done)
+            if index:
+                inserted[(label, dates[index - 1])].wait()
+
+        started = time.monotonic()
+        try:
+            path = generate(
+                target_date,
+                resume=resume,
+                from_stage=from_stage,
+                context=contexts[target_date],
+                before_insert=before_insert,
+            )
+            status = EXISTS if path is None else GENERATED
+            result = DateResult(target_date, label, status, time.monotonic() - started, path=path)
+        except Exception as e:
+            traceback.print_exc()
+            result = DateResult(target_date, label, FAILED, time.monotonic() - started, error=str(e))
+        finally:
+            inserted[(label, target_date)].set()
+            connection.close()
+        print(f"[GEN] {label} {target_date}: {result.status} ({result.seconds:.1f}s)")
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="podcast") as pool:
+        futures = [
+            pool.submit(run, label, generate, index) for index in range(len(dates)) for label, generate in shows
+        ]
+    return [future.result() for future in futures]
@@ -0,0 +1,93 @@
+"""Saved stage outputs for episode generation, so a failed run can resume where it stopped.
+
+``PodcastGenerator.create_full_podcast`` runs each expensive stage through
+``Checkpoints.run``.  The stage's output is stored as a ``PodcastCheckpoint``
+keyed by podcast, episode date, stage and a hash of the stage's inputs (the
+previous stages' outputs plus the prompts, model and voices it uses).  A
+resumed run reuses a checkpoint only when that hash matches, so edited
+biographies, prompts or voices rebuild the stages they feed and everything
+after them.
+
+Checkpoints are always written; they are only read with ``resume`` or
+``from_stage``.  ``from_stage`` rebuilds that stage and every later one while
+reusing the earlier ones.
+"""
+
+import contextlib
+import datetime
+import time
+from typing import Any, Callable, ContextManager, Optional
+
+from saints.audio_cache import digest
+from saints.models import Podcast, PodcastCheckpoint
+
+# In pipeline order.  The biographies are read fresh on every run (a cheap query whose result keys
+# the first stage), and the PodcastEpisode row is the record of the last step.
+STAGES = ["queries", "research", "structured", "script", "audio", "metadata"]
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+class Checkpoints:
+    def __init__(
+        self,
+        podcast: Optional[Podcast],
+        target_date: datetime.date,
+        resume: bool = False,
+        from_stage: Optional[str] = None,
+        measure: Optional[Callable[[str], ContextManager[Any]]] = None,
+    ):
+        if from_stage is not None and from_stage not in STAGES:
+            raise ValueError(f"Unknown stage {from_stage!r}; expected one of {', '.join(STAGES)}")
+        self.podcast = podcast
+        self.target_date = target_date
+        self.resume = resume or from_stage is not None
+        self.rebuild_from = STAGES.index(from_stage) if from_stage is not None else len(STAGES)
+        # Wrapped around each stage that is computed, e.g. benchmark_podcast's resource meter
+        self.measure = measure or (lambda stage: contextlib.nullcontext())
+
+    def reusable(self, stage: str) -> bool:
+        return self.resume and STAGES.index(stage) < self.rebuild_from
+
+    def load(self, stage: str, input_hash: str) -> Optional[PodcastCheckpoint]:
+        return PodcastCheckpoint.objects.filter(
+            podcast=self.podcast, date=self.target_date, stage=stage, input_hash=input_hash
+        ).first()
+
+    def save(self, stage: str, input_hash: str, output: Any, seconds: float) -> None:
+        PodcastCheckpoint.objects.update_or_create(
+            podcast=self.podcast,
+            date=self.target_date,
+            stage=stage,
+            input_hash=input_hash,
+            defaults={"output": output, "seconds": seconds},
+        )
+
+    def run(
+        self,
+        stage: str,
+        inputs: Any,
+        compute: Callable[[], Any],
+        dump: Callable[[Any], Any] = identity,
+        restore: Callable[[Any], Any] = identity,
+        valid: Callable[[Any], bool] = lambda output: True,
+    ) -> Any:
+        """The result of ``compute()``, or of ``restore`` on a matching checkpoint when resuming.
+
+        ``inputs`` must be JSON-serialisable; ``dump`` turns the result into JSON for storage and
+        ``restore`` turns it back.  ``valid`` can reject a stored output whose side effects are gone
+        (an audio file deleted from storage, say), which is then rebuilt.
+        """
+        input_hash = digest(stage, inputs)
+        if self.reusable(stage):
+            checkpoint = self.load(stage, input_hash)
+            if checkpoint is not None and valid(checkpoint.output):
+                print(f"[GEN] Resuming {stage} from checkpoint of {checkpoint.updated:%Y-%m-%d %H:%M}")
+                return restore(checkpoint.output)
+        started = time.monotonic()
+        with self.measure(stage):
+            result = compute()
+        self.save(stage, input_hash, dump(result), time.monotonic() - started)
+        return result
@@ -2,14 +2,14 @@ import os
 import io
 import json
 import tempfile
-import subprocess
 import string
+import time
 import datetime
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
 
 from django.conf import settings
-from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.utils import timezone
 from django.utils.timezone import make_aware
@@ -18,8 +18,18 @@ from django.utils.text import slugify
 from elevenlabs import DialogueInput, ElevenLabs
 from pydantic import BaseModel, Field, model_validator
 
-from saints.models import CalendarEvent, Podcast, PodcastEpisode
-from saints.api import BiographySerializer
+from saints import (
+    ai_providers,
+    audio_storage,
+    day_context,
+    json_stream,
+    mastering,
+    podcast_assets,
+    research_cache,
+    tts,
+)
+from saints.podcast_checkpoints import Checkpoints
+from saints.models import Podcast, PodcastEpisode
 
 # Optional Google Search imports
 from googleapiclient.discovery import build
@@ -112,10 +122,12 @@ class KidsPodcastScriptModel(BaseModel):
 
 @dataclass
 class AIConfig:
-    provider: str = "openai"  # 'openai', 'grok', 'anthropic'
+    provider: str = "openai"  # 'openai', 'grok', 'anthropic', 'offline'
     model: str = "gpt-5"
     base_url: Optional[str] = None
     api_key_env: Optional[str] = None
+    # Stream the script into ElevenLabs as it is written (fixed voices only)
+    stream_script: bool = False
 
 
 @dataclass
@@ -142,6 +154,13 @@ class PodcastLinkageConfig:
     podcast_slug: Optional[str] = None
 
 
+@dataclass
+class ServicesConfig:
+    # 'offline' swaps in the saints.offline stand-ins, whose output never enters the shared caches
+    search: str = "google"  # 'google' or 'offline'
+    tts: str = "elevenlabs"  # 'elevenlabs' or 'offline'
+
+
 @dataclass
 class PromptsConfig:
     identify_research_queries_prompt: str
@@ -157,6 +176,7 @@ class GeneratorConfig:
     audio: AudioAssetsConfig
     output: OutputConfig
     linkage: PodcastLinkageConfig
+    services: ServicesConfig = field(default_factory=ServicesConfig)
 
 
 # ------------------------------
@@ -167,118 +187,20 @@ class GeneratorConfig:
 class PodcastGenerator:
     def __init__(self, config: GeneratorConfig):
         self.config = config
+        # Every LLM call of the current run, for the summary printed at the end
+        self.ai_calls: List[ai_providers.AICall] = []
 
     # --- AI helpers ---
-    def _get_ai_client(self):
+    def _provider(self) -> ai_providers.Provider:
         cfg = self.config.ai
-        if cfg.provider == "openai":
-            from openai import OpenAI
-            if cfg.base_url or cfg.api_key_env:
-                api_key = os.getenv(cfg.api_key_env) if cfg.api_key_env else None
-                return OpenAI(api_key=api_key, base_url=cfg.base_url)  # type: ignore
-            return OpenAI()
-        elif cfg.provider == "grok":
-            from openai import OpenAI
-            api_key = os.getenv(cfg.api_key_env or "XAI_API_KEY")
-            if not api_key:
-                raise ValueError("XAI_API_KEY environment variable is required for Grok")
-            return OpenAI(api_key=api_key, base_url=cfg.base_url or "https://api.x.ai/v1")
-        elif cfg.provider == "anthropic":
-            from anthropic import Anthropic
-            api_key = os.getenv(cfg.api_key_env or "ANTHROPIC_API_KEY")
-            if not api_key:
-                raise ValueError("ANTHROPIC_API_KEY environment variable is required for Anthropic")
-            return Anthropic(api_key=api_key)
-        else:
-            raise ValueError(f"Unsupported AI provider: {cfg.provider}")
+        return ai_providers.get_provider(cfg.provider, cfg.model, cfg.base_url, cfg.api_key_env)
 
     def _model_name(self) -> str:
         return self.config.ai.model
 
     def _structured_completion(self, messages: List[Dict[str, Any]], response_format_model: Any):
-        provider = self.config.ai.provider
-        print(f"[GEN] Using AI provider={provider}, model={self._model_name()}")
-        model = self._model_name()
-        client = self._get_ai_client()
-
-        if provider == "openai":
-            # Use OpenAI's structured output with .parse()
-            response = client.beta.chat.completions.parse(
-                model=model,
-                messages=messages,
-                response_format=response_format_model,
-            )
-            return response.choices[0].message.parsed
-        elif provider == "anthropic":
-            enhanced_messages = messages.copy()
-            system_message = None
-            if enhanced_messages and enhanced_messages[0]["role"] == "system":
-                system_message = enhanced_messages[0]["content"]
-                enhanced_messages = enhanced_messages[1:]
-                # Create a simplified schema description
-                if hasattr(response_format_model, "__name__") and response_format_model.__name__ == "PodcastScriptModel":
-                    schema_description = '{"lines": [{"PodcastHostName": "string", "Content": "string", "SystemInstructions": "string"}]}'
-                elif hasattr(response_format_model, "__name__") and response_format_model.__name__ == "KidsPodcastScriptModel":
-                    schema_description = '{"title": "string", "saint_name": "string", "characters": ["string"], "script_lines": [{"character": "string", "text": "string"}], "voices": [{"character": "string", "voice_id": "string"}]}'
-                elif hasattr(response_format_model, "__name__") and response_format_model.__name__ == "StructuredResponse":
-                    schema_description = '{"feasts": [{"Title": "string", "Calendars": ["string"], "Summary": "string", "Themes": ["string"], "CommemorationIdeas": ["string"], "DiscussionQuestion": "string", "Traditions": ["string"]}]}'
-                elif hasattr(response_format_model, "__name__") and response_format_model.__name__ == "ResearchQueryModel":
-                    schema_description = '{"queries": ["string"]}'
-                else:
-                    schema_description = str(response_format_model.model_json_schema())
-                system_message += (
-                    f"\n\nIMPORTANT: Return your response as valid JSON that matches this exact structure: {schema_description}"
-                )
-
-            if system_message:
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=8000,
-                    system=system_message,
-                    messages=enhanced_messages,
-                )
-            else:
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=8000,
-                    messages=enhanced_messages,
-                )
-
-            content = response.content[0].text
-            if isinstance(content, str):
-                import json as _json
-                parsed_json = _json.loads(content)
-                return response_format_model.model_validate(parsed_json)
-            return content
-        else:
-            # Grok / OpenAI-compatible JSON mode
-            enhanced_messages = messages.copy()
-            if enhanced_messages and enhanced_messages[0]["role"] == "system":
-                if hasattr(response_format_model, "__name__") and response_format_model.__name__ == "PodcastScriptModel":
-                    schema_description = '{"lines": [{"PodcastHostName": "string", "Content": "string", "SystemInstructions": "string"}]}'
-                elif hasattr(response_format_model, "__name__") and response_format_model.__name__ == "KidsPodcastScriptModel":
-                    schema_description = '{"title": "string", "saint_name": "string", "characters": ["string"], "script_lines": [{"character": "string", "text": "string"}], "voices": [{"character": "string", "voice_id": "string"}]}'
-                elif hasattr(response_format_model, "__name__") and response_format_model.__name__ == "StructuredResponse":
-                    schema_description = '{"feasts": [{"Title": "string", "Calendars": ["string"], "Summary": "string", "Themes": ["string"], "CommemorationIdeas": ["string"], "DiscussionQuestion": "string", "Traditions": ["string"]}]}'
-                elif hasattr(response_format_model, "__name__") and response_format_model.__name__ == "ResearchQueryModel":
-                    schema_description = '{"queries": ["string"]}'
-                else:
-                    schema_description = str(response_format_model.model_json_schema())
-                enhanced_messages[0]["content"] += (
-                    f"\n\nIMPORTANT: Return your response as valid JSON that matches this exact structure: {schema_description}"
-                )
-
-            response = self._get_ai_client().chat.completions.create(
-                model=model,
-                messages=enhanced_messages,
-                response_format={"type": "json_object"},
-            )
-            content = response.choices[0].message.content
-            if isinstance(content, str):
-                import json as _json
-                parsed_json = _json.loads(content)
-                return response_format_model.model_validate(parsed_json)
-            return content
+        print(f"[GEN] Using AI provider={self.config.ai.provider}, model={self._model_name()}")
+        return self._provider().structured(messages, response_format_model, log=self.ai_calls)
 
     # --- Data assembly helpers ---
     def _generate_podcast_filename(self, target_date: datetime.date) -> str:
@@ -294,29 +216,7 @@ class PodcastGenerator:
 
     def _get_biographies_for_day(self, target_date: datetime.date) -> List[Dict[str, Any]]:
         print(f"[GEN] Fetching biographies for {target_date}")
-        calendar_priority = [
-            "catholic",
-            "Divino Afflatu - 1954",
-            "Rubrics 1960 - 1960",
-            "ordinariate",
-        ]
-        events = CalendarEvent.objects.filter(date=target_date, calendar__in=calendar_priority)
-        if not events.exists():
-            return []
-        events_by_calendar: Dict[str, List[Any]] = {}
-        for event in events:
-            if hasattr(event, "biography") and event.biography:
-                cal = event.calendar
-                if cal not in events_by_calendar:
-                    events_by_calendar[cal] = []
-                events_by_calendar[cal].append(event.biography)
-
-        prioritized_biographies: List[Any] = []
-        for cal in calendar_priority:
-            if cal in events_by_calendar:
-                prioritized_biographies.extend(events_by_calendar[cal])
-
-        return BiographySerializer(prioritized_biographies, many=True).data
+        return day_context.biographies_for_day(target_date)
 
     def _identify_research_queries(self, bios: List[Dict[str, Any]]) -> List[str]:
         print("[GEN] Identifying research queries from bios")
@@ -330,9 +230,16 @@ class PodcastGenerator:
         )
         return result.queries
 
+    def _search_service(self, api_key: str):
+        if self.config.services.search == "offline":
+            from saints.offline import FakeCustomSearch
+
+            return FakeCustomSearch()
+        return build("customsearch", "v1", developerKey=api_key)
+
     def _perform_google_search(self, query: str, api_key: str, cse_id: str) -> List[Dict[str, Any]]:
         try:
-            service = build("customsearch", "v1", developerKey=api_key)
+            service = self._search_service(api_key)
             search_query = f"{query} Catholic saint feast tradition"
             result = (
                 service.cse()
@@ -355,9 +262,6 @@ class PodcastGenerator:
             return []
 
     def _synthesize_search_results(self, query: str, search_results: List[Dict[str, Any]]) -> str:
-        if not search_results:
-            return self._fallback_ai_research([query])[0]["summary"]
-
         search_data = {"query": query, "results": search_results}
         prompt = (
             f"You are researching information for a Catholic podcast about saints and feasts. "
@@ -373,100 +277,114 @@ class PodcastGenerator:
             f"Keep it under 200 words and make it engaging for podcast content.\n\n"
             f"Search results:\n{json.dumps(search_data, indent=2)}"
         )
+        return self._research_completion(prompt)
+
+    def _ai_research(self, query: str) -> str:
+        prompt = (
+            f"Research the following topic for a Catholic podcast about saints and feasts: {query}\n\n"
+            f"Provide a concise, factual, and engaging summary (under 200 words) that includes:\n"
+            f"- Historical context and facts\n"
+            f"- Spiritual significance\n"
+            f"- Interesting traditions or customs\n"
+            f"- Any inspiring stories or legends\n"
+            f"Write in a warm, accessible tone suitable for family listening."
+        )
+        return self._research_completion(prompt)
 
-        provider = self.config.ai.provider
-        model = self._model_name()
-        client = self._get_ai_client()
+    def _research_completion(self, prompt: str) -> str:
+        return self._provider().text(
+            [
+                {
+                    "role": "system",
+                    "content": "You are a knowledgeable Catholic researcher and podcast content creator.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            label="research",
+            log=self.ai_calls,
+        )
 
+    def _research_query(
+        self, query: str, google_api_key: Optional[str], google_cse_id: Optional[str]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Summarize the query's Google results, or ask the model directly without search keys or results.
+
+        The flag is False for the placeholder summaries used when the model call fails; those are not cached.
+        """
+        search_results: List[Dict[str, Any]] = []
+        if google_api_key and google_cse_id:
+            search_results = self._perform_google_search(query, google_api_key, google_cse_id)
+        if search_results:
+            sources = [r.get("link", "") for r in search_results[:3]]
+            try:
+                summary = self._synthesize_search_results(query, search_results)
+                return {"query": query, "summary": summary, "sources": sources}, True
+            except Exception:
+                snippets = [r.get("snippet", "") for r in search_results[:3]]
+                return {"query": query, "summary": f"Research on {query}: {' '.join(snippets)}", "sources": sources}, False
         try:
-            if provider == "anthropic":
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=1000,
-                    messages=[
-                        {"role": "user", "content": f"You are a knowledgeable Catholic researcher and podcast content creator.\n\n{prompt}"}
-                    ],
-                )
-                return response.content[0].text.strip()
-            else:
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a knowledgeable Catholic researcher and podcast content creator.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                )
-                return response.choices[0].message.content.strip()
+            return {"query": query, "summary": self._ai_research(query), "sources": []}, True
         except Exception:
-            snippets = [r.get("snippet", "") for r in search_results[:3]]
-            return f"Research on {query}: {' '.join(snippets)}"
+            return {"query": query, "summary": f"Research summary for: {query}", "sources": []}, False
 
-    def _fallback_ai_research(self, queries: List[str]) -> List[Dict[str, str]]:
-        print("[GEN] Supplementing with web searches where available")
-        results: List[Dict[str, str]] = []
-        provider = self.config.ai.provider
-        model = self._model_name()
-        client = self._get_ai_client()
-        for query in queries:
-            try:
-                prompt = (
-                    f"Research the following topic for a Catholic podcast about saints and feasts: {query}\n\n"
-                    f"Provide a concise, factual, and engaging summary (under 200 words) that includes:\n"
-                    f"- Historical context and facts\n"
-                    f"- Spiritual significance\n"
-                    f"- Interesting traditions or customs\n"
-                    f"- Any inspiring stories or legends\n"
-                    f"Write in a warm, accessible tone suitable for family listening."
-                )
-                if provider == "anthropic":
-                    response = client.messages.create(
-                        model=model,
-                        max_tokens=1000,
-                        messages=[
-                            {"role": "user", "content": f"You are a knowledgeable Catholic researcher and podcast content creator.\n\n{prompt}"}
-                        ],
-                    )
-                    summary = response.content[0].text.strip()
-                else:
-                    response = client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": "You are a knowledgeable Catholic researcher and podcast content creator.",
-                            },
-                            {"role": "user", "content": prompt},
-                        ],
-                    )
-                    summary = response.choices[0].message.content.strip()
-                results.append({"query": query, "summary": summary, "sources": []})
-            except Exception:
-                results.append({"query": query, "summary": f"Research summary for: {query}", "sources": []})
-        return results
+    def _supplement_with_searches(
+        self, queries: List[str], shared: Optional[day_context.SharedResearch] = None
+    ) -> List[Dict[str, Any]]:
+        """Research summaries for ``queries``, in order.
 
-    def _supplement_with_searches(self, queries: List[str]) -> List[Dict[str, str]]:
+        Cached research is reused; with ``shared``, queries another show is researching right now are waited for.
+        """
+        print("[GEN] Supplementing with web searches where available")
         google_api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
         google_cse_id = os.getenv("GOOGLE_CUSTOM_SEARCH_ENGINE_ID")
-        if not google_api_key or not google_cse_id:
-            return self._fallback_ai_research(queries)
-        results: List[Dict[str, str]] = []
+        if self.config.services.search == "offline":
+            google_api_key, google_cse_id = "offline", "offline"
+        # Research written by the offline model is not real research; keep it out of the shared cache
+        use_cache = self.config.ai.provider != "offline"
+        started = time.monotonic()
+        research = research_cache.lookup(queries) if use_cache else {}
+        cached = len(research)
+        owned: Dict[str, Tuple[str, Future]] = {}
+        waiting: Dict[str, Future] = {}
         for q in queries:
+            key = research_cache.query_key(q)
+            if key in research or key in owned or key in waiting:
+                continue
+            future, claimed = shared.claim(key) if shared else (Future(), True)
+            if claimed:
+                owned[key] = (q, future)
+            else:
+                waiting[key] = future
+
+        if owned:
             try:
-                search_results = self._perform_google_search(q, google_api_key, google_cse_id)
-                summary = self._synthesize_search_results(q, search_results)
-                results.append(
-                    {
-                        "query": q,
-                        "summary": summary,
-                        "sources": [r.get("link", "") for r in search_results[:3]],
-                    }
-                )
-            except Exception:
-                ai_summary = self._fallback_ai_research([q])[0]["summary"]
-                results.append({"query": q, "summary": ai_summary, "sources": []})
+                with ThreadPoolExecutor(max_workers=min(settings.RESEARCH_CONCURRENCY, len(owned))) as pool:
+                    researched = list(
+                        pool.map(
+                            lambda q: self._research_query(q, google_api_key, google_cse_id),
+                            [q for q, _ in owned.values()],
+                        )
+                    )
+            except BaseException as e:
+                for _, future in owned.values():
+                    future.set_exception(e)
+                raise
+            for (key, (_, future)), (result, ok) in zip(owned.items(), researched):
+                future.set_result(result)
+                research[key] = result
+            if use_cache:
+                research_cache.store([result for result, ok in researched if ok], self._model_name())
+        for key, future in waiting.items():
+            research[key] = future.result()
+        print(
+            f"[GEN] Researched {len(owned)} queries in {time.monotonic() - started:.1f}s "
+            f"({cached} from cache, {len(waiting)} shared with a concurrent run)"
+        )
+
+        results: List[Dict[str, Any]] = []
+        for q in queries:
+            result = research[research_cache.query_key(q)]
+            results.append({"query": q, "summary": result["summary"], "sources": result["sources"]})
         return results
 
     def _get_structured_bio_summary(
@@ -484,14 +402,14 @@ class PodcastGenerator:
         )
         return result.feasts
 
-    def _generate_podcast_script(
+    def _script_request(
         self,
         structured_bios: List[StructuredBioModel],
         target_date: datetime.date,
         original_bios: Optional[List[Dict[str, Any]]] = None,
-    ):
+    ) -> Tuple[List[Dict[str, Any]], Any]:
+        """The script prompt messages and the response model for this show's voice mode."""
         date_str = target_date.strftime("%B %d, %Y")
-        print(f"[GEN] Generating script for {date_str}")
         # Only substitute the {date} token; avoid str.format which would treat other
         # literal braces in the prompt template (e.g., JSON examples) as placeholders.
         template = self.config.prompts.script_prompt_template
@@ -505,22 +423,27 @@ class PodcastGenerator:
         # Decide script model based on voice mode
         use_kids = self.config.voices.mode == "ai_assigned"
         response_model = KidsPodcastScriptModel if use_kids else PodcastScriptModel
+        messages = [
+            {
+                "role": "system",
+                "content": "You are a creative and passionate podcast scriptwriter who specializes in making Catholic content exciting and engaging.",
+            },
+            {"role": "user", "content": prompt + "\n\nDATA:\n" + json.dumps(data_payload)},
+        ]
+        return messages, response_model
 
-        result = self._structured_completion(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a creative and passionate podcast scriptwriter who specializes in making Catholic content exciting and engaging.",
-                },
-                {"role": "user", "content": prompt + "\n\nDATA:\n" + json.dumps(data_payload)},
-            ],
-            response_format_model=response_model,
-        )
+    def _generate_podcast_script(
+        self,
+        structured_bios: List[StructuredBioModel],
+        target_date: datetime.date,
+        original_bios: Optional[List[Dict[str, Any]]] = None,
+    ):
+        print(f"[GEN] Generating script for {target_date.strftime('%B %d, %Y')}")
+        messages, response_model = self._script_request(structured_bios, target_date, original_bios)
+        result = self._structured_completion(messages=messages, response_format_model=response_model)
         print("[GEN] Script generation complete")
         return result
 
-    # --- TTS helpers ---
-
     def _normalize_script_and_voice_map(
         self, script_obj: Any
     ) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
@@ -544,340 +467,190 @@ class PodcastGenerator:
             voice_map = dict(self.config.voices.fixed_voice_map)
         return normalized_lines, voice_map
 
-    def _generate_tts_and_merge(
-        self, normalized_lines: List[Dict[str, str]], voice_map: Dict[str, str], target_date: datetime.date
-    ) -> str:
-        if not isinstance(target_date, datetime.date):
-            raise TypeError(f"target_date must be a datetime.date, not {type(target_date)}")
+    def _elevenlabs_client(self) -> ElevenLabs:
+        if self.config.services.tts == "offline":
+            from saints.offline import FakeElevenLabs
 
+            return FakeElevenLabs()
         api_key = os.getenv("ELEVEN_LABS_API_KEY")
         if not api_key:
             raise ValueError("ELEVEN_LABS_API_KEY environment variable is required")
-        client = ElevenLabs(api_key=api_key)
+        return ElevenLabs(api_key=api_key)
 
-        temp_dir = tempfile.mkdtemp()
+    def _tts_cache(self):
+        # Silent offline audio must never be served in place of real speech
+        return None if self.config.services.tts == "offline" else tts.default_cache()
 
-        print(f"[GEN] Generating dialogue with ElevenLabs v3 for {len(normalized_lines)} lines")
+    @staticmethod
+    def _dialogue_inputs(speaker: str, text: str, voice_map: Dict[str, str]) -> List[DialogueInput]:
+        """One line of dialogue as DialogueInputs, splitting overly long lines into smaller chunks."""
+        if speaker not in voice_map:
+            raise KeyError(f"No voice_id provided for speaker: {speaker}")
+        voice_id = voice_map[speaker]
+        # Preserve ElevenLabs v3 bracketed tags and chunk safely around them
+        inputs: List[DialogueInput] = []
+        for piece in tts.chunk_text(text):
+            piece = piece.strip()
+            if piece:
+                inputs.append(DialogueInput(text=piece, voice_id=voice_id))
+        return inputs
 
-        # Build DialogueInput list, splitting overly long lines into smaller chunks
-        def _chunk_text(text: str, max_chunk_len: int = 900) -> List[str]:
-            """Chunk text while respecting ElevenLabs v3 bracketed tags.
-            - Never split inside square-bracket tags like [warmly] or [church bells].
-            - Prefer to split on whitespace when not inside a tag.
-            - If a tag would cross the boundary, extend the chunk until the tag closes.
-            """
-            if len(text) <= max_chunk_len:
-                return [text]
-            chunks: List[str] = []
-            i = 0
-            n = len(text)
-            min_soft_len = int(max_chunk_len * 0.6)
-            while i < n:
-                start = i
-                bracket_depth = 0
-                last_ws_outside = -1
-                j = i
-                # First pass: advance up to max_chunk_len, track bracket depth and last whitespace outside tags
-                while j < n and (j - start) < max_chunk_len:
-                    ch = text[j]
-                    if ch == "[":
-                        bracket_depth += 1
-                    elif ch == "]":
-                        if bracket_depth > 0:
-                            bracket_depth -= 1
-                    if ch.isspace() and bracket_depth == 0:
-                        last_ws_outside = j
-                    j += 1
-
-                cut: int
-                if j >= n:
-                    cut = n
-                else:
-                    if bracket_depth > 0:
-                        # We are inside a tag at the boundary; keep going until tag closes
-                        while j < n and bracket_depth > 0:
-                            ch = text[j]
-                            if ch == "[":
-                                bracket_depth += 1
-                            elif ch == "]":
-                                bracket_depth -= 1
-                            j += 1
-                        # Optionally, extend to next whitespace for natural pause
-                        while j < n and not text[j].isspace():
-                            j += 1
-                        cut = j
-                    else:
-                        # Prefer to cut at the last whitespace outside tags if far enough into the window
-                        if last_ws_outside != -1 and (last_ws_outside - start) >= min_soft_len:
-                            cut = last_ws_outside
-                        else:
-                            cut = j
-
-                piece = text[start:cut].strip()
-                if piece:
-                    chunks.append(piece)
-                i = cut
-                # Skip any subsequent whitespace so the next piece starts on content
-                while i < n and text[i].isspace():
-                    i += 1
-            return chunks
-
-        flat_inputs: List[DialogueInput] = []
-        for line in normalized_lines:
-            speaker = line["speaker"]
-            if speaker not in voice_map:
-                raise KeyError(f"No voice_id provided for speaker: {speaker}")
-            voice_id = voice_map[speaker]
-            # Preserve ElevenLabs v3 bracketed tags and chunk safely around them
-            text_for_dialogue = line["text"]
-            for piece in _chunk_text(text_for_dialogue):
-                piece = piece.strip()
-                if not piece:
-                    continue
-                flat_inputs.append(DialogueInput(text=piece, voice_id=voice_id))
+    def _generate_tts_and_merge(
+        self, normalized_lines: List[Dict[str, str]], voice_map: Dict[str, str], target_date: datetime.date
+    ) -> audio_storage.StoredAudio:
+        if not isinstance(target_date, datetime.date):
+            raise TypeError(f"target_date must be a datetime.date, not {type(target_date)}")
+
+        client = self._elevenlabs_client()
+        print(f"[GEN] Generating dialogue with ElevenLabs v3 for {len(normalized_lines)} lines")
 
         # Batch inputs to respect ElevenLabs v3 request limit (max 3000 chars total text)
-        MAX_REQ_CHARS = 2500
+        batcher = tts.Batcher()
         batches: List[List[DialogueInput]] = []
-        current_batch: List[DialogueInput] = []
-        current_len = 0
-        for di in flat_inputs:
-            piece_len = len(di.text)  # type: ignore[attr-defined]
-            if current_batch and current_len + piece_len > MAX_REQ_CHARS:
-                batches.append(current_batch)
-                current_batch = [di]
-                current_len = piece_len
-            else:
-                current_batch.append(di)
-                current_len += piece_len
-        if current_batch:
-            batches.append(current_batch)
+        for line in normalized_lines:
+            batches.extend(batcher.add(self._dialogue_inputs(line["speaker"], line["text"], voice_map)))
+        batches.extend(batcher.flush())
 
         if not batches:
             raise RuntimeError("No dialogue inputs were prepared for TTD")
 
-        part_files: List[str] = []
-        for bidx, batch in enumerate(batches):
-            try:
-                response = client.text_to_dialogue.convert(
-                    inputs=batch,
-                    model_id="eleven_v3",
-                    output_format="mp3_44100_128",
-                )
-            except Exception as e:
-                raise RuntimeError(f"Failed to generate dialogue audio for batch {bidx}: {e}")
-
-            part_path = os.path.join(temp_dir, f"dialogue_part_{bidx}.mp3")
-            with open(part_path, "wb") as f:
-                if isinstance(response, (bytes, bytearray)):
-                    f.write(response)
-                else:
-                    for chunk in response:
-                        if chunk:
-                            f.write(chunk)
-            part_files.append(part_path)
-
-        # Concatenate all parts into a single raw dialogue file
-        raw_dialogue_path = os.path.join(temp_dir, "dialogue_raw.mp3")
-        if len(part_files) == 1:
-            raw_dialogue_path = part_files[0]
-        else:
-            print(f"[GEN] Concatenating {len(part_files)} dialogue parts")
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-y",
-                ]
-                + sum([["-i", f] for f in part_files], [])
-                + [
-                    "-filter_complex",
-                    f"concat=n={len(part_files)}:v=0:a=1[dialogue]",
-                    "-map",
-                    "[dialogue]",
-                    "-c:a",
-                    "libmp3lame",
-                    "-b:a",
-                    "128k",
-                    raw_dialogue_path,
-                ],
-                capture_output=True,
-                check=True,
+        concurrency = min(settings.ELEVENLABS_CONCURRENCY, len(batches))
+        print(f"[GEN] Synthesizing {len(batches)} dialogue batches, {concurrency} at a time")
+        tts_started = time.monotonic()
+        # The raw dialogue parts only live until the episode is mastered and saved
+        with tempfile.TemporaryDirectory(prefix="podcast-") as temp_dir:
+            part_files, timings = tts.synthesize_batches(
+                client, batches, temp_dir, concurrency=concurrency, cache=self._tts_cache()
             )
+            tts.print_batch_timings(timings, time.monotonic() - tts_started)
+            return self._master_and_save(part_files, target_date, temp_dir)
 
+    def _stream_script_and_tts(
+        self,
+        structured_bios: List[StructuredBioModel],
+        target_date: datetime.date,
+        original_bios: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[PodcastScriptModel, audio_storage.StoredAudio]:
+        """Write the script and synthesize it at the same time; returns the script and the saved audio.
+
+        Script lines are parsed out of the model's streamed JSON as they complete, and each dialogue batch goes to
+        ElevenLabs as soon as it is full, so synthesis runs alongside the script call instead of after it.  The
+        batches are cut exactly as ``_generate_tts_and_merge`` cuts them.  Only for fixed voices: a show whose
+        voices the model assigns learns them at the end of the script.
+        """
+        date_str = target_date.strftime("%B %d, %Y")
+        print(f"[GEN] Streaming script for {date_str} into ElevenLabs")
+        messages, response_model = self._script_request(structured_bios, target_date, original_bios)
+        voice_map = dict(self.config.voices.fixed_voice_map)
+        client = self._elevenlabs_client()
+
+        started = time.monotonic()
+        with tempfile.TemporaryDirectory(prefix="podcast-") as temp_dir:
+            lines = json_stream.ArrayItemStream("lines")
+            batcher = tts.Batcher()
+            text: List[str] = []
+            with tts.BatchPipeline(client, temp_dir, cache=self._tts_cache()) as pipeline:
+                for delta in self._provider().stream(messages, response_model, log=self.ai_calls):
+                    text.append(delta)
+                    for item in lines.feed(delta):
+                        line = PodcastLineModel.model_validate(item)
+                        inputs = self._dialogue_inputs(line.PodcastHostName, line.Content, voice_map)
+                        for batch in batcher.add(inputs):
+                            pipeline.submit(batch)
+                script = response_model.model_validate_json("".join(text))
+                script_seconds = time.monotonic() - started
+                for batch in batcher.flush():
+                    pipeline.submit(batch)
+                if not pipeline.futures:
+                    raise RuntimeError("No dialogue inputs were prepared for TTD")
+                finished = sum(future.done() for future in pipeline.futures)
+                print(
+                    f"[GEN] Script complete in {script_seconds:.1f}s ({len(script.lines)} lines); "
+                    f"{finished} of {len(pipeline.futures)} dialogue batches already synthesized"
+                )
+                part_files, timings = pipeline.finish()
+            tts.print_batch_timings(timings, time.monotonic() - started)
+            return script, self._master_and_save(part_files, target_date, temp_dir)
+
+    def _master_and_save(
+        self, part_files: List[str], target_date: datetime.date, temp_dir: str
+    ) -> audio_storage.StoredAudio:
+        """Master the dialogue parts with the show's music and save the episode to storage.
+
+        Local storage is written straight from ffmpeg's output; other storages get the finished file from
+        ``temp_dir``.  Either way the file is copied in chunks and its size and checksum taken on the way.
+        """
         filename = self._generate_podcast_filename(target_date)
         podcasts_dir = "podcasts/"
+        storage_path = os.path.join(podcasts_dir, filename)
         merged_path = os.path.join(temp_dir, filename)
 
-        # Normalize dialogue audio before mixing with music
-        dialogue_path = os.path.join(temp_dir, "dialogue.mp3")
-        print("[GEN] Normalizing dialogue audio")
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-y",
-                "-i",
-                raw_dialogue_path,
-                "-filter_complex",
-                "[0:a]loudnorm=I=-16:LRA=11:TP=-1.5[final]",
-                "-map",
-                "[final]",
-                "-c:a",
-                "libmp3lame",
-                "-b:a",
-                "128k",
-                dialogue_path,
-            ],
-            capture_output=True,
-            check=True,
-        )
-
         # Prepare music assets
         def _safe_path(name: Optional[str]) -> Optional[str]:
             if not name:
                 return None
-            p = os.path.join(settings.MEDIA_ROOT, "podcast_assets", name)
+            p = podcast_assets.asset_path(name)
             return p if os.path.exists(p) else None
 
         intro_music_path = _safe_path(self.config.audio.intro_filename)
         outro_music_path = _safe_path(self.config.audio.outro_filename)
+        music = " + ".join(name for name, path in [("intro", intro_music_path), ("outro", outro_music_path)] if path)
+        print(f"[GEN] Mastering {len(part_files)} dialogue parts with {music or 'no music'}")
+        saved: Dict[str, audio_storage.StoredAudio] = {}
+        pipe = audio_storage.can_pipe()
 
-        # We already have a single dialogue file; proceed to music merge
+        def save(stream):
+            saved["audio"] = audio_storage.save_stream(storage_path, stream)
 
-        def get_audio_duration(file_path: str) -> float:
-            try:
-                result = subprocess.run(
-                    [
-                        "ffprobe",
-                        "-v",
-                        "quiet",
-                        "-show_entries",
-                        "format=duration",
-                        "-of",
-                        "csv=p=0",
-                        file_path,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                return float(result.stdout.strip())
-            except Exception:
-                return 10.0
-
-        if intro_music_path and outro_music_path:
-            print("[GEN] Merging intro + dialogue + outro with normalization")
-            intro_duration = get_audio_duration(intro_music_path)
-            outro_duration = get_audio_duration(outro_music_path)
-            intro_fade_start = max(0.0, intro_duration - 2.0)
-            outro_fade_start = max(0.0, outro_duration - 2.0)
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-y",
-                    "-i",
-                    intro_music_path,
-                    "-i",
-                    dialogue_path,
-                    "-i",
-                    outro_music_path,
-                    "-filter_complex",
-                    f"[0:a]afade=t=out:st={intro_fade_start}:d=2[intro_faded];"
-                    f"[2:a]afade=t=out:st={outro_fade_start}:d=2[outro_faded];"
-                    f"[intro_faded][1:a][outro_faded]concat=n=3:v=0:a=1[mixed];"
-                    f"[mixed]loudnorm=I=-16:LRA=11:TP=-1.5[final]",
-                    "-map",
-                    "[final]",
-                    "-c:a",
-                    "libmp3lame",
-                    "-b:a",
-                    "128k",
-                    merged_path,
-                ],
-                capture_output=True,
-                check=True,
-            )
-        elif intro_music_path:
-            print("[GEN] Merging intro + dialogue with normalization")
-            intro_duration = get_audio_duration(intro_music_path)
-            intro_fade_start = max(0.0, intro_duration - 2.0)
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-y",
-                    "-i",
-                    intro_music_path,
-                    "-i",
-                    dialogue_path,
-                    "-filter_complex",
-                    f"[0:a]afade=t=out:st={intro_fade_start}:d=2[intro_faded];"
-                    f"[intro_faded][1:a]concat=n=2:v=0:a=1[mixed];"
-                    f"[mixed]loudnorm=I=-16:LRA=11:TP=-1.5[final]",
-                    "-map",
-                    "[final]",
-                    "-c:a",
-                    "libmp3lame",
-                    "-b:a",
-                    "128k",
-                    merged_path,
-                ],
-                capture_output=True,
-                check=True,
-            )
-        elif outro_music_path:
-            print("[GEN] Merging dialogue + outro with normalization")
-            outro_duration = get_audio_duration(outro_music_path)
-            outro_fade_start = max(0.0, outro_duration - 2.0)
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-y",
-                    "-i",
-                    dialogue_path,
-                    "-i",
-                    outro_music_path,
-                    "-filter_complex",
-                    f"[1:a]afade=t=out:st={outro_fade_start}:d=2[outro_faded];"
-                    f"[0:a][outro_faded]concat=n=2:v=0:a=1[mixed];"
-                    f"[mixed]loudnorm=I=-16:LRA=11:TP=-1.5[final]",
-                    "-map",
-                    "[final]",
-                    "-c:a",
-                    "libmp3lame",
-                    "-b:a",
-                    "128k",
-                    merged_path,
-                ],
-                capture_output=True,
-                check=True,
-            )
-        else:
-            print("[GEN] No music assets found; normalizing dialogue only")
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-y",
-                    "-i",
-                    dialogue_path,
-                    "-filter_complex",
-                    "[0:a]loudnorm=I=-16:LRA=11:TP=-1.5[final]",
-                    "-map",
-                    "[final]",
-                    "-c:a",
-                    "libmp3lame",
-                    "-b:a",
-                    "128k",
-                    merged_path,
-                ],
-                capture_output=True,
-                check=True,
+        try:
+            report = mastering.master(
+                part_files,
+                None if pipe else merged_path,
+                intro=podcast_assets.music_track(intro_music_path),
+                outro=podcast_assets.music_track(outro_music_path),
+                consume=save if pipe else None,
             )
+        except Exception:
+            # Don't leave a truncated episode behind if ffmpeg failed partway through
+            if "audio" in saved:
+                default_storage.delete(saved["audio"].path)
+            raise
+        print(
+            f"[GEN] Mastered in {report.seconds:.1f}s (analysis {report.analysis_seconds:.1f}s, "
+            f"encode {report.encode_seconds:.1f}s; "
+            f"track gains {min(report.gains):+.1f} to {max(report.gains):+.1f} dB)"
+        )
 
-        with open(merged_path, "rb") as f:
-            default_storage.save(os.path.join(podcasts_dir, filename), ContentFile(f.read()))
-        print(f"[GEN] Saved episode audio to podcasts/{filename}")
-        return os.path.join(podcasts_dir, filename)
+        if not pipe:
+            with open(merged_path, "rb") as f:
+                save(f)
+        audio = saved["audio"]
+        audio.duration = report.duration
+        print(
+            f"[GEN] Saved episode audio to {audio.path} "
+            f"({audio.size / 1_000_000:.1f} MB, {audio.duration or 0:.0f}s, sha256 {audio.checksum[:12]})"
+        )
+        return audio
 
     # --- Metadata and persistence ---
+    def _get_podcast(self) -> Optional[Podcast]:
+        """The Podcast this generator publishes to, from the linkage config."""
+        podcast: Optional[Podcast] = None
+        if self.config.linkage.podcast_uuid:
+            try:
+                podcast = Podcast.objects.get(pk=self.config.linkage.podcast_uuid)
+            except Podcast.DoesNotExist:
+                podcast = None
+        if not podcast and self.config.linkage.podcast_slug:
+            try:
+                podcast = Podcast.objects.get(slug=self.config.linkage.podcast_slug)
+            except Podcast.DoesNotExist:
+                podcast = None
+        if not podcast:
+            # Final fallback to previous behavior
+            podcast = Podcast.objects.filter(religion="catholic").order_by("-created").first()
+        return podcast
+
     def _generate_episode_metadata(
         self,
         structured: List[StructuredBioModel],
@@ -885,10 +658,8 @@ class PodcastGenerator:
         target_date: datetime.date,
         audio_path: str,
     ) -> Dict[str, Any]:
-        provider = self.config.ai.provider
         print("[GEN] Generating episode metadata")
-        model = self._model_name()
-        client = self._get_ai_client()
+        provider = self._provider()
         import json as _json
 
         episode_names = [s.Title for s in structured]
@@ -910,23 +681,15 @@ class PodcastGenerator:
                 "List: "
                 + _json.dumps(episode_names)
             )
-            if provider == "anthropic":
-                title_response = client.messages.create(
-                    model=model,
-                    max_tokens=100,
-                    messages=[{"role": "user", "content": f"You are a helpful assistant.\n\n{title_prompt}"}],
-                )
-                ai_title = title_response.content[0].text.strip()
-            else:
-                title_response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant."},
-                        {"role": "user", "content": title_prompt},
-                    ],
-                    response_format={"type": "text"},
-                )
-                ai_title = title_response.choices[0].message.content.strip()
+            ai_title = provider.text(
+                [
+                    {"role": "system", "content": "You are a helpful assistant."},
+                    {"role": "user", "content": title_prompt},
+                ],
+                label="episode title",
+                max_tokens=100,
+                log=self.ai_calls,
+            )
             if ai_title.startswith('"') and ai_title.endswith('"'):
                 ai_title = ai_title[1:-1]
             episode_name = f"{pretty_date}: {ai_title}"
@@ -944,25 +707,17 @@ class PodcastGenerator:
                 "Be creative, engaging, and family-friendly.\n"
                 f"\nCONTEXT:\n{_json.dumps(context)}"
             )
-            if provider == "anthropic":
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=1000,
-                    messages=[{"role": "user", "content": f"You are a creative Catholic podcast producer.\n\n{prompt}"}],
-                )
-                ai_result = response.content[0].text
-            else:
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
+            ai_result = _json.loads(
+                provider.text(
+                    [
                         {"role": "system", "content": "You are a creative Catholic podcast producer."},
                         {"role": "user", "content": prompt},
                     ],
-                    response_format={"type": "json_object"},
+                    label="episode description",
+                    json_object=True,
+                    log=self.ai_calls,
                 )
-                ai_result = response.choices[0].message.content
-            if isinstance(ai_result, str):
-                ai_result = _json.loads(ai_result)
+            )
             subtitle = ai_result.get("subtitle")
             short_desc = ai_result.get("short_description")
             long_desc = ai_result.get("long_description")
@@ -998,6 +753,16 @@ class PodcastGenerator:
             "episode_full_text": full_text,
         }
 
+    @staticmethod
+    def _publish_date_for(target_date: datetime.date) -> datetime.datetime:
+        """5 PM US Eastern on the day before ``target_date``, when its episode goes out."""
+        from zoneinfo import ZoneInfo
+
+        eve = target_date - datetime.timedelta(days=1)
+        return datetime.datetime.combine(eve, datetime.time(17), tzinfo=ZoneInfo("America/New_York")).astimezone(
+            ZoneInfo("UTC")
+        )
+
     @staticmethod
     def _create_publish_date(publish_date: Optional[datetime.datetime] = None):
         from zoneinfo import ZoneInfo
@@ -1013,25 +778,12 @@ class PodcastGenerator:
         return eastern_5pm.astimezone(ZoneInfo("UTC"))
 
     def _create_podcast_episode(
-        self, metadata: Dict[str, Any], publish_date: Optional[datetime.datetime] = None
+        self,
+        metadata: Dict[str, Any],
+        publish_date: Optional[datetime.datetime] = None,
+        audio: Optional[audio_storage.StoredAudio] = None,
     ) -> None:
-        from mutagen.mp3 import MP3
-        import os as _os
-
-        podcast: Optional[Podcast] = None
-        if self.config.linkage.podcast_uuid:
-            try:
-                podcast = Podcast.objects.get(pk=self.config.linkage.podcast_uuid)
-            except Podcast.DoesNotExist:
-                podcast = None
-        if not podcast and self.config.linkage.podcast_slug:
-            try:
-                podcast = Podcast.objects.get(slug=self.config.linkage.podcast_slug)
-            except Podcast.DoesNotExist:
-                podcast = None
-        if not podcast:
-            # Final fallback to previous behavior
-            podcast = Podcast.objects.filter(religion="catholic").order_by("-created").first()
+        podcast = self._get_podcast()
 
         last_episode = (
             PodcastEpisode.objects.filter(podcast=podcast).order_by("-episode_number").first()
@@ -1042,16 +794,8 @@ class PodcastGenerator:
             (last_episode.episode_number or 0) + 1 if last_episode and last_episode.episode_number else 1
         )
 
-        audio_path = metadata.get("file_name")
-        duration: Optional[int] = None
-        if audio_path:
-            media_path = os.path.join(settings.MEDIA_ROOT, "podcasts", audio_path)
-            if os.path.exists(media_path):
-                try:
-                    audio = MP3(media_path)
-                    duration = int(audio.info.length)
-                except Exception:
-                    duration = None
+        # Measured while the audio was encoded and saved
+        duration = round(audio.duration) if audio and audio.duration is not None else None
 
         final_publish_date = self._create_publish_date(publish_date)
         print(f"[GEN] Creating PodcastEpisode (episode_number={episode_number})")
@@ -1067,59 +811,159 @@ class PodcastGenerator:
             episode_long_description=metadata["episode_long_description"],
             episode_full_text=metadata["episode_full_text"],
             duration=duration,
+            file_size=audio.size if audio else None,
+            checksum=audio.checksum if audio else "",
             episode_number=episode_number,
             published_date=final_publish_date,
         )
 
     # --- Public orchestration methods ---
     def create_full_podcast(
-        self, target_date: datetime.date, publish_date: Optional[datetime.datetime] = None
+        self,
+        target_date: datetime.date,
+        publish_date: Optional[datetime.datetime] = None,
+        resume: bool = False,
+        from_stage: Optional[str] = None,
+        context: Optional[day_context.DayContext] = None,
+        before_insert: Optional[Callable[[], None]] = None,
+        measure: Optional[Callable[[str], ContextManager[Any]]] = None,
     ) -> str:
+        """Generate, store and publish the episode for ``target_date``.
+
+        Every stage's output is checkpointed; ``resume`` reuses the checkpoints whose inputs are unchanged and
+        ``from_stage`` (one of ``podcast_checkpoints.STAGES``) also rebuilds that stage and the ones after it.
+        ``context``, shared with the other show's run, supplies the biographies and coordinates research.
+        ``before_insert`` is called just before the PodcastEpisode row is created; batch runs use it to insert
+        a show's episodes in date order so their episode numbers follow the calendar.  ``measure(stage)`` is
+        a context manager wrapped around each stage that runs (see ``benchmark_podcast``).
+        """
         print("[GEN] Starting full podcast generation")
         if not isinstance(target_date, datetime.date):
             raise TypeError(f"target_date must be a datetime.date, not {type(target_date)}")
-        bios = self._get_biographies_for_day(target_date)
+        self.ai_calls = []
+        checkpoints = Checkpoints(
+            self._get_podcast(), target_date, resume=resume, from_stage=from_stage, measure=measure
+        )
+        ai = [self.config.ai.provider, self.config.ai.model]
+        prompts = self.config.prompts
+
+        if context and context.date != target_date:
+            raise ValueError(f"Day context is for {context.date}, not {target_date}")
+        bios = context.bios if context else self._get_biographies_for_day(target_date)
         print(f"[GEN] Bios fetched: {len(bios)}")
-        research_queries = self._identify_research_queries(bios)
+        research_queries = checkpoints.run(
+            "queries",
+            [bios, prompts.identify_research_queries_prompt, ai],
+            lambda: self._identify_research_queries(bios),
+        )
         print(f"[GEN] Research queries: {len(research_queries)}")
-        search_results = self._supplement_with_searches(research_queries)
+        search_results = checkpoints.run(
+            "research",
+            [research_queries, ai],
+            lambda: self._supplement_with_searches(research_queries, context.research if context else None),
+        )
         print(f"[GEN] Search summaries: {len(search_results)}")
-        structured = self._get_structured_bio_summary(bios, search_results)
+        structured = checkpoints.run(
+            "structured",
+            [bios, search_results, prompts.structured_bio_prompt, ai],
+            lambda: self._get_structured_bio_summary(bios, search_results),
+            dump=lambda feasts: [s.model_dump() for s in feasts],
+            restore=lambda feasts: [StructuredBioModel.model_validate(s) for s in feasts],
+        )
         print(f"[GEN] Structured feasts: {len(structured)}")
-        script_obj = self._generate_podcast_script(structured, target_date, bios)
+        script_model = KidsPodcastScriptModel if self.config.voices.mode == "ai_assigned" else PodcastScriptModel
+        # A streamed script is synthesized as it is written; its audio becomes the audio stage's output
+        streamed: Dict[str, audio_storage.StoredAudio] = {}
+
+        def write_script():
+            if not (self.config.ai.stream_script and self.config.voices.mode == "fixed"):
+                return self._generate_podcast_script(structured, target_date, bios)
+            script, streamed["audio"] = self._stream_script_and_tts(structured, target_date, bios)
+            return script
+
+        script_obj = checkpoints.run(
+            "script",
+            [
+                [s.model_dump() for s in structured],
+                target_date.isoformat(),
+                bios,
+                prompts.script_prompt_template,
+                self.config.voices.mode,
+                ai,
+            ],
+            write_script,
+            dump=lambda script: script.model_dump(),
+            restore=script_model.model_validate,
+        )
         normalized_lines, voice_map = self._normalize_script_and_voice_map(script_obj)
         print(f"[GEN] Lines: {len(normalized_lines)}; Voices: {len(voice_map)}")
-        audio_rel_path = self._generate_tts_and_merge(normalized_lines, voice_map, target_date)
-        metadata = self._generate_episode_metadata(structured, normalized_lines, target_date, audio_rel_path)
-        self._create_podcast_episode(metadata, publish_date)
+        audio = checkpoints.run(
+            "audio",
+            [
+                normalized_lines,
+                voice_map,
+                self.config.audio.intro_filename,
+                self.config.audio.outro_filename,
+                self.config.output.filename_prefix,
+            ],
+            lambda: streamed.get("audio") or self._generate_tts_and_merge(normalized_lines, voice_map, target_date),
+            dump=asdict,
+            restore=lambda values: audio_storage.StoredAudio(**values),
+            # Audio streamed with a freshly written script is used over any checkpoint, so its file is never left
+            # unreferenced.  Checkpoints from before the size and checksum were recorded hold just the path
+            valid=lambda values: (
+                "audio" not in streamed and isinstance(values, dict) and default_storage.exists(values["path"])
+            ),
+        )
+        metadata = checkpoints.run(
+            "metadata",
+            [[s.model_dump() for s in structured], normalized_lines, target_date.isoformat(), audio.path, ai],
+            lambda: self._generate_episode_metadata(structured, normalized_lines, target_date, audio.path),
+            dump=lambda values: {name: value for name, value in values.items() if name != "date"},
+            restore=lambda values: dict(values, date=target_date),
+        )
+        if before_insert:
+            before_insert()
+        self._create_podcast_episode(metadata, publish_date, audio)
+        ai_providers.print_call_summary(self.ai_calls)
         print("[GEN] Podcast generation complete")
-        return audio_rel_path
-
-    def generate_next_day_podcast(self) -> Optional[str]:
-        from zoneinfo import ZoneInfo
-        eastern_tz = ZoneInfo("America/New_York")
-        eastern_now = timezone.now().astimezone(eastern_tz)
-        tomorrow = eastern_now.date() + datetime.timedelta(days=1)
-        # Determine which podcast this generator is targeting
-        podcast: Optional[Podcast] = None
-        if self.config.linkage.podcast_uuid:
-            try:
-                podcast = Podcast.objects.get(pk=self.config.linkage.podcast_uuid)
-            except Podcast.DoesNotExist:
-                podcast = None
-        if not podcast and self.config.linkage.podcast_slug:
-            try:
-                podcast = Podcast.objects.get(slug=self.config.linkage.podcast_slug)
-            except Podcast.DoesNotExist:
-                podcast = None
-        if not podcast:
-            podcast = Podcast.objects.filter(religion="catholic").order_by("-created").first()
+        return audio.path
 
-        # Only block if an episode for this specific podcast already exists for tomorrow
-        if PodcastEpisode.objects.filter(date=tomorrow, podcast=podcast).exists():
+    def generate_podcast_for_date(
+        self,
+        target_date: datetime.date,
+        publish_date: Optional[datetime.datetime] = None,
+        resume: bool = False,
+        from_stage: Optional[str] = None,
+        context: Optional[day_context.DayContext] = None,
+        before_insert: Optional[Callable[[], None]] = None,
+    ) -> Optional[str]:
+        """Build ``target_date``'s episode unless this podcast already has one; returns None when it does.
+
+        The episode publishes at 5 PM US Eastern the day before ``target_date`` unless ``publish_date`` is given,
+        so episodes can be generated several days ahead.
+        """
+        podcast = self._get_podcast()
+        # Only block if an episode for this specific podcast already exists for that date
+        if PodcastEpisode.objects.filter(date=target_date, podcast=podcast).exists():
             return None
-        today_5pm = self._create_publish_date(None)
-        return self.create_full_podcast(tomorrow, today_5pm)
+        return self.create_full_podcast(
+            target_date,
+            publish_date or self._publish_date_for(target_date),
+            resume=resume,
+            from_stage=from_stage,
+            context=context,
+            before_insert=before_insert,
+        )
+
+    def generate_next_day_podcast(
+        self,
+        resume: bool = False,
+        from_stage: Optional[str] = None,
+        context: Optional[day_context.DayContext] = None,
+    ) -> Optional[str]:
+        tomorrow = context.date if context else day_context.next_episode_date()
+        return self.generate_podcast_for_date(tomorrow, resume=resume, from_stage=from_stage, context=context)
 
 
 # ------------------------------
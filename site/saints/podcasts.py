@@ -1,6 +1,7 @@
 from datetime import date
 import datetime
 
+from saints.day_context import DayContext
 from saints.podcast_generator import (
     PodcastGenerator,
     GeneratorConfig,
@@ -123,7 +124,7 @@ ADULT_SCRIPT_PROMPT_TEMPLATE = """
 def _get_generator() -> PodcastGenerator:
     return PodcastGenerator(
         GeneratorConfig(
-            ai=AIConfig(provider="openai", model="gpt-5"),
+            ai=AIConfig(provider="openai", model="gpt-5", stream_script=True),
             prompts=PromptsConfig(
                 identify_research_queries_prompt=ADULT_IDENTIFY_QUERIES_PROMPT,
                 structured_bio_prompt=ADULT_STRUCTURED_BIO_PROMPT,
@@ -146,11 +147,31 @@ def _get_generator() -> PodcastGenerator:
     )
 
 
-def create_full_podcast(target_date: date, publish_date: datetime.datetime = None) -> str:
-    return _get_generator().create_full_podcast(target_date, publish_date)
+def create_full_podcast(
+    target_date: date,
+    publish_date: datetime.datetime = None,
+    resume: bool = False,
+    from_stage: str = None,
+    context: DayContext = None,
+) -> str:
+    return _get_generator().create_full_podcast(
+        target_date, publish_date, resume=resume, from_stage=from_stage, context=context
+    )
+
 
+def generate_next_day_podcast(resume: bool = False, from_stage: str = None, context: DayContext = None) -> str:
+    return _get_generator().generate_next_day_podcast(resume=resume, from_stage=from_stage, context=context)
 
-def generate_next_day_podcast() -> str:
-    return _get_generator().generate_next_day_podcast()
+
+def generate_podcast_for_date(
+    target_date: date,
+    resume: bool = False,
+    from_stage: str = None,
+    context: DayContext = None,
+    before_insert=None,
+) -> str:
+    return _get_generator().generate_podcast_for_date(
+        target_date, resume=resume, from_stage=from_stage, context=context, before_insert=before_insert
+    )
 
 
@@ -0,0 +1,73 @@
+"""Token-bucket rate limiting for calls to external AI providers.
+
+Every ``(provider, model)`` pair has one bucket shared by all threads in the
+process.  A bucket holds up to a minute's quota and refills continuously, so a
+burst can use the whole quota at once and sustained use settles at the
+configured rate however many workers are calling.  Quotas come from
+``settings.AI_RATE_LIMITS``, in requests per minute.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from saints import settings
+
+DEFAULT_REQUESTS_PER_MINUTE = 60
+
+
+class TokenBucket:
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """Take ``tokens`` if available and return 0, otherwise return the seconds until they will be."""
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until ``tokens`` are available and take them; returns the seconds spent waiting."""
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(tokens)
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+
+_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def requests_per_minute(provider: str, model: str) -> float:
+    limits = getattr(settings, "AI_RATE_LIMITS", {}).get(provider, {})
+    return limits.get(model, limits.get("default", DEFAULT_REQUESTS_PER_MINUTE))
+
+
+def get_bucket(provider: str, model: str) -> TokenBucket:
+    with _buckets_lock:
+        if (provider, model) not in _buckets:
+            _buckets[(provider, model)] = TokenBucket(requests_per_minute(provider, model))
+        return _buckets[(provider, model)]
+
+
+def acquire(provider: str, model: str, tokens: float = 1) -> float:
+    """Wait for quota for one call to ``model`` at ``provider``; returns the seconds spent waiting."""
+    return get_bucket(provider, model).acquire(tokens)
@@ -0,0 +1,44 @@
+"""A shared cache of synthesized podcast research.
+
+The same saints come round every year and appear in both shows, and the
+research queries identified for them repeat nearly word for word.  Summaries
+are stored as ``ResearchSummary`` rows keyed by the query passed through
+``names.fold_key`` (lower case, accents folded, punctuation collapsed), so
+"St. Martin's cloak" and "st martin s cloak" share a row.  Rows expire after
+``RESEARCH_CACHE_TTL_DAYS``; stale or failed research is never stored.
+"""
+
+import datetime
+from typing import Dict, List, Sequence
+
+from django.conf import settings
+from django.utils import timezone
+
+from saints.models import ResearchSummary
+from saints.names import fold_key
+
+
+def query_key(query: str) -> str:
+    return fold_key(query)[:1000]
+
+
+def lookup(queries: Sequence[str]) -> Dict[str, Dict[str, object]]:
+    """Unexpired research for ``queries``, by query key, in the shape ``_supplement_with_searches`` returns."""
+    keys = {query_key(query) for query in queries}
+    rows = ResearchSummary.objects.filter(query_key__in=keys, expires_at__gt=timezone.now())
+    return {row.query_key: {"summary": row.summary, "sources": row.sources} for row in rows}
+
+
+def store(results: List[Dict[str, object]], model_name: str) -> None:
+    expires_at = timezone.now() + datetime.timedelta(days=settings.RESEARCH_CACHE_TTL_DAYS)
+    for result in results:
+        ResearchSummary.objects.update_or_create(
+            query_key=query_key(result["query"]),
+            defaults={
+                "query": result["query"],
+                "summary": result["summary"],
+                "sources": result["sources"],
+                "model_name": model_name,
+                "expires_at": expires_at,
+            },
+        )
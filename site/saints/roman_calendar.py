@@ -0,0 +1,794 @@
+"""Local computation of the current Roman calendar as observed in the United States.
+
+The temporale is derived from the date of Easter (Gregorian computus) and the
+First Sunday of Advent, computed with numpy for whole ranges of years at once.
+The sanctorale is the General Roman Calendar with the proper calendar of the
+dioceses of the USA, and the two are combined with the precedence rules of the
+Universal Norms on the Liturgical Year and the Calendar (UNLY 59-60), including
+the transfer of impeded solemnities.
+
+``calendar_rows`` returns ``CalendarEvent`` field dicts in the same shape the
+scrapers produce: one primary celebration per day (``order`` 0) followed by any
+optional memorials or commemorations that may be kept instead.
+"""
+
+import difflib
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from saints.sync import event_row
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2100
+
+ADVENT, CHRISTMAS, ORDINARY_TIME, LENT, TRIDUUM, EASTER = range(6)
+SEASON_NAMES = ["Advent", "Christmas", "Ordinary Time", "Lent", "Easter Triduum", "Easter"]
+SUNDAY_CYCLES = ["A", "B", "C"]
+WEEKDAY_CYCLES = ["II", "I"]
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# In the USA the Ascension is kept on the Seventh Sunday of Easter in most ecclesiastical provinces
+ASCENSION_ON_SUNDAY = True
+
+SOLEMNITY = "Solemnity"
+FEAST = "Feast"
+MEMORIAL = "Memorial"
+OPTIONAL_MEMORIAL = "Optional Memorial"
+SUNDAY = "Sunday"
+FERIA = "Feria"
+TRIDUUM_RANK = "Triduum"
+COMMEMORATION = "commemoration"
+
+# Table of Liturgical Days (UNLY 59): lower numbers take precedence
+PRECEDENCE = {
+    (SOLEMNITY, False): 3,
+    (SOLEMNITY, True): 4,
+    (FEAST, False): 7,
+    (FEAST, True): 8,
+    (MEMORIAL, False): 10,
+    (MEMORIAL, True): 11,
+    (OPTIONAL_MEMORIAL, False): 12,
+    (OPTIONAL_MEMORIAL, True): 12,
+}
+LORD_FEAST_PRECEDENCE = 5
+# Days from which obligatory and optional memorials may only be kept as commemorations
+PRIVILEGED_WEEKDAY = 9
+PLAIN_WEEKDAY = 13
+
+
+@dataclass(frozen=True)
+class Celebration:
+    name: str
+    rank: str
+    color: str
+    precedence: int
+    cycle: str = "temporale"
+    is_person: bool = False
+
+    def as_option(self, rank: str) -> "Celebration":
+        return Celebration(self.name, rank, self.color, self.precedence, self.cycle, self.is_person)
+
+
+# (month, day, name, rank, color, kind) where kind is "L" for feasts of the Lord, "E" for other
+# observances that are not of a person, and "S" for the Blessed Virgin Mary, angels and saints
+GENERAL_CALENDAR = [
+    (1, 1, "Solemnity of Mary, the Holy Mother of God", SOLEMNITY, "white", "S"),
+    (1, 2, "Saints Basil the Great and Gregory Nazianzen, Bishops and Doctors", MEMORIAL, "white", "S"),
+    (1, 3, "The Most Holy Name of Jesus", OPTIONAL_MEMORIAL, "white", "L"),
+    (1, 7, "Saint Raymond of Penyafort, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (1, 13, "Saint Hilary, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (1, 17, "Saint Anthony, Abbot", MEMORIAL, "white", "S"),
+    (1, 20, "Saint Fabian, Pope and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (1, 20, "Saint Sebastian, Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (1, 21, "Saint Agnes, Virgin and Martyr", MEMORIAL, "red", "S"),
+    (1, 22, "Saint Vincent, Deacon and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (1, 24, "Saint Francis de Sales, Bishop and Doctor", MEMORIAL, "white", "S"),
+    (1, 25, "The Conversion of Saint Paul, Apostle", FEAST, "white", "S"),
+    (1, 26, "Saints Timothy and Titus, Bishops", MEMORIAL, "white", "S"),
+    (1, 27, "Saint Angela Merici, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (1, 28, "Saint Thomas Aquinas, Priest and Doctor", MEMORIAL, "white", "S"),
+    (1, 31, "Saint John Bosco, Priest", MEMORIAL, "white", "S"),
+    (2, 2, "The Presentation of the Lord", FEAST, "white", "L"),
+    (2, 3, "Saint Blaise, Bishop and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (2, 3, "Saint Ansgar, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (2, 5, "Saint Agatha, Virgin and Martyr", MEMORIAL, "red", "S"),
+    (2, 6, "Saint Paul Miki and Companions, Martyrs", MEMORIAL, "red", "S"),
+    (2, 8, "Saint Jerome Emiliani", OPTIONAL_MEMORIAL, "white", "S"),
+    (2, 8, "Saint Josephine Bakhita, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (2, 10, "Saint Scholastica, Virgin", MEMORIAL, "white", "S"),
+    (2, 11, "Our Lady of Lourdes", OPTIONAL_MEMORIAL, "white", "S"),
+    (2, 14, "Saints Cyril, Monk, and Methodius, Bishop", MEMORIAL, "white", "S"),
+    (2, 17, "The Seven Holy Founders of the Servite Order", OPTIONAL_MEMORIAL, "white", "S"),
+    (2, 21, "Saint Peter Damian, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (2, 22, "The Chair of Saint Peter, Apostle", FEAST, "white", "S"),
+    (2, 23, "Saint Polycarp, Bishop and Martyr", MEMORIAL, "red", "S"),
+    (2, 27, "Saint Gregory of Narek, Abbot and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (3, 4, "Saint Casimir", OPTIONAL_MEMORIAL, "white", "S"),
+    (3, 7, "Saints Perpetua and Felicity, Martyrs", MEMORIAL, "red", "S"),
+    (3, 8, "Saint John of God, Religious", OPTIONAL_MEMORIAL, "white", "S"),
+    (3, 9, "Saint Frances of Rome, Religious", OPTIONAL_MEMORIAL, "white", "S"),
+    (3, 17, "Saint Patrick, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (3, 18, "Saint Cyril of Jerusalem, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (3, 19, "Saint Joseph, Spouse of the Blessed Virgin Mary", SOLEMNITY, "white", "S"),
+    (3, 23, "Saint Turibius of Mogrovejo, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (3, 25, "The Annunciation of the Lord", SOLEMNITY, "white", "L"),
+    (4, 2, "Saint Francis of Paola, Hermit", OPTIONAL_MEMORIAL, "white", "S"),
+    (4, 4, "Saint Isidore, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (4, 5, "Saint Vincent Ferrer, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (4, 7, "Saint John Baptist de la Salle, Priest", MEMORIAL, "white", "S"),
+    (4, 11, "Saint Stanislaus, Bishop and Martyr", MEMORIAL, "red", "S"),
+    (4, 13, "Saint Martin I, Pope and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (4, 21, "Saint Anselm, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (4, 23, "Saint George, Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (4, 23, "Saint Adalbert, Bishop and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (4, 24, "Saint Fidelis of Sigmaringen, Priest and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (4, 25, "Saint Mark, Evangelist", FEAST, "red", "S"),
+    (4, 28, "Saint Peter Chanel, Priest and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (4, 28, "Saint Louis Grignion de Montfort, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (4, 29, "Saint Catherine of Siena, Virgin and Doctor", MEMORIAL, "white", "S"),
+    (4, 30, "Saint Pius V, Pope", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 1, "Saint Joseph the Worker", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 2, "Saint Athanasius, Bishop and Doctor", MEMORIAL, "white", "S"),
+    (5, 3, "Saints Philip and James, Apostles", FEAST, "red", "S"),
+    (5, 10, "Saint John of Avila, Priest and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 12, "Saints Nereus and Achilleus, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (5, 12, "Saint Pancras, Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (5, 13, "Our Lady of Fatima", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 14, "Saint Matthias, Apostle", FEAST, "red", "S"),
+    (5, 18, "Saint John I, Pope and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (5, 20, "Saint Bernardine of Siena, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 21, "Saint Christopher Magallanes, Priest, and Companions, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (5, 22, "Saint Rita of Cascia, Religious", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 25, "Saint Bede the Venerable, Priest and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 25, "Saint Gregory VII, Pope", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 25, "Saint Mary Magdalene de' Pazzi, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 26, "Saint Philip Neri, Priest", MEMORIAL, "white", "S"),
+    (5, 27, "Saint Augustine of Canterbury, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 29, "Saint Paul VI, Pope", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 31, "The Visitation of the Blessed Virgin Mary", FEAST, "white", "S"),
+    (6, 1, "Saint Justin, Martyr", MEMORIAL, "red", "S"),
+    (6, 2, "Saints Marcellinus and Peter, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (6, 3, "Saint Charles Lwanga and Companions, Martyrs", MEMORIAL, "red", "S"),
+    (6, 5, "Saint Boniface, Bishop and Martyr", MEMORIAL, "red", "S"),
+    (6, 6, "Saint Norbert, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (6, 9, "Saint Ephrem, Deacon and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (6, 11, "Saint Barnabas, Apostle", MEMORIAL, "red", "S"),
+    (6, 13, "Saint Anthony of Padua, Priest and Doctor", MEMORIAL, "white", "S"),
+    (6, 19, "Saint Romuald, Abbot", OPTIONAL_MEMORIAL, "white", "S"),
+    (6, 21, "Saint Aloysius Gonzaga, Religious", MEMORIAL, "white", "S"),
+    (6, 22, "Saint Paulinus of Nola, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (6, 22, "Saints John Fisher, Bishop, and Thomas More, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (6, 24, "The Nativity of Saint John the Baptist", SOLEMNITY, "white", "S"),
+    (6, 27, "Saint Cyril of Alexandria, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (6, 28, "Saint Irenaeus, Bishop, Martyr and Doctor", MEMORIAL, "red", "S"),
+    (6, 29, "Saints Peter and Paul, Apostles", SOLEMNITY, "red", "S"),
+    (6, 30, "The First Martyrs of the Holy Roman Church", OPTIONAL_MEMORIAL, "red", "S"),
+    (7, 3, "Saint Thomas, Apostle", FEAST, "red", "S"),
+    (7, 4, "Saint Elizabeth of Portugal", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 5, "Saint Anthony Zaccaria, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 6, "Saint Maria Goretti, Virgin and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (7, 9, "Saint Augustine Zhao Rong, Priest, and Companions, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (7, 11, "Saint Benedict, Abbot", MEMORIAL, "white", "S"),
+    (7, 13, "Saint Henry", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 14, "Saint Camillus de Lellis, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 15, "Saint Bonaventure, Bishop and Doctor", MEMORIAL, "white", "S"),
+    (7, 16, "Our Lady of Mount Carmel", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 20, "Saint Apollinaris, Bishop and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (7, 21, "Saint Lawrence of Brindisi, Priest and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 22, "Saint Mary Magdalene", FEAST, "white", "S"),
+    (7, 23, "Saint Bridget, Religious", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 24, "Saint Sharbel Makhluf, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 25, "Saint James, Apostle", FEAST, "red", "S"),
+    (7, 26, "Saints Joachim and Anne, Parents of the Blessed Virgin Mary", MEMORIAL, "white", "S"),
+    (7, 29, "Saints Martha, Mary and Lazarus", MEMORIAL, "white", "S"),
+    (7, 30, "Saint Peter Chrysologus, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 31, "Saint Ignatius of Loyola, Priest", MEMORIAL, "white", "S"),
+    (8, 1, "Saint Alphonsus Liguori, Bishop and Doctor", MEMORIAL, "white", "S"),
+    (8, 2, "Saint Eusebius of Vercelli, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 2, "Saint Peter Julian Eymard, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 4, "Saint John Vianney, Priest", MEMORIAL, "white", "S"),
+    (8, 5, "The Dedication of the Basilica of Saint Mary Major", OPTIONAL_MEMORIAL, "white", "E"),
+    (8, 6, "The Transfiguration of the Lord", FEAST, "white", "L"),
+    (8, 7, "Saint Sixtus II, Pope, and Companions, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (8, 7, "Saint Cajetan, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 8, "Saint Dominic, Priest", MEMORIAL, "white", "S"),
+    (8, 9, "Saint Teresa Benedicta of the Cross, Virgin and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (8, 10, "Saint Lawrence, Deacon and Martyr", FEAST, "red", "S"),
+    (8, 11, "Saint Clare, Virgin", MEMORIAL, "white", "S"),
+    (8, 12, "Saint Jane Frances de Chantal, Religious", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 13, "Saints Pontian, Pope, and Hippolytus, Priest, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (8, 14, "Saint Maximilian Kolbe, Priest and Martyr", MEMORIAL, "red", "S"),
+    (8, 15, "The Assumption of the Blessed Virgin Mary", SOLEMNITY, "white", "S"),
+    (8, 16, "Saint Stephen of Hungary", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 19, "Saint John Eudes, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 20, "Saint Bernard, Abbot and Doctor", MEMORIAL, "white", "S"),
+    (8, 21, "Saint Pius X, Pope", MEMORIAL, "white", "S"),
+    (8, 22, "The Queenship of the Blessed Virgin Mary", MEMORIAL, "white", "S"),
+    (8, 23, "Saint Rose of Lima, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 24, "Saint Bartholomew, Apostle", FEAST, "red", "S"),
+    (8, 25, "Saint Louis", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 25, "Saint Joseph Calasanz, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (8, 27, "Saint Monica", MEMORIAL, "white", "S"),
+    (8, 28, "Saint Augustine, Bishop and Doctor", MEMORIAL, "white", "S"),
+    (8, 29, "The Passion of Saint John the Baptist", MEMORIAL, "red", "S"),
+    (9, 3, "Saint Gregory the Great, Pope and Doctor", MEMORIAL, "white", "S"),
+    (9, 8, "The Nativity of the Blessed Virgin Mary", FEAST, "white", "S"),
+    (9, 12, "The Most Holy Name of Mary", OPTIONAL_MEMORIAL, "white", "S"),
+    (9, 13, "Saint John Chrysostom, Bishop and Doctor", MEMORIAL, "white", "S"),
+    (9, 14, "The Exaltation of the Holy Cross", FEAST, "red", "L"),
+    (9, 15, "Our Lady of Sorrows", MEMORIAL, "white", "S"),
+    (9, 16, "Saints Cornelius, Pope, and Cyprian, Bishop, Martyrs", MEMORIAL, "red", "S"),
+    (9, 17, "Saint Robert Bellarmine, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (9, 17, "Saint Hildegard of Bingen, Virgin and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (9, 19, "Saint Januarius, Bishop and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (
+        9,
+        20,
+        "Saints Andrew Kim Tae-gon, Priest, and Paul Chong Ha-sang, and Companions, Martyrs",
+        MEMORIAL,
+        "red",
+        "S",
+    ),
+    (9, 21, "Saint Matthew, Apostle and Evangelist", FEAST, "red", "S"),
+    (9, 23, "Saint Pius of Pietrelcina, Priest", MEMORIAL, "white", "S"),
+    (9, 26, "Saints Cosmas and Damian, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (9, 27, "Saint Vincent de Paul, Priest", MEMORIAL, "white", "S"),
+    (9, 28, "Saint Wenceslaus, Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (9, 28, "Saint Lawrence Ruiz and Companions, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (9, 29, "Saints Michael, Gabriel and Raphael, Archangels", FEAST, "white", "S"),
+    (9, 30, "Saint Jerome, Priest and Doctor", MEMORIAL, "white", "S"),
+    (10, 1, "Saint Thérèse of the Child Jesus, Virgin and Doctor", MEMORIAL, "white", "S"),
+    (10, 2, "The Holy Guardian Angels", MEMORIAL, "white", "S"),
+    (10, 4, "Saint Francis of Assisi", MEMORIAL, "white", "S"),
+    (10, 5, "Saint Faustina Kowalska, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 6, "Saint Bruno, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 7, "Our Lady of the Rosary", MEMORIAL, "white", "S"),
+    (10, 9, "Saint Denis, Bishop, and Companions, Martyrs", OPTIONAL_MEMORIAL, "red", "S"),
+    (10, 9, "Saint John Leonardi, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 11, "Saint John XXIII, Pope", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 14, "Saint Callistus I, Pope and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (10, 15, "Saint Teresa of Jesus, Virgin and Doctor", MEMORIAL, "white", "S"),
+    (10, 16, "Saint Hedwig, Religious", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 16, "Saint Margaret Mary Alacoque, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 17, "Saint Ignatius of Antioch, Bishop and Martyr", MEMORIAL, "red", "S"),
+    (10, 18, "Saint Luke, Evangelist", FEAST, "red", "S"),
+    (10, 19, "Saint Paul of the Cross, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 22, "Saint John Paul II, Pope", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 23, "Saint John of Capistrano, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 24, "Saint Anthony Mary Claret, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 28, "Saints Simon and Jude, Apostles", FEAST, "red", "S"),
+    (11, 1, "All Saints", SOLEMNITY, "white", "S"),
+    (11, 2, "The Commemoration of All the Faithful Departed (All Souls' Day)", SOLEMNITY, "purple", "E"),
+    (11, 3, "Saint Martin de Porres, Religious", OPTIONAL_MEMORIAL, "white", "S"),
+    (11, 4, "Saint Charles Borromeo, Bishop", MEMORIAL, "white", "S"),
+    (11, 9, "The Dedication of the Lateran Basilica", FEAST, "white", "L"),
+    (11, 10, "Saint Leo the Great, Pope and Doctor", MEMORIAL, "white", "S"),
+    (11, 11, "Saint Martin of Tours, Bishop", MEMORIAL, "white", "S"),
+    (11, 12, "Saint Josaphat, Bishop and Martyr", MEMORIAL, "red", "S"),
+    (11, 15, "Saint Albert the Great, Bishop and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (11, 16, "Saint Margaret of Scotland", OPTIONAL_MEMORIAL, "white", "S"),
+    (11, 16, "Saint Gertrude, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (11, 17, "Saint Elizabeth of Hungary, Religious", MEMORIAL, "white", "S"),
+    (11, 18, "The Dedication of the Basilicas of Saints Peter and Paul, Apostles", OPTIONAL_MEMORIAL, "white", "E"),
+    (11, 21, "The Presentation of the Blessed Virgin Mary", MEMORIAL, "white", "S"),
+    (11, 22, "Saint Cecilia, Virgin and Martyr", MEMORIAL, "red", "S"),
+    (11, 23, "Saint Clement I, Pope and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (11, 23, "Saint Columban, Abbot", OPTIONAL_MEMORIAL, "white", "S"),
+    (11, 24, "Saint Andrew Dung-Lac, Priest, and Companions, Martyrs", MEMORIAL, "red", "S"),
+    (11, 25, "Saint Catherine of Alexandria, Virgin and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (11, 30, "Saint Andrew, Apostle", FEAST, "red", "S"),
+    (12, 3, "Saint Francis Xavier, Priest", MEMORIAL, "white", "S"),
+    (12, 4, "Saint John Damascene, Priest and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (12, 6, "Saint Nicholas, Bishop", OPTIONAL_MEMORIAL, "white", "S"),
+    (12, 7, "Saint Ambrose, Bishop and Doctor", MEMORIAL, "white", "S"),
+    (12, 8, "The Immaculate Conception of the Blessed Virgin Mary", SOLEMNITY, "white", "S"),
+    (12, 10, "Our Lady of Loreto", OPTIONAL_MEMORIAL, "white", "S"),
+    (12, 11, "Saint Damasus I, Pope", OPTIONAL_MEMORIAL, "white", "S"),
+    (12, 13, "Saint Lucy, Virgin and Martyr", MEMORIAL, "red", "S"),
+    (12, 14, "Saint John of the Cross, Priest and Doctor", MEMORIAL, "white", "S"),
+    (12, 21, "Saint Peter Canisius, Priest and Doctor", OPTIONAL_MEMORIAL, "white", "S"),
+    (12, 23, "Saint John of Kanty, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (12, 26, "Saint Stephen, the First Martyr", FEAST, "red", "S"),
+    (12, 27, "Saint John, Apostle and Evangelist", FEAST, "white", "S"),
+    (12, 28, "The Holy Innocents, Martyrs", FEAST, "red", "S"),
+    (12, 29, "Saint Thomas Becket, Bishop and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (12, 31, "Saint Sylvester I, Pope", OPTIONAL_MEMORIAL, "white", "S"),
+]
+
+USA_PROPER_CALENDAR = [
+    (1, 4, "Saint Elizabeth Ann Seton, Religious", MEMORIAL, "white", "S"),
+    (1, 5, "Saint John Neumann, Bishop", MEMORIAL, "white", "S"),
+    (1, 6, "Saint André Bessette, Religious", OPTIONAL_MEMORIAL, "white", "S"),
+    (1, 23, "Saint Marianne Cope, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (3, 3, "Saint Katharine Drexel, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 10, "Saint Damien de Veuster, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (5, 15, "Saint Isidore the Farmer", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 1, "Saint Junípero Serra, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (7, 4, "Independence Day", OPTIONAL_MEMORIAL, "white", "E"),
+    (7, 14, "Saint Kateri Tekakwitha, Virgin", MEMORIAL, "white", "S"),
+    (9, 9, "Saint Peter Claver, Priest", MEMORIAL, "white", "S"),
+    (10, 3, "Saint Théodore Guérin, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 5, "Blessed Francis Xavier Seelos, Priest", OPTIONAL_MEMORIAL, "white", "S"),
+    (10, 6, "Blessed Marie Rose Durocher, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (
+        10,
+        19,
+        "Saints John de Brébeuf and Isaac Jogues, Priests, and Companions, Martyrs",
+        MEMORIAL,
+        "red",
+        "S",
+    ),
+    (11, 13, "Saint Frances Xavier Cabrini, Virgin", MEMORIAL, "white", "S"),
+    (11, 18, "Saint Rose Philippine Duchesne, Virgin", OPTIONAL_MEMORIAL, "white", "S"),
+    (11, 23, "Blessed Miguel Agustín Pro, Priest and Martyr", OPTIONAL_MEMORIAL, "red", "S"),
+    (12, 9, "Saint Juan Diego Cuauhtlatoatzin", OPTIONAL_MEMORIAL, "white", "S"),
+    (12, 12, "Our Lady of Guadalupe", FEAST, "white", "S"),
+]
+
+# General Calendar celebrations kept on another day in the USA
+USA_TRANSFERS = {
+    "Saint Vincent, Deacon and Martyr": (1, 23),
+    "Saint Elizabeth of Portugal": (7, 5),
+    "Saint Camillus de Lellis, Priest": (7, 18),
+    "Saint Paul of the Cross, Priest": (10, 20),
+}
+
+DAY_OF_PRAYER = Celebration(
+    "Day of Prayer for the Legal Protection of Unborn Children", "Day of Prayer", "purple", 11, "sanctorale"
+)
+
+
+def _build_sanctorale() -> Dict[Tuple[int, int], List[Celebration]]:
+    sanctorale: Dict[Tuple[int, int], List[Celebration]] = {}
+    entries = [entry + (False,) for entry in GENERAL_CALENDAR] + [entry + (True,) for entry in USA_PROPER_CALENDAR]
+    for month, day, name, rank, color, kind, proper in entries:
+        month, day = USA_TRANSFERS.get(name, (month, day))
+        precedence = LORD_FEAST_PRECEDENCE if (kind == "L" and rank == FEAST) else PRECEDENCE[(rank, proper)]
+        celebration = Celebration(name, rank, color, precedence, "sanctorale", kind == "S")
+        sanctorale.setdefault((month, day), []).append(celebration)
+    return sanctorale
+
+
+SANCTORALE = _build_sanctorale()
+
+
+def _to_dates(years, months, days) -> np.ndarray:
+    """Vectorised ``date(year, month, day)`` returning ``datetime64[D]``."""
+    years = np.asarray(years, dtype=np.int64)
+    month_index = (years - 1970) * 12 + (np.asarray(months, dtype=np.int64) - 1)
+    return month_index.astype("datetime64[M]").astype("datetime64[D]") + (np.asarray(days, dtype=np.int64) - 1)
+
+
+def weekdays(dates: np.ndarray) -> np.ndarray:
+    """Monday = 0 ... Sunday = 6, as ``date.weekday()``."""
+    return (dates.astype(np.int64) + 3) % 7
+
+
+def sunday_on_or_after(dates: np.ndarray) -> np.ndarray:
+    return dates + (6 - weekdays(dates)) % 7
+
+
+def sunday_on_or_before(dates: np.ndarray) -> np.ndarray:
+    return dates - (weekdays(dates) + 1) % 7
+
+
+def easter_dates(years) -> np.ndarray:
+    """Gregorian Easter Sunday for each year (anonymous Gregorian / Meeus-Jones-Butcher computus)."""
+    y = np.asarray(years, dtype=np.int64)
+    a = y % 19
+    b, c = np.divmod(y, 100)
+    d, e = np.divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = np.divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = np.divmod(h + l - 7 * m + 114, 31)
+    return _to_dates(y, month, day + 1)
+
+
+@dataclass
+class KeyDates:
+    """The dates the temporale hangs on, as ``datetime64[D]`` arrays aligned with ``years``."""
+
+    years: np.ndarray
+    epiphany: np.ndarray
+    baptism: np.ndarray
+    ash_wednesday: np.ndarray
+    easter: np.ndarray
+    ascension: np.ndarray
+    pentecost: np.ndarray
+    advent: np.ndarray
+    christmas: np.ndarray
+    holy_family: np.ndarray
+
+    @property
+    def palm_sunday(self):
+        return self.easter - 7
+
+    @property
+    def holy_thursday(self):
+        return self.easter - 3
+
+    @property
+    def christ_the_king(self):
+        return self.advent - 7
+
+    def for_year(self, year: int) -> Dict[str, date]:
+        i = int(year - self.years[0])
+        names = ["epiphany", "baptism", "ash_wednesday", "easter", "ascension", "pentecost", "advent", "christmas"]
+        names += ["holy_family", "palm_sunday", "holy_thursday", "christ_the_king"]
+        return {name: getattr(self, name)[i].item() for name in names}
+
+
+def key_dates(years) -> KeyDates:
+    years = np.asarray(years, dtype=np.int64)
+    epiphany = sunday_on_or_after(_to_dates(years, 1, 2))
+    # When Epiphany falls on 7 or 8 January the Baptism of the Lord moves to the following Monday
+    epiphany_day = (epiphany - _to_dates(years, 1, 1)).astype(np.int64) + 1
+    baptism = np.where(epiphany_day >= 7, epiphany + 1, epiphany + 7)
+    easter = easter_dates(years)
+    christmas = _to_dates(years, 12, 25)
+    holy_family = sunday_on_or_after(_to_dates(years, 12, 26))
+    holy_family = np.where(holy_family > _to_dates(years, 12, 31), _to_dates(years, 12, 30), holy_family)
+    return KeyDates(
+        years=years,
+        epiphany=epiphany,
+        baptism=baptism,
+        ash_wednesday=easter - 46,
+        easter=easter,
+        ascension=easter + (42 if ASCENSION_ON_SUNDAY else 39),
+        pentecost=easter + 49,
+        advent=sunday_on_or_before(_to_dates(years, 12, 24)) - 21,
+        christmas=christmas,
+        holy_family=holy_family,
+    )
+
+
+@dataclass
+class DayTable:
+    """Per-day liturgical coordinates for a contiguous range of dates, as parallel numpy arrays."""
+
+    dates: np.ndarray
+    liturgical_year: np.ndarray
+    season: np.ndarray
+    week: np.ndarray
+    weekday: np.ndarray
+
+    @property
+    def sunday_cycle(self) -> np.ndarray:
+        """Index into ``SUNDAY_CYCLES`` (Year A, B or C)."""
+        return (self.liturgical_year + 2) % 3
+
+    @property
+    def weekday_cycle(self) -> np.ndarray:
+        """Index into ``WEEKDAY_CYCLES`` (Year II in even, Year I in odd liturgical years)."""
+        return self.liturgical_year % 2
+
+
+def check_years(first_year: int, last_year: int) -> None:
+    if first_year < FIRST_YEAR or last_year > LAST_YEAR or first_year > last_year:
+        raise ValueError(f"Years must be within {FIRST_YEAR}-{LAST_YEAR}, got {first_year}-{last_year}")
+
+
+def compute_days(first_year: int, last_year: int) -> DayTable:
+    """Compute the liturgical year, season and week of every day from 1 January ``first_year`` to 31 December ``last_year``."""
+    check_years(first_year, last_year)
+    keys = key_dates(np.arange(first_year - 1, last_year + 1))
+    dates = np.arange(_to_dates(first_year, 1, 1), _to_dates(last_year, 12, 31) + 1)
+    calendar_year = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    i = calendar_year - (first_year - 1)
+    weekday = weekdays(dates)
+    sunday = dates - (weekday + 1) % 7
+
+    after_advent = dates >= keys.advent[i]
+    liturgical_year = calendar_year + after_advent
+
+    conditions = [
+        after_advent & (dates < keys.christmas[i]),
+        dates >= keys.christmas[i],
+        dates <= keys.baptism[i],
+        dates < keys.ash_wednesday[i],
+        dates < keys.holy_thursday[i],
+        dates < keys.easter[i],
+        dates <= keys.pentecost[i],
+    ]
+    season = np.select(
+        conditions, [ADVENT, CHRISTMAS, CHRISTMAS, ORDINARY_TIME, LENT, TRIDUUM, EASTER], default=ORDINARY_TIME
+    )
+
+    def weeks_since(start):
+        return (sunday - start).astype(np.int64) // 7 + 1
+
+    # Ordinary Time starts the day after the Baptism; its first week begins on the Sunday before
+    ordinary_start = np.where(weekdays(keys.baptism) == 6, keys.baptism, keys.epiphany)
+    christmas_start = np.where(dates >= keys.christmas[i], keys.christmas[i], keys.christmas[i - 1])
+    late_ordinary = 34 - (keys.christ_the_king[i] - sunday).astype(np.int64) // 7
+    week = np.select(
+        [
+            season == ADVENT,
+            season == CHRISTMAS,
+            (season == ORDINARY_TIME) & (dates < keys.ash_wednesday[i]),
+            season == LENT,
+            season == TRIDUUM,
+            season == EASTER,
+        ],
+        [
+            weeks_since(keys.advent[i]),
+            weeks_since(sunday_on_or_before(christmas_start)),
+            weeks_since(ordinary_start[i]),
+            np.maximum(weeks_since(keys.ash_wednesday[i] + 4), 0),
+            6,
+            weeks_since(keys.easter[i]),
+        ],
+        default=late_ordinary,
+    )
+    return DayTable(
+        dates=dates,
+        liturgical_year=liturgical_year.astype(np.int16),
+        season=season.astype(np.int8),
+        week=week.astype(np.int8),
+        weekday=weekday.astype(np.int8),
+    )
+
+
+def ordinal(n: int) -> str:
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+def _movable_temporale(keys: Dict[str, date]) -> Dict[date, Celebration]:
+    easter = keys["easter"]
+    days = {
+        keys["epiphany"]: Celebration("The Epiphany of the Lord", SOLEMNITY, "white", 2),
+        keys["baptism"]: Celebration("The Baptism of the Lord", FEAST, "white", LORD_FEAST_PRECEDENCE),
+        keys["ash_wednesday"]: Celebration("Ash Wednesday", FERIA, "purple", 2),
+        keys["palm_sunday"]: Celebration("Palm Sunday of the Passion of the Lord", SUNDAY, "red", 2),
+        easter - timedelta(days=3): Celebration("Holy Thursday", TRIDUUM_RANK, "white", 1),
+        easter
+        - timedelta(days=2): Celebration("Friday of the Passion of the Lord (Good Friday)", TRIDUUM_RANK, "red", 1),
+        easter - timedelta(days=1): Celebration("Holy Saturday", TRIDUUM_RANK, "purple", 1),
+        easter: Celebration("Easter Sunday of the Resurrection of the Lord", SOLEMNITY, "white", 1),
+        easter + timedelta(days=7): Celebration("2nd Sunday of Easter (Divine Mercy Sunday)", SUNDAY, "white", 2),
+        keys["ascension"]: Celebration("The Ascension of the Lord", SOLEMNITY, "white", 2),
+        keys["pentecost"]: Celebration("Pentecost Sunday", SOLEMNITY, "red", 2),
+        easter + timedelta(days=56): Celebration("The Most Holy Trinity", SOLEMNITY, "white", 3),
+        easter + timedelta(days=63): Celebration("The Most Holy Body and Blood of Christ", SOLEMNITY, "white", 3),
+        easter + timedelta(days=68): Celebration("The Most Sacred Heart of Jesus", SOLEMNITY, "white", 3),
+        keys["christ_the_king"]: Celebration("Our Lord Jesus Christ, King of the Universe", SOLEMNITY, "white", 3),
+        keys["christmas"]: Celebration("The Nativity of the Lord (Christmas)", SOLEMNITY, "white", 2),
+        keys["holy_family"]: Celebration(
+            "The Holy Family of Jesus, Mary and Joseph", FEAST, "white", LORD_FEAST_PRECEDENCE
+        ),
+    }
+    for offset in range(1, 4):
+        day = keys["palm_sunday"] + timedelta(days=offset)
+        days[day] = Celebration(f"{WEEKDAY_NAMES[day.weekday()]} of Holy Week", FERIA, "purple", 2)
+    for offset in range(1, 7):
+        day = easter + timedelta(days=offset)
+        days[day] = Celebration(f"{WEEKDAY_NAMES[day.weekday()]} within the Octave of Easter", SOLEMNITY, "white", 2)
+    return days
+
+
+def _temporale_day(day: date, season: int, week: int, weekday: int, movable: Dict[date, Celebration], epiphany: date):
+    if day in movable:
+        return movable[day]
+    name = WEEKDAY_NAMES[weekday]
+    is_sunday = weekday == 6
+    if season == ADVENT:
+        if is_sunday:
+            return Celebration(f"{ordinal(week)} Sunday of Advent", SUNDAY, "rose" if week == 3 else "purple", 2)
+        if day.day >= 17:
+            return Celebration(f"{day.day} December", FERIA, "purple", PRIVILEGED_WEEKDAY)
+        return Celebration(f"{name} of the {ordinal(week)} week of Advent", FERIA, "purple", PLAIN_WEEKDAY)
+    if season == CHRISTMAS:
+        if day.month == 12:
+            return Celebration(
+                f"{ordinal(day.day - 24)} day within the Octave of Christmas", FERIA, "white", PRIVILEGED_WEEKDAY
+            )
+        if is_sunday:
+            return Celebration(f"{ordinal(week)} Sunday after Christmas", SUNDAY, "white", 6)
+        if day < epiphany:
+            return Celebration(f"{day.day} January", FERIA, "white", PLAIN_WEEKDAY)
+        return Celebration(f"{name} after Epiphany", FERIA, "white", PLAIN_WEEKDAY)
+    if season == LENT:
+        if is_sunday:
+            return Celebration(f"{ordinal(week)} Sunday of Lent", SUNDAY, "rose" if week == 4 else "purple", 2)
+        if week == 0:
+            return Celebration(f"{name} after Ash Wednesday", FERIA, "purple", PRIVILEGED_WEEKDAY)
+        return Celebration(f"{name} of the {ordinal(week)} week of Lent", FERIA, "purple", PRIVILEGED_WEEKDAY)
+    if season == EASTER:
+        if is_sunday:
+            return Celebration(f"{ordinal(week)} Sunday of Easter", SUNDAY, "white", 2)
+        return Celebration(f"{name} of the {ordinal(week)} week of Eastertide", FERIA, "white", PLAIN_WEEKDAY)
+    if is_sunday:
+        return Celebration(f"{ordinal(week)} Sunday in Ordinary Time", SUNDAY, "green", 6)
+    return Celebration(f"{name} of week {week} in Ordinary Time", FERIA, "green", PLAIN_WEEKDAY)
+
+
+def _movable_sanctorale(year: int, keys: Dict[str, date]) -> Dict[date, List[Celebration]]:
+    easter = keys["easter"]
+    days: Dict[date, List[Celebration]] = {
+        easter
+        + timedelta(days=50): [
+            Celebration("The Blessed Virgin Mary, Mother of the Church", MEMORIAL, "white", 10, "sanctorale", True)
+        ],
+        easter
+        + timedelta(days=69): [
+            Celebration("The Immaculate Heart of the Blessed Virgin Mary", MEMORIAL, "white", 10, "sanctorale", True)
+        ],
+    }
+    # The Day of Prayer moves to 23 January when 22 January is a Sunday
+    day_of_prayer = date(year, 1, 22)
+    if day_of_prayer.weekday() == 6:
+        day_of_prayer = date(year, 1, 23)
+    days.setdefault(day_of_prayer, []).append(DAY_OF_PRAYER)
+    first_thursday = date(year, 11, 1) + timedelta(days=(3 - date(year, 11, 1).weekday()) % 7)
+    days.setdefault(first_thursday + timedelta(days=21), []).append(
+        Celebration("Thanksgiving Day", OPTIONAL_MEMORIAL, "white", 12, "sanctorale")
+    )
+    return days
+
+
+def _resolve_day(temporale: Celebration, sanctorale: List[Celebration]):
+    """Pick the celebration of the day and its alternatives; returns (celebrations, impeded solemnities)."""
+    ranked = sorted(sanctorale, key=lambda c: c.precedence)
+    impeded = []
+    obligatory = [c for c in ranked if c.precedence <= 11]
+    optional = [c for c in ranked if c.precedence == 12]
+
+    if obligatory and obligatory[0].precedence < temporale.precedence:
+        primary = obligatory[0]
+        if primary.precedence >= 10 and len([c for c in obligatory if c.precedence >= 10]) > 1:
+            # Two obligatory memorials on one day are both kept as optional memorials
+            memorials = [c.as_option(OPTIONAL_MEMORIAL) for c in obligatory] + optional
+            return [temporale] + memorials, impeded
+        impeded = [c for c in obligatory[1:] if c.precedence <= 4]
+        return [primary], impeded
+
+    impeded = [c for c in obligatory if c.precedence <= 4]
+    if temporale.precedence == PRIVILEGED_WEEKDAY:
+        commemorations = [c.as_option(COMMEMORATION) for c in ranked if c.precedence >= 10]
+        return [temporale] + commemorations, impeded
+    if temporale.precedence >= PLAIN_WEEKDAY:
+        return [temporale] + optional, impeded
+    return [temporale], impeded
+
+
+def _transfer_target(celebration: Celebration, day: date, keys: Dict[str, date], primaries: Dict[date, int]) -> date:
+    palm_sunday, easter = keys["palm_sunday"], keys["easter"]
+    holy_week = palm_sunday <= day <= easter
+    if celebration.name.startswith("Saint Joseph, Spouse") and holy_week:
+        return palm_sunday - timedelta(days=1)
+    if celebration.name == "The Annunciation of the Lord" and palm_sunday <= day <= easter + timedelta(days=7):
+        return easter + timedelta(days=8)
+    if celebration.name == "The Nativity of Saint John the Baptist" and primaries.get(day) == 3:
+        # Anticipated rather than postponed when it meets the Sacred Heart (as directed in 2022)
+        return day - timedelta(days=1)
+    target = day + timedelta(days=1)
+    while primaries.get(target, PLAIN_WEEKDAY) <= 8:
+        target += timedelta(days=1)
+    return target
+
+
+def year_celebrations(year: int, table: Optional[DayTable] = None, keys: Optional[KeyDates] = None):
+    """Return ``{date: [celebration, alternatives...]}`` for every day of ``year``."""
+    check_years(year, year)
+    table = table or compute_days(year, year)
+    keys = keys or key_dates(np.arange(year, year + 1))
+    year_keys = keys.for_year(year)
+    movable = _movable_temporale(year_keys)
+    movable_sanctorale = _movable_sanctorale(year, year_keys)
+
+    start = int((_to_dates(year, 1, 1) - table.dates[0]).astype(np.int64))
+    length = (date(year, 12, 31) - date(year, 1, 1)).days + 1
+    seasons = table.season[start : start + length].tolist()
+    weeks = table.week[start : start + length].tolist()
+    weekday_list = table.weekday[start : start + length].tolist()
+
+    days: Dict[date, List[Celebration]] = {}
+    impeded: List[Tuple[date, Celebration]] = []
+    day = date(year, 1, 1)
+    for offset in range(length):
+        temporale = _temporale_day(
+            day, seasons[offset], weeks[offset], weekday_list[offset], movable, year_keys["epiphany"]
+        )
+        sanctorale = SANCTORALE.get((day.month, day.day), []) + movable_sanctorale.get(day, [])
+        celebrations, blocked = _resolve_day(temporale, sanctorale)
+        if (
+            seasons[offset] == ORDINARY_TIME
+            and weekday_list[offset] == 5
+            and celebrations[0].precedence >= PLAIN_WEEKDAY
+            and all(c.rank == OPTIONAL_MEMORIAL for c in celebrations[1:])
+        ):
+            celebrations.append(
+                Celebration(
+                    "Saturday Memorial of the Blessed Virgin Mary", OPTIONAL_MEMORIAL, "white", 12, "sanctorale", True
+                )
+            )
+        days[day] = celebrations
+        impeded.extend((day, c) for c in blocked)
+        day += timedelta(days=1)
+
+    primaries = {day: celebrations[0].precedence for day, celebrations in days.items()}
+    for day, celebration in impeded:
+        target = _transfer_target(celebration, day, year_keys, primaries)
+        if target in days:
+            days[target] = [celebration]
+            primaries[target] = celebration.precedence
+    return days
+
+
+def calendar_rows(years: Iterable[int]) -> List[dict]:
+    """``CalendarEvent`` field dicts for every day of ``years``, computed in one vectorised pass over the range."""
+    years = sorted(set(years))
+    if not years:
+        return []
+    table = compute_days(years[0], years[-1])
+    keys = key_dates(np.arange(years[0], years[-1] + 1))
+    season_by_day = dict(zip(table.dates.tolist(), table.season.tolist()))
+    rows = []
+    for year in years:
+        for day, celebrations in year_celebrations(year, table, keys).items():
+            season = SEASON_NAMES[season_by_day[day]]
+            for order, celebration in enumerate(celebrations):
+                rows.append(
+                    event_row(
+                        day,
+                        english_name=celebration.name,
+                        english_rank=celebration.rank,
+                        color=celebration.color,
+                        season=season,
+                        order=order,
+                        is_primary_for_day=order == 0,
+                        temporale_or_sanctorale=celebration.cycle,
+                        is_person=celebration.is_person,
+                    )
+                )
+    return rows
+
+
+def _normalise(name: Optional[str]) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", (name or "").lower()).strip()
+
+
+def names_match(a: Optional[str], b: Optional[str], threshold: float = 0.6) -> bool:
+    a, b = _normalise(a), _normalise(b)
+    if not a or not b:
+        return False
+    return a in b or b in a or difflib.SequenceMatcher(None, a, b).ratio() >= threshold
+
+
+def compare_with_scraped(year: int, calendar: str = "catholic") -> Dict[str, object]:
+    """Compare the computed primary celebration of each day with the scraped ``calendar`` for ``year``."""
+    from saints.models import CalendarEvent
+
+    scraped: Dict[date, dict] = {}
+    for event in (
+        CalendarEvent.objects.filter(calendar=calendar, year=year)
+        .order_by("date", "order")
+        .values("date", "english_name", "english_rank", "color")
+    ):
+        scraped.setdefault(event["date"], event)
+
+    computed = {row["date"]: row for row in calendar_rows([year]) if row["order"] == 0}
+    result = {"year": year, "days": 0, "rank": 0, "color": 0, "name": 0, "mismatches": []}
+    for day, expected in sorted(scraped.items()):
+        actual = computed.get(day)
+        if actual is None:
+            continue
+        result["days"] += 1
+        rank_ok = (expected["english_rank"] or "").lower() == actual["english_rank"].lower()
+        color_ok = not expected["color"] or expected["color"] == actual["color"]
+        name_ok = names_match(expected["english_name"], actual["english_name"])
+        result["rank"] += rank_ok
+        result["color"] += color_ok
+        result["name"] += name_ok
+        if not (rank_ok and color_ok and name_ok):
+            result["mismatches"].append((day, expected, actual))
+    return result
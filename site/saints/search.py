@@ -0,0 +1,187 @@
+"""Full-text search over biographies and calendar events.
+
+``Biography.search_vector`` and ``CalendarEvent.search_vector`` are maintained
+``tsvector`` columns with GIN indexes.  Names are weighted A, short descriptions
+and Latin names B, the hagiography and feast description C, and the legend D.
+
+Vectors are refreshed per row once the saving transaction commits: signal
+handlers cover ordinary saves of biographies, their indexed sections and
+events, and bulk writes that bypass signals (the calendar importers) call
+``refresh_calendar_events`` themselves.  ``rebuild`` recomputes everything.
+
+Searching needs PostgreSQL; other databases fall back to a plain name match
+without ranking or snippets.
+"""
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db import connection, transaction
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+
+from saints.models import (
+    Biography,
+    CalendarEvent,
+    FeastDescriptionModel,
+    HagiographyModel,
+    LegendModel,
+    ShortDescriptionsModel,
+)
+
+SEARCH_CONFIG = "english"
+# Latin names are indexed without English stemming
+LATIN_CONFIG = "simple"
+# Divide rank by 1 + log(document length) so long hagiographies do not swamp name matches
+RANK_NORMALIZATION = 1
+
+# Sections whose text is part of a biography's search vector
+INDEXED_SECTIONS = [ShortDescriptionsModel, HagiographyModel, FeastDescriptionModel, LegendModel]
+
+
+def is_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def _section_text(model, field):
+    subquery = Subquery(model.objects.filter(biography=OuterRef("pk")).values(field)[:1])
+    return Coalesce(subquery, Value(""), output_field=TextField())
+
+
+def biography_vector():
+    return (
+        SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(
+            _section_text(ShortDescriptionsModel, "one_sentence_description"),
+            _section_text(ShortDescriptionsModel, "one_paragraph_description"),
+            weight="B",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector(
+            _section_text(HagiographyModel, "hagiography"),
+            _section_text(FeastDescriptionModel, "feast_description"),
+            weight="C",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector(
+            _section_text(LegendModel, "title"),
+            _section_text(LegendModel, "legend"),
+            weight="D",
+            config=SEARCH_CONFIG,
+        )
+    )
+
+
+def calendar_event_vector():
+    return (
+        SearchVector("english_name", "saint_name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("english_translation", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("latin_name", weight="B", config=LATIN_CONFIG)
+    )
+
+
+def refresh_biographies(queryset=None) -> int:
+    if not is_supported():
+        return 0
+    queryset = Biography.objects.all() if queryset is None else queryset
+    return queryset.update(search_vector=biography_vector())
+
+
+def refresh_calendar_events(queryset=None) -> int:
+    if not is_supported():
+        return 0
+    queryset = CalendarEvent.objects.all() if queryset is None else queryset
+    return queryset.update(search_vector=calendar_event_vector())
+
+
+def rebuild() -> dict:
+    """Recompute every search vector; calendar events are done a year at a time to keep transactions short."""
+    counts = {"biographies": refresh_biographies(), "calendar_events": 0}
+    for year in CalendarEvent.objects.order_by().values_list("year", flat=True).distinct():
+        counts["calendar_events"] += refresh_calendar_events(CalendarEvent.objects.filter(year=year))
+    return counts
+
+
+def _refresh_biography_on_commit(biography_id):
+    if biography_id and is_supported():
+        transaction.on_commit(lambda: refresh_biographies(Biography.objects.filter(pk=biography_id)))
+
+
+def biography_saved(sender, instance, **kwargs):
+    _refresh_biography_on_commit(instance.pk)
+
+
+def section_changed(sender, instance, **kwargs):
+    _refresh_biography_on_commit(instance.biography_id)
+
+
+def calendar_event_saved(sender, instance, **kwargs):
+    if is_supported():
+        transaction.on_commit(lambda: refresh_calendar_events(CalendarEvent.objects.filter(pk=instance.pk)))
+
+
+def connect_signals():
+    post_save.connect(biography_saved, sender=Biography, dispatch_uid="search_biography_saved")
+    post_save.connect(calendar_event_saved, sender=CalendarEvent, dispatch_uid="search_calendar_event_saved")
+    for model in INDEXED_SECTIONS:
+        post_save.connect(section_changed, sender=model, dispatch_uid=f"search_{model.__name__}_saved")
+        post_delete.connect(section_changed, sender=model, dispatch_uid=f"search_{model.__name__}_deleted")
+
+
+def parse_query(text: str):
+    """Web-search syntax ("quoted phrases", -exclusions, or), matched stemmed and unstemmed for Latin names."""
+    return SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG) | SearchQuery(
+        text, search_type="websearch", config=LATIN_CONFIG
+    )
+
+
+def search_biographies(text: str, religion=None):
+    """Biographies matching ``text``, best first, annotated with ``rank`` and a ``headline`` snippet."""
+    biographies = Biography.objects.all()
+    if religion:
+        biographies = biographies.filter(religion=religion)
+    if not is_supported():
+        return (
+            biographies.filter(name__icontains=text)
+            .annotate(rank=Value(0.0, output_field=FloatField()), headline=F("name"))
+            .order_by("name")
+        )
+
+    query = parse_query(text)
+    descriptions = ShortDescriptionsModel.objects.filter(biography=OuterRef("pk"))
+    summary = Coalesce(
+        Subquery(descriptions.values("one_paragraph_description")[:1]), F("name"), output_field=TextField()
+    )
+    return (
+        biographies.filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), query, normalization=Value(RANK_NORMALIZATION)),
+            headline=SearchHeadline(summary, query, config=SEARCH_CONFIG, min_words=15, max_words=35),
+        )
+        .order_by("-rank", "name")
+    )
+
+
+def search_calendar_events(text: str, calendar=None, year=None):
+    """Calendar events matching ``text``, best first, annotated with ``rank`` and a ``headline`` snippet."""
+    events = CalendarEvent.objects.all()
+    if calendar:
+        events = events.filter(calendar=calendar)
+    if year:
+        events = events.filter(year=year)
+    if not is_supported():
+        matches = Q(english_name__icontains=text) | Q(latin_name__icontains=text) | Q(saint_name__icontains=text)
+        return (
+            events.filter(matches)
+            .annotate(rank=Value(0.0, output_field=FloatField()), headline=F("english_name"))
+            .order_by("date", "order")
+        )
+
+    query = parse_query(text)
+    return (
+        events.filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), query, normalization=Value(RANK_NORMALIZATION)),
+            headline=SearchHeadline("english_name", query, config=SEARCH_CONFIG, highlight_all=True),
+        )
+        .order_by("-rank", "date", "order")
+    )
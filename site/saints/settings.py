@@ -58,6 +58,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "django_extensions",
     "rest_framework",
     "drf_spectacular",
@@ -182,3 +183,37 @@ CRON_CLASSES = [
 # GeoIP configuration (requires GeoLite2 database files deployed)
 GEOIP_PATH = os.getenv("GEOIP_PATH", os.path.join(BASE_DIR, "geoip"))
 
+
+# Requests per minute allowed per AI provider and model ("default" covers unlisted models)
+AI_RATE_LIMITS = {
+    "gemini": {"default": int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "60"))},
+    "openai": {"default": int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "60"))},
+}
+# Per-request timeout and attempts for the podcast generator's LLM calls (saints.ai_providers)
+AI_TIMEOUT_SECONDS = float(os.getenv("AI_TIMEOUT_SECONDS", "600"))
+AI_MAX_ATTEMPTS = int(os.getenv("AI_MAX_ATTEMPTS", "3"))
+# Biographies generated at once by collect_bios
+BIO_CONCURRENCY = int(os.getenv("BIO_CONCURRENCY", "8"))
+# Section prompts sent at once for one biography in generate_bio's parallel mode
+BIO_SECTION_CONCURRENCY = int(os.getenv("BIO_SECTION_CONCURRENCY", "4"))
+# ElevenLabs dialogue batches synthesized at once per episode (lowered automatically when rate limited)
+ELEVENLABS_CONCURRENCY = int(os.getenv("ELEVENLABS_CONCURRENCY", "4"))
+# Podcast research queries searched and summarized at once per episode
+RESEARCH_CONCURRENCY = int(os.getenv("RESEARCH_CONCURRENCY", "4"))
+# Days a research summary is reused; over a year so next year's episode for the same feast reuses it
+RESEARCH_CACHE_TTL_DAYS = int(os.getenv("RESEARCH_CACHE_TTL_DAYS", "400"))
+# Local cache of synthesized dialogue batches; an empty TTS_CACHE_DIR disables it
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "churchcals", "tts"))
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_MB", "2048")) * 1024 * 1024
+# Simulated service times of the offline stand-ins (saints.offline) used by benchmark_podcast
+OFFLINE_LLM_SECONDS = float(os.getenv("OFFLINE_LLM_SECONDS", "1.0"))
+OFFLINE_LLM_CHARS_PER_SECOND = float(os.getenv("OFFLINE_LLM_CHARS_PER_SECOND", "400"))
+OFFLINE_SEARCH_SECONDS = float(os.getenv("OFFLINE_SEARCH_SECONDS", "0.5"))
+OFFLINE_TTS_SECONDS = float(os.getenv("OFFLINE_TTS_SECONDS", "3.0"))
+# Speaking rate of the offline TTS (sets the length of its silent audio) and lines in offline scripts
+OFFLINE_SPEECH_CHARS_PER_SECOND = float(os.getenv("OFFLINE_SPEECH_CHARS_PER_SECOND", "15"))
+OFFLINE_SCRIPT_LINES = int(os.getenv("OFFLINE_SCRIPT_LINES", "40"))
+# Intro/outro music analysed and rendered once per file by saints.podcast_assets
+PODCAST_ASSET_CACHE_DIR = os.getenv(
+    "PODCAST_ASSET_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "churchcals", "podcast_assets")
+)
@@ -0,0 +1,294 @@
+"""Incremental upstream sync support shared by the calendar importers.
+
+Every importer pulls one upstream document per calendar and month (or per year,
+for sources that publish a whole year on one page).  The fingerprint of each
+document is stored in ``SyncState`` so that an incremental run can skip months
+whose content has not changed before any parsing, translation or LLM enrichment
+happens.  Months that did change are diffed against the stored ``CalendarEvent``
+rows and only the differences are written.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import requests
+from django.db import transaction
+from django.utils import timezone
+
+from saints import search
+from saints.models import CalendarEvent, SyncState
+from saints.names import normalize_fields
+
+# ``SyncState.month`` value used for documents that cover a whole year
+YEAR_DOCUMENT = 0
+
+REQUEST_TIMEOUT = 60
+
+
+def content_hash(content) -> str:
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def entries_hash(entries: Iterable[Dict[str, Any]]) -> str:
+    """Stable hash of parsed upstream entries, used to fingerprint one month of a yearly document."""
+    return content_hash(json.dumps(list(entries), sort_keys=True, default=str))
+
+
+def get_state(source: str, calendar: str, year: int, month: int) -> Optional[SyncState]:
+    return SyncState.objects.filter(source=source, calendar=calendar, year=year, month=month).first()
+
+
+def mark_checked(source: str, calendar: str, year: int, month: int, attempts: int = 1) -> None:
+    SyncState.objects.filter(source=source, calendar=calendar, year=year, month=month).update(
+        last_checked=timezone.now(), status=SyncState.STATUS_OK, attempts=attempts, error=""
+    )
+
+
+def is_unchanged(source: str, calendar: str, year: int, month: int, digest: str) -> bool:
+    state = get_state(source, calendar, year, month)
+    if state and state.content_hash == digest and state.status == SyncState.STATUS_OK:
+        mark_checked(source, calendar, year, month)
+        return True
+    return False
+
+
+def record_sync(
+    source: str,
+    calendar: str,
+    year: int,
+    month: int,
+    digest: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    event_count: int = 0,
+    attempts: int = 1,
+) -> SyncState:
+    now = timezone.now()
+    state = get_state(source, calendar, year, month) or SyncState(
+        source=source, calendar=calendar, year=year, month=month
+    )
+    if state.content_hash != digest:
+        state.last_changed = now
+    state.content_hash = digest
+    state.etag = etag
+    state.last_modified = last_modified
+    state.event_count = event_count
+    state.last_checked = now
+    state.status = SyncState.STATUS_OK
+    state.attempts = attempts
+    state.error = ""
+    state.save()
+    return state
+
+
+def record_failure(source: str, calendar: str, year: int, month: int, error: str, attempts: int = 1) -> SyncState:
+    """Mark a month as failed in the ledger, keeping the last good fingerprint so it can be retried alone."""
+    state = get_state(source, calendar, year, month) or SyncState(
+        source=source, calendar=calendar, year=year, month=month
+    )
+    state.last_checked = timezone.now()
+    state.status = SyncState.STATUS_FAILED
+    state.attempts = attempts
+    state.error = error
+    state.save()
+    return state
+
+
+def failed_months(source: str, calendar: str) -> List[Tuple[int, int]]:
+    return list(
+        SyncState.objects.filter(source=source, calendar=calendar, status=SyncState.STATUS_FAILED)
+        .order_by("year", "month")
+        .values_list("year", "month")
+    )
+
+
+@dataclass
+class UpstreamDocument:
+    source: str
+    calendar: str
+    year: int
+    month: int
+    response: Optional[requests.Response] = None
+    digest: str = ""
+    changed: bool = True
+
+    @property
+    def text(self) -> str:
+        return self.response.text
+
+    def json(self) -> Any:
+        return self.response.json()
+
+    def mark_synced(self, event_count: int = 0) -> SyncState:
+        """Store this document's fingerprint once its events have been written."""
+        headers = self.response.headers if self.response is not None else {}
+        return record_sync(
+            self.source,
+            self.calendar,
+            self.year,
+            self.month,
+            self.digest,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            event_count=event_count,
+        )
+
+
+def fetch_document(
+    source: str,
+    calendar: str,
+    year: int,
+    month: int,
+    url: str,
+    session: Optional[requests.Session] = None,
+    method: str = "GET",
+    data: Optional[Dict[str, Any]] = None,
+    force: bool = False,
+) -> UpstreamDocument:
+    """Fetch an upstream document, reporting ``changed=False`` when it matches the stored fingerprint.
+
+    Conditional request headers are sent when the upstream previously offered an
+    ETag or Last-Modified value; otherwise the body hash decides.  ``force`` ignores
+    the stored state so a full re-import still goes through the same code path.
+    """
+    state = None if force else get_state(source, calendar, year, month)
+    headers = {}
+    if state and state.etag:
+        headers["If-None-Match"] = state.etag
+    if state and state.last_modified:
+        headers["If-Modified-Since"] = state.last_modified
+
+    response = (session or requests).request(method, url, data=data, headers=headers, timeout=REQUEST_TIMEOUT)
+    document = UpstreamDocument(source=source, calendar=calendar, year=year, month=month, response=response)
+    if response.status_code == 304 and state and state.status == SyncState.STATUS_OK:
+        mark_checked(source, calendar, year, month)
+        document.digest = state.content_hash
+        document.changed = False
+        return document
+
+    response.raise_for_status()
+    document.digest = content_hash(response.content)
+    if state and state.content_hash == document.digest and state.status == SyncState.STATUS_OK:
+        mark_checked(source, calendar, year, month)
+        document.changed = False
+    return document
+
+
+def event_row(event_date, **fields) -> Dict[str, Any]:
+    """Build a ``CalendarEvent`` field dict with the denormalised year/month/day set from ``event_date``.
+
+    This is also where imported names are normalised, so every importer stores a
+    cleaned ``english_name`` and its ``name_key``.
+    """
+    return normalize_fields(
+        {
+            "date": event_date,
+            "year": event_date.year,
+            "month": event_date.month,
+            "day": event_date.day,
+            **fields,
+        }
+    )
+
+
+def sync_month_events(
+    calendar: str,
+    year: int,
+    month: int,
+    rows: Sequence[Dict[str, Any]],
+    key_fields: Tuple[str, ...] = ("english_name",),
+    subcalendar: Optional[str] = None,
+) -> Tuple[int, int, int]:
+    """Diff ``rows`` against the stored events for one calendar month and write only the differences.
+
+    Rows are matched to existing events on ``date`` plus ``key_fields`` so that
+    matched events keep their primary key and biography link.  Returns the number
+    of created, updated and deleted events.
+    """
+    existing = CalendarEvent.objects.filter(calendar=calendar, year=year, month=month)
+    if subcalendar is not None:
+        existing = existing.filter(subcalendar=subcalendar)
+
+    by_key: Dict[tuple, CalendarEvent] = {}
+    stale: List[int] = []
+    for event in existing.order_by("pk"):
+        key = (event.date,) + tuple(getattr(event, f) for f in key_fields)
+        if key in by_key:
+            # Earlier get_or_create imports could leave duplicates behind
+            stale.append(event.pk)
+        else:
+            by_key[key] = event
+
+    to_create: List[CalendarEvent] = []
+    to_update: List[CalendarEvent] = []
+    update_fields = set()
+    seen = set()
+    for row in rows:
+        row = dict(row, calendar=calendar)
+        if subcalendar is not None:
+            row["subcalendar"] = subcalendar
+        key = (row["date"],) + tuple(row.get(f) for f in key_fields)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        event = by_key.get(key)
+        if event is None:
+            to_create.append(CalendarEvent(**row))
+            continue
+        dirty = [name for name, value in row.items() if getattr(event, name) != value]
+        if dirty:
+            for name in dirty:
+                setattr(event, name, row[name])
+            update_fields.update(dirty)
+            to_update.append(event)
+
+    stale.extend(event.pk for key, event in by_key.items() if key not in seen)
+
+    with transaction.atomic():
+        if stale:
+            CalendarEvent.objects.filter(pk__in=stale).delete()
+        if to_create:
+            CalendarEvent.objects.bulk_create(to_create)
+        if to_update:
+            CalendarEvent.objects.bulk_update(to_update, sorted(update_fields))
+        # Bulk writes skip the save signals that keep search vectors current
+        search.refresh_calendar_events(CalendarEvent.objects.filter(pk__in=[e.pk for e in to_create + to_update]))
+    return len(to_create), len(to_update), len(stale)
+
+
+def sync_month(
+    source: str,
+    calendar: str,
+    year: int,
+    month: int,
+    entries: List[Dict[str, Any]],
+    build_rows: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    key_fields: Tuple[str, ...] = ("english_name",),
+    subcalendar: Optional[str] = None,
+    incremental: bool = True,
+) -> Optional[Tuple[int, int, int]]:
+    """Import one month of a yearly upstream document, skipping it when its entries are unchanged.
+
+    The hash is taken over the raw parsed entries, so unchanged months never reach
+    ``build_rows`` (where translation and enrichment happen).  Returns ``None`` for
+    skipped months, otherwise the created/updated/deleted counts.
+    """
+    digest = entries_hash(entries)
+    if incremental and is_unchanged(source, calendar, year, month, digest):
+        return None
+    rows = build_rows(entries)
+    counts = sync_month_events(calendar, year, month, rows, key_fields=key_fields, subcalendar=subcalendar)
+    record_sync(source, calendar, year, month, digest, event_count=len(rows))
+    return counts
+
+
+def group_by_month(entries: Iterable[Dict[str, Any]], month_of: Callable[[Dict[str, Any]], int]):
+    grouped: Dict[int, List[Dict[str, Any]]] = {}
+    for entry in entries:
+        grouped.setdefault(month_of(entry), []).append(entry)
+    return grouped
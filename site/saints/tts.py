@@ -0,0 +1,363 @@
+"""Concurrent ElevenLabs dialogue synthesis.
+
+An episode's dialogue is sent to ``text_to_dialogue.convert`` in batches of
+about 2500 characters.  ``synthesize_batches`` runs them on a thread pool and
+writes each batch's audio to its own numbered part file, so the parts are
+reassembled in script order however the requests finish.
+
+A failed batch is retried with exponential backoff on its own; only a batch
+that still fails after ``max_attempts`` fails the episode.  ElevenLabs limits
+concurrent requests per plan, so the number of requests in flight adapts: a
+rate-limit response halves it, and it grows back by one after a run of
+successful requests.
+
+Batches can also be submitted one at a time to a ``BatchPipeline`` while the
+script is still being written, which ``Batcher`` makes possible by cutting
+batches from dialogue as it arrives; either way the batches come out the same.
+
+Synthesized batches are kept in a local content-addressed cache keyed by the
+batch's voices and text, the model and the output format, so re-rendering an
+episode (after a failure further down the pipeline, or a small script edit)
+only pays for the batches that changed.
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from saints import settings
+from saints.audio_cache import AudioCache, digest
+
+MODEL_ID = "eleven_v3"
+OUTPUT_FORMAT = "mp3_44100_128"
+# Characters per dialogue input and per request (eleven_v3 allows 3000 per request)
+MAX_CHUNK_CHARS = 900
+MAX_BATCH_CHARS = 2500
+# Successful requests in a row before one more concurrent request is allowed
+GROW_AFTER = 3
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """True for ElevenLabs 429s (too many concurrent requests, quota) and its "system busy" responses."""
+    if getattr(error, "status_code", None) == 429:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in ("429", "too_many_concurrent_requests", "rate limit", "system_busy"))
+
+
+class AdaptiveLimiter:
+    """A concurrency limit that halves on rate-limit errors and creeps back up after successes."""
+
+    def __init__(self, limit: int, grow_after: int = GROW_AFTER):
+        self.max_limit = max(1, limit)
+        self.limit = self.max_limit
+        self.grow_after = grow_after
+        self.active = 0
+        self.successes = 0
+        self.condition = threading.Condition()
+
+    def acquire(self) -> float:
+        """Wait for a free slot; returns the seconds spent waiting."""
+        started = time.monotonic()
+        with self.condition:
+            while self.active >= self.limit:
+                self.condition.wait()
+            self.active += 1
+        return time.monotonic() - started
+
+    def release(self, ok: bool, rate_limited: bool = False) -> None:
+        with self.condition:
+            self.active -= 1
+            if rate_limited:
+                self.limit = max(1, self.limit // 2)
+                self.successes = 0
+            elif ok:
+                self.successes += 1
+                if self.successes >= self.grow_after and self.limit < self.max_limit:
+                    self.limit += 1
+                    self.successes = 0
+            self.condition.notify_all()
+
+
+@dataclass
+class BatchTiming:
+    index: int
+    chars: int
+    attempts: int = 0
+    seconds: float = 0.0
+    queued: float = 0.0
+    bytes: int = 0
+    cached: bool = False
+
+
+def chunk_text(text: str, max_chunk_len: int = MAX_CHUNK_CHARS) -> List[str]:
+    """Chunk text while respecting ElevenLabs v3 bracketed tags.
+    - Never split inside square-bracket tags like [warmly] or [church bells].
+    - Prefer to split on whitespace when not inside a tag.
+    - If a tag would cross the boundary, extend the chunk until the tag closes.
+    """
+    if len(text) <= max_chunk_len:
+        return [text]
+    chunks: List[str] = []
+    i = 0
+    n = len(text)
+    min_soft_len = int(max_chunk_len * 0.6)
+    while i < n:
+        start = i
+        bracket_depth = 0
+        last_ws_outside = -1
+        j = i
+        # First pass: advance up to max_chunk_len, track bracket depth and last whitespace outside tags
+        while j < n and (j - start) < max_chunk_len:
+            ch = text[j]
+            if ch == "[":
+                bracket_depth += 1
+            elif ch == "]":
+                if bracket_depth > 0:
+                    bracket_depth -= 1
+            if ch.isspace() and bracket_depth == 0:
+                last_ws_outside = j
+            j += 1
+
+        cut: int
+        if j >= n:
+            cut = n
+        else:
+            if bracket_depth > 0:
+                # We are inside a tag at the boundary; keep going until tag closes
+                while j < n and bracket_depth > 0:
+                    ch = text[j]
+                    if ch == "[":
+                        bracket_depth += 1
+                    elif ch == "]":
+                        bracket_depth -= 1
+                    j += 1
+                # Optionally, extend to next whitespace for natural pause
+                while j < n and not text[j].isspace():
+                    j += 1
+                cut = j
+            else:
+                # Prefer to cut at the last whitespace outside tags if far enough into the window
+                if last_ws_outside != -1 and (last_ws_outside - start) >= min_soft_len:
+                    cut = last_ws_outside
+                else:
+                    cut = j
+
+        piece = text[start:cut].strip()
+        if piece:
+            chunks.append(piece)
+        i = cut
+        # Skip any subsequent whitespace so the next piece starts on content
+        while i < n and text[i].isspace():
+            i += 1
+    return chunks
+
+
+class Batcher:
+    """Groups dialogue inputs, in order, into requests of at most ``max_chars`` characters of text."""
+
+    def __init__(self, max_chars: int = MAX_BATCH_CHARS):
+        self.max_chars = max_chars
+        self.current: List = []
+        self.current_len = 0
+
+    def add(self, inputs: Sequence) -> List[List]:
+        """Add inputs; returns the batches this completed."""
+        completed = []
+        for item in inputs:
+            if self.current and self.current_len + len(item.text) > self.max_chars:
+                completed.append(self.current)
+                self.current = []
+                self.current_len = 0
+            self.current.append(item)
+            self.current_len += len(item.text)
+        return completed
+
+    def flush(self) -> List[List]:
+        """The last, partly filled batch, if any."""
+        completed = [self.current] if self.current else []
+        self.current = []
+        self.current_len = 0
+        return completed
+
+
+def default_cache() -> Optional[AudioCache]:
+    """The cache configured by ``TTS_CACHE_DIR`` and ``TTS_CACHE_MAX_BYTES``, or None if disabled."""
+    if not settings.TTS_CACHE_DIR:
+        return None
+    return AudioCache(settings.TTS_CACHE_DIR, settings.TTS_CACHE_MAX_BYTES)
+
+
+def batch_key(batch: Sequence, model_id: str = MODEL_ID, output_format: str = OUTPUT_FORMAT) -> str:
+    return digest([[item.voice_id, item.text] for item in batch], model_id, output_format)
+
+
+def write_audio(response, path: str) -> int:
+    """Write a convert() response (bytes or an iterator of chunks) to ``path``; returns the bytes written."""
+    written = 0
+    with open(path, "wb") as f:
+        if isinstance(response, (bytes, bytearray)):
+            f.write(response)
+            return len(response)
+        for chunk in response:
+            if chunk:
+                f.write(chunk)
+                written += len(chunk)
+    return written
+
+
+def synthesize_batch(
+    client,
+    batch: Sequence,
+    index: int,
+    path: str,
+    limiter: AdaptiveLimiter,
+    max_attempts: int,
+    backoff: float,
+    cache: Optional[AudioCache] = None,
+) -> BatchTiming:
+    """Synthesize one batch to ``path``; ``seconds`` is time spent in requests, ``queued`` waiting for a slot or
+    backing off."""
+    timing = BatchTiming(index=index, chars=sum(len(item.text) for item in batch))
+    key = batch_key(batch)
+    if cache and cache.fetch(key, path):
+        timing.cached = True
+        timing.bytes = os.path.getsize(path)
+        return timing
+
+    started = time.monotonic()
+    for attempt in range(1, max_attempts + 1):
+        timing.attempts = attempt
+        timing.queued += limiter.acquire()
+        try:
+            response = client.text_to_dialogue.convert(inputs=batch, model_id=MODEL_ID, output_format=OUTPUT_FORMAT)
+            # The response may stream, so the request holds its slot until the audio is written
+            timing.bytes = write_audio(response, path)
+        except Exception as e:
+            rate_limited = is_rate_limited(e)
+            limiter.release(ok=False, rate_limited=rate_limited)
+            if attempt == max_attempts:
+                raise RuntimeError(
+                    f"Failed to generate dialogue audio for batch {index} after {attempt} attempts: {e}"
+                )
+            delay = backoff * 2 ** (attempt - 1) * (1 + random.random())
+            kind = "Rate limited" if rate_limited else "Error"
+            print(
+                f"[GEN] {kind} on batch {index} (attempt {attempt}/{max_attempts}, "
+                f"concurrency now {limiter.limit}): {e}; retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+            timing.queued += delay
+            continue
+        limiter.release(ok=True)
+        break
+    timing.seconds = time.monotonic() - started - timing.queued
+    if cache:
+        cache.put(key, path)
+    return timing
+
+
+class BatchPipeline:
+    """Synthesizes batches in the background as they are submitted; ``finish`` returns them in submission order.
+
+    Used as a context manager so the worker threads are always shut down; leaving the block on an error
+    cancels the batches not yet started.
+    """
+
+    def __init__(
+        self,
+        client,
+        out_dir: str,
+        concurrency: Optional[int] = None,
+        max_attempts: int = 5,
+        backoff: float = 2.0,
+        cache: Optional[AudioCache] = None,
+    ):
+        self.client = client
+        self.out_dir = out_dir
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.cache = cache
+        self.limiter = AdaptiveLimiter(concurrency or settings.ELEVENLABS_CONCURRENCY)
+        self.executor = ThreadPoolExecutor(max_workers=self.limiter.max_limit)
+        self.paths: List[str] = []
+        self.futures: List[Future] = []
+
+    def __enter__(self) -> "BatchPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def submit(self, batch: Sequence) -> None:
+        index = len(self.futures)
+        path = os.path.join(self.out_dir, f"dialogue_part_{index}.mp3")
+        self.paths.append(path)
+        self.futures.append(
+            self.executor.submit(
+                synthesize_batch,
+                self.client,
+                batch,
+                index,
+                path,
+                self.limiter,
+                self.max_attempts,
+                self.backoff,
+                self.cache,
+            )
+        )
+
+    def finish(self) -> Tuple[List[str], List[BatchTiming]]:
+        """Wait for every batch; returns the part files and timings in batch order.
+
+        Raises ``RuntimeError`` if any batch fails ``max_attempts`` times; batches not yet started are then skipped.
+        """
+        try:
+            timings = [future.result() for future in self.futures]
+        except Exception:
+            for future in self.futures:
+                future.cancel()
+            raise
+        return self.paths, timings
+
+
+def synthesize_batches(
+    client,
+    batches: Sequence[Sequence],
+    out_dir: str,
+    concurrency: Optional[int] = None,
+    max_attempts: int = 5,
+    backoff: float = 2.0,
+    cache: Optional[AudioCache] = None,
+) -> Tuple[List[str], List[BatchTiming]]:
+    """Synthesize every batch, ``concurrency`` at a time; returns the part files in batch order and their timings.
+
+    Batches found in ``cache`` are copied from it instead of synthesized, and new audio is added to it.
+    Raises ``RuntimeError`` if any batch fails ``max_attempts`` times; batches not yet started are then skipped.
+    """
+    concurrency = min(concurrency or settings.ELEVENLABS_CONCURRENCY, len(batches))
+    with BatchPipeline(client, out_dir, concurrency, max_attempts, backoff, cache) as pipeline:
+        for batch in batches:
+            pipeline.submit(batch)
+        return pipeline.finish()
+
+
+def print_batch_timings(timings: List[BatchTiming], elapsed: float) -> None:
+    for timing in timings:
+        if timing.cached:
+            print(f"[GEN]   batch {timing.index:>3}: {timing.chars:>5} chars, {timing.bytes / 1024:7.0f} KiB, cached")
+            continue
+        print(
+            f"[GEN]   batch {timing.index:>3}: {timing.chars:>5} chars, {timing.bytes / 1024:7.0f} KiB, "
+            f"{timing.seconds:5.1f}s ({timing.attempts} attempts, {timing.queued:.1f}s queued)"
+        )
+    api_seconds = sum(timing.seconds for timing in timings)
+    cached = sum(timing.cached for timing in timings)
+    print(
+        f"[GEN] Synthesized {len(timings) - cached} batches ({cached} from cache) in {elapsed:.1f}s "
+        f"({api_seconds:.1f}s of API time, {api_seconds / elapsed if elapsed else 0:.1f}x parallel)"
+    )
@@ -5,13 +5,25 @@ from datetime import date, datetime
 import requests
 from bs4 import BeautifulSoup
 from saints.current import enhance
-from saints.models import CalendarEvent
+from saints.jobs import register_job, run_job
+from saints.sync import YEAR_DOCUMENT, event_row, fetch_document, group_by_month, sync_month
+
+SOURCE = "universalis"
+CALENDARS = [
+    ("ordinariate", "https://universalis.com/usa.ordinariate.thursday/calendar.htm?year="),
+    ("catholic", "https://universalis.com/usa.thursday/calendar.htm?year="),
+]
+YEARS = range(2020, 2036)
 
 
 def fetch_ordinariate_calendar(calendar, year):
     url = calendar[1] + str(year)
     response = requests.get(url)
-    soup = BeautifulSoup(response.content, "html.parser")
+    return parse_universalis_calendar(response.content, year)
+
+
+def parse_universalis_calendar(content, year):
+    soup = BeautifulSoup(content, "html.parser")
 
     data = []
 
@@ -157,41 +169,74 @@ def fetch_ordinariate_calendar(calendar, year):
     return data
 
 
-def run():
-    calendars = [
-        ("ordinariate", "https://universalis.com/usa.ordinariate.thursday/calendar.htm?year="),
-        ("catholic", "https://universalis.com/usa.thursday/calendar.htm?year="),
-    ]
-    for calendar in calendars:
-        for year in range(2020, 2036):
-            print(f"Fetching calendar for {calendar[0]} {year}")
-            result = fetch_ordinariate_calendar(calendar, year)
-            for entry in result:
-                print(entry)
-                year, month, day = entry["date"].split("-")
-                print(year, month, day)
-                event = CalendarEvent.objects.get_or_create(
-                    year=int(year),
-                    month=int(month),
-                    day=int(day),
-                    date=date(int(year), int(month), int(day)),
-                    english_name=entry["name"],
-                    calendar=calendar[0],
-                )[0]
-
-                event.english_rank = entry["rank"]
-                event.color = entry["color"]
-                event.season = entry["season"]
-                event.order = entry["order"]
-
-                enhancement = enhance(entry["name"])
-
-                event.is_person = enhancement["is_person"]
-                event.saint_name = enhancement["saint_name"]
-                event.saint_category = enhancement["saint_category"]
-                event.saint_categories = json.dumps(enhancement["saint_categories"])
-                event.saint_singular_or_plural = enhancement["saint_singular_or_plural"]
-
-                event.save()
-                print(event.pk, event)
-                print(f"Enhancement: {enhancement}")
+def build_event_rows(entries):
+    rows = []
+    for entry in entries:
+        enhancement = enhance(entry["name"])
+        rows.append(
+            event_row(
+                date.fromisoformat(entry["date"]),
+                english_name=entry["name"],
+                english_rank=entry["rank"],
+                color=entry["color"],
+                season=entry["season"],
+                order=entry["order"],
+                is_person=enhancement["is_person"],
+                saint_name=enhancement["saint_name"],
+                saint_category=enhancement["saint_category"],
+                saint_categories=json.dumps(enhancement["saint_categories"]),
+                saint_singular_or_plural=enhancement["saint_singular_or_plural"],
+            )
+        )
+    return rows
+
+
+def sync_year(name, base_url, year, incremental=True):
+    """Import one year of a Universalis calendar, re-importing only the months whose entries changed."""
+    url = base_url + str(year)
+    document = fetch_document(SOURCE, name, year, YEAR_DOCUMENT, url, force=not incremental)
+    if not document.changed:
+        print(f"Unchanged: {name} {year}")
+        return None
+
+    print(f"Fetching calendar for {name} {year}")
+    entries = parse_universalis_calendar(document.response.content, year)
+    months = group_by_month(entries, lambda entry: date.fromisoformat(entry["date"]).month)
+    totals = {"created": 0, "updated": 0, "deleted": 0}
+    for month, month_entries in sorted(months.items()):
+        counts = sync_month(SOURCE, name, year, month, month_entries, build_event_rows, incremental=incremental)
+        if counts is None:
+            print(f"Unchanged: {name} {year}-{month:02d}")
+            continue
+        print(f"Synced {name} {year}-{month:02d}: {counts[0]} created, {counts[1]} updated, {counts[2]} deleted")
+        for total, count in zip(totals, counts):
+            totals[total] += count
+    document.mark_synced(len(entries))
+    return totals
+
+
+def sync_calendar(calendar, years=YEARS, incremental=True):
+    name, base_url = calendar
+    for year in years:
+        try:
+            sync_year(name, base_url, year, incremental=incremental)
+        except requests.RequestException as e:
+            print(f"Failed to fetch calendar for {name} {year}: {e}")
+
+
+def plan_job(params):
+    calendars = dict(CALENDARS)
+    for name in params.get("calendars", list(calendars)):
+        for year in params.get("years", list(YEARS)):
+            yield f"{name}:{year}", {"calendar": name, "url": calendars[name], "year": year}
+
+
+def handle_unit(payload, params):
+    return sync_year(payload["calendar"], payload["url"], payload["year"], incremental=params.get("incremental", True))
+
+
+register_job("universalis", plan_job, handle_unit, "Universalis calendars, one unit per calendar year")
+
+
+def run(incremental=False):
+    return run_job("universalis", {"incremental": incremental})
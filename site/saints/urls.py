@@ -22,7 +22,7 @@ from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from rest_framework.response import Response
 from rest_framework.routers import DefaultRouter
 from rest_framework.views import APIView
-from saints.api import BiographyViewSet, CalendarListView, DayView, LiturgicalYearView
+from saints.api import BiographyViewSet, CalendarListView, DayView, LiturgicalYearView, SearchView
 from saints.views import (
     calendar_view,
     comparison_view,
@@ -51,6 +51,7 @@ class APIRootView(APIView):
                 "liturgical-year": base + "liturgical-year/{year}/{calendar}/",
                 "day": base + "day/{date}/",
                 "calendars": base + "calendars/",
+                "search": base + "search/?q={query}&type={biographies|events}",
                 "schema": request.build_absolute_uri(reverse("openapi-schema")),
                 "docs": request.build_absolute_uri(reverse("swagger-ui")),
             }
@@ -75,6 +76,7 @@ urlpatterns = [
     path("api/liturgical-year/<int:year>/<str:calendar>/", LiturgicalYearView.as_view(), name="liturgical-year"),
     path("api/day/<str:date>/", DayView.as_view(), name="day-api"),
     path("api/calendars/", CalendarListView.as_view(), name="calendar-list"),
+    path("api/search/", SearchView.as_view(), name="search"),
     # OpenAPI schema and docs
     path("openapi.yaml", SpectacularAPIView.as_view(), name="openapi-schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="openapi-schema"), name="swagger-ui"),
@@ -9,11 +9,13 @@ import hashlib
 from typing import Iterator, Optional, Tuple
 
 from django.conf import settings
+from django.db.models import Q
 from django.http import Http404, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils import timezone
 from feedgen.feed import FeedGenerator
+from saints import liturgical_index
 from saints.models import CalendarEvent, Podcast, PodcastEpisode, PodcastListenLog
 from django.core.files.storage import default_storage
 from django.contrib.admin.views.decorators import staff_member_required
@@ -22,11 +24,7 @@ from django.utils.dateparse import parse_date
 
 def first_sunday_of_advent(year):
     """Return the date of the First Sunday of Advent for the given year."""
-    christmas = datetime.date(year, 12, 25)
-    weekday = christmas.weekday()  # Monday=0 ... Sunday=6
-    days_to_sunday = (weekday + 1) % 7
-    fourth_sunday_before = christmas - datetime.timedelta(days=days_to_sunday + 21)
-    return fourth_sunday_before
+    return liturgical_index.first_sunday_of_advent(year)
 
 
 def has_advent_started(today=None):
@@ -36,8 +34,7 @@ def has_advent_started(today=None):
     """
     if today is None:
         today = datetime.date.today()
-    advent_start = first_sunday_of_advent(today.year)
-    return today >= advent_start
+    return today >= first_sunday_of_advent(today.year)
 
 
 def home_view(request):
@@ -79,10 +76,7 @@ def comparison_view(request, year=None):
         try:
             target_date = datetime.datetime.strptime(target_day, "%Y-%m-%d").date()
             # Determine the liturgical year for the target date
-            if has_advent_started(target_date):
-                target_liturgical_year = target_date.year
-            else:
-                target_liturgical_year = target_date.year - 1
+            target_liturgical_year = liturgical_index.liturgical_year_start(target_date)
 
             # If the target liturgical year is different from the requested year, redirect
             if year is None or int(year.split("-")[0]) != target_liturgical_year:
@@ -94,13 +88,10 @@ def comparison_view(request, year=None):
             target_day = None
 
     if year is None:
-        year = date.today().year
-        if not has_advent_started():
-            year -= 1
+        year = liturgical_index.liturgical_year_start(date.today())
     else:
         year = int(year.split("-")[0])
-    advent_1 = first_sunday_of_advent(year)
-    advent_2 = first_sunday_of_advent(year + 1) - timedelta(days=1)
+    advent_1, advent_2 = liturgical_index.liturgical_year_bounds(year)
 
     # Fetch and group all calendar events by (month, day)
     base_filter = {"date__range": [advent_1, advent_2]}
@@ -140,10 +131,7 @@ def comparison_view(request, year=None):
     today = date.today()
 
     # Calculate current liturgical year
-    if has_advent_started(today):
-        current_liturgical_year = today.year
-    else:
-        current_liturgical_year = today.year - 1
+    current_liturgical_year = liturgical_index.liturgical_year_start(today)
 
     return render(
         request,
@@ -234,10 +222,13 @@ def daily_view(request, date):
 
     # Calculate current liturgical year
     today = timezone.now().date()
-    if has_advent_started(today):
-        current_liturgical_year = today.year
-    else:
-        current_liturgical_year = today.year - 1
+    current_liturgical_year = liturgical_index.liturgical_year_start(today)
+
+    # Season, week and lectionary cycles; the index only covers FIRST_YEAR-LAST_YEAR
+    try:
+        liturgical_day = liturgical_index.lookup(target_date)
+    except ValueError:
+        liturgical_day = None
 
     context = {
         "date": target_date,
@@ -249,6 +240,7 @@ def daily_view(request, date):
         "prev_date": prev_date,
         "next_date": next_date,
         "current_liturgical_year": current_liturgical_year,
+        "liturgical_day": liturgical_day,
     }
 
     return render(request, "saints/daily.html", context)
@@ -333,10 +325,7 @@ def calendar_view(request, year=None, month=None):
     today = timezone.now().date()
 
     # Calculate current liturgical year
-    if has_advent_started(today):
-        current_liturgical_year = today.year
-    else:
-        current_liturgical_year = today.year - 1
+    current_liturgical_year = liturgical_index.liturgical_year_start(today)
 
     context = {
         "year": year,
@@ -389,7 +378,9 @@ def podcast_feed(request, slug):
         fg.podcast.itunes_image(request.build_absolute_uri(podcast.image.url))
     fg.podcast.itunes_explicit("no")
 
-    for episode in podcast.episodes.order_by("-date"):
+    # Episodes generated ahead of time stay out of the feed until their publish time
+    published = Q(published_date__isnull=True) | Q(published_date__lte=timezone.now())
+    for episode in podcast.episodes.filter(published).order_by("-date"):
         fe = fg.add_entry()
         fe.id(xml_safe(episode.slug))
         fe.title(xml_safe(episode.episode_title))
@@ -401,11 +392,14 @@ def podcast_feed(request, slug):
         fe.link(href=episode_url)
         fe.guid(xml_safe(episode.slug), permalink=False)
         # Best-effort file length determination for enclosure length
-        try:
-            rel_path = os.path.join("podcasts", episode.file_name)
-            size = default_storage.size(rel_path)  # type: ignore[arg-type]
-        except Exception:
-            size = 0
+        # Recorded when the episode was generated; older episodes are sized from storage
+        size = episode.file_size
+        if size is None:
+            try:
+                rel_path = os.path.join("podcasts", episode.file_name)
+                size = default_storage.size(rel_path)  # type: ignore[arg-type]
+            except Exception:
+                size = 0
         fe.enclosure(episode_url, size, "audio/mpeg")
         # iTunes episode fields
         fe.podcast.itunes_title(xml_safe(episode.episode_title))